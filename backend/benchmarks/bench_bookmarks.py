@@ -0,0 +1,127 @@
+"""Bookmark listing load test: round trips and latency per strategy.
+
+Seeds a scratch database with clubs and bookmarks, then fires concurrent
+listing requests using three strategies and counts the Mongo commands each
+one issues with a pymongo command listener:
+
+* legacy:  bookmarks.find, then clubs.find({"id": {"$in": ...}})
+* lookup:  one aggregation joining bookmarks to clubs with $lookup
+* catalog: one bookmarks.find, clubs resolved from an in-memory dict
+           (what GET /api/bookmarks does now)
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_bookmarks.py --users 200 --bookmarks 150
+    STORAGE_BACKEND=memory python benchmarks/bench_bookmarks.py
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pymongo import monitoring
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from storage import create_client, is_memory_backend  # noqa: E402
+
+BENCH_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        if event.command_name in ("find", "aggregate", "getMore"):
+            self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+async def legacy(db, catalog, user_id):
+    bookmarks = await db.bookmarks.find({"user_id": user_id}, {"_id": 0}).to_list(None)
+    club_ids = [b["club_id"] for b in bookmarks]
+    return await db.clubs.find({"id": {"$in": club_ids}}, {"_id": 0}).to_list(None)
+
+
+async def lookup(db, catalog, user_id):
+    pipeline = [
+        {"$match": {"user_id": user_id}},
+        {"$sort": {"created_at": 1, "id": 1}},
+        {"$lookup": {"from": "clubs", "localField": "club_id", "foreignField": "id", "as": "club"}},
+        {"$unwind": "$club"},
+        {"$replaceRoot": {"newRoot": "$club"}},
+        {"$project": {"_id": 0}},
+    ]
+    return await db.bookmarks.aggregate(pipeline).to_list(None)
+
+
+async def from_catalog(db, catalog, user_id):
+    bookmarks = await db.bookmarks.find({"user_id": user_id}, {"_id": 0, "club_id": 1}).sort(
+        [("created_at", 1), ("id", 1)]
+    ).to_list(None)
+    return [catalog[b["club_id"]] for b in bookmarks if b["club_id"] in catalog]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clubs", type=int, default=500)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--bookmarks", type=int, default=150, help="bookmarks per user")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    counter = CommandCounter()
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    client = create_client(event_listeners=[counter])
+    db = client["bench_bookmarks"]
+    rng = random.Random(args.seed)
+    try:
+        clubs = [{"id": str(uuid.uuid4()), "name": f"Club {i}", "domain": "Technical"} for i in range(args.clubs)]
+        users = [str(uuid.uuid4()) for _ in range(args.users)]
+        await db.clubs.insert_many([dict(c) for c in clubs])
+        await db.bookmarks.insert_many([
+            {"id": str(uuid.uuid4()), "user_id": user_id, "club_id": club["id"], "created_at": BENCH_EPOCH + timedelta(milliseconds=i)}
+            for user_id in users for i, club in enumerate(rng.sample(clubs, min(args.bookmarks, args.clubs)))
+        ])
+        await db.clubs.create_index("id", unique=True)
+        await db.bookmarks.create_index([("user_id", 1), ("created_at", 1), ("id", 1)])
+        catalog = {club["id"]: club for club in clubs}
+
+        for name, strategy in (("legacy", legacy), ("lookup", lookup), ("catalog", from_catalog)):
+            semaphore = asyncio.Semaphore(args.concurrency)
+            latencies = []
+
+            async def one(user_id):
+                async with semaphore:
+                    start = time.perf_counter()
+                    await strategy(db, catalog, user_id)
+                    latencies.append(time.perf_counter() - start)
+
+            counter.count = 0
+            start = time.perf_counter()
+            await asyncio.gather(*(one(u) for u in users))
+            elapsed = time.perf_counter() - start
+            latencies.sort()
+            # The in-memory backend has no wire protocol, so there is nothing to count
+            round_trips = "  n/a" if is_memory_backend() else f"{counter.count / len(users):5.2f}"
+            print(f"{name:<8} {round_trips} round trips/request  "
+                  f"p50 {statistics.median(latencies) * 1000:7.2f}ms  p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:7.2f}ms  "
+                  f"{len(users) / elapsed:8.1f} req/s")
+    finally:
+        await client.drop_database("bench_bookmarks")
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+"""Club search benchmark: index build, incremental update and query latency.
+
+Indexes a synthetic catalog (the generator from seed_data.py) and reports
+p50/p99 latency for a mix of text, prefix and faceted queries, compared with
+the linear scan the Clubs page used to do client-side.
+
+    python benchmarks/bench_club_search.py --clubs 10000 --queries 2000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from club_search import ClubSearchIndex  # noqa: E402
+from seed_data import SyntheticDataset  # noqa: E402
+
+QUERIES = ["", "coding", "robot", "dance music", "debate", "photo", "hackathons tech", "leadership", "crick", "design ui"]
+DOMAINS = [None, None, "Technical", "Cultural", "Sports"]
+STATUSES = [None, None, "Open"]
+
+
+def linear_scan(clubs, query, domain):
+    query = query.lower()
+    return [
+        club for club in clubs
+        if (not domain or club["domain"] == domain)
+        and (not query or query in club["name"].lower() or query in club["description"].lower())
+    ]
+
+
+def percentile(ordered, q):
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clubs", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    clubs = [club for batch in SyntheticDataset(args.seed, args.clubs, 0, 0, 0, 0, 0).clubs(args.clubs) for club in batch]
+    index = ClubSearchIndex()
+    start = time.perf_counter()
+    index.update(clubs)
+    print(f"build      {len(clubs)} clubs, {index.stats()['terms']} terms in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    # A counter refresh changes no searchable field; one edited club is re-indexed
+    refreshed = [dict(club, bookmark_count=club["bookmark_count"] + 1) for club in clubs]
+    refreshed[0] = dict(refreshed[0], description=refreshed[0]["description"] + " Now with a maker space.")
+    start = time.perf_counter()
+    diff = index.update(refreshed)
+    print(f"update     {diff} in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    rng = random.Random(args.seed)
+    workload = [(rng.choice(QUERIES), rng.choice(DOMAINS), rng.choice(STATUSES)) for _ in range(args.queries)]
+    for query, domain, status in workload[:20]:
+        index.search(query, {"domain": domain, "recruitment_status": status})
+
+    for label, run in (
+        ("index", lambda q, d, s: index.search(q, {"domain": d, "recruitment_status": s}, limit=20)),
+        ("scan", lambda q, d, s: linear_scan(clubs, q, d)),
+    ):
+        latencies = []
+        for query, domain, status in workload:
+            start = time.perf_counter()
+            run(query, domain, status)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"{label:<10} p50 {statistics.median(latencies) * 1e6:8.1f}us  p99 {percentile(latencies, 0.99) * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""CPU per request: default FastAPI serialization vs FastJSONResponse.
+
+Mounts the same club list and question page on two routes: one returns
+dicts through ``response_model`` (validation + ``jsonable_encoder`` +
+stdlib json), the other returns a ``FastJSONResponse`` directly. Requests
+go through the full ASGI stack in-process, and process CPU time per
+request is reported.
+
+    python benchmarks/bench_json_responses.py --requests 2000
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fast_json import USE_ORJSON, FastJSONResponse  # noqa: E402
+
+
+class ClubResponse(BaseModel):
+    id: str
+    name: str
+    description: str
+    domain: str
+    skills: List[str]
+    time_commitment: str
+    recruitment_status: str
+    contact: str
+    image_url: str
+    tags: List[str]
+    member_count: int
+
+
+class QuestionResponse(BaseModel):
+    id: str
+    title: str
+    description: str
+    user_id: str
+    user_name: str
+    user_role: str
+    is_anonymous: bool
+    replies: List[Dict[str, Any]]
+    reply_count: int
+    created_at: str
+
+
+CLUBS = [
+    {"id": str(uuid.uuid4()), "name": f"Club {i}", "description": "A club for curious people. " * 6, "domain": "Technical",
+     "skills": ["Programming", "Design", "Teamwork"], "time_commitment": "5-8 hours/week", "recruitment_status": "Open",
+     "contact": f"club{i}@college.edu", "image_url": "https://example.com/club.jpg", "tags": ["Coding", "Tech"], "member_count": i}
+    for i in range(200)
+]
+QUESTIONS = [
+    {"id": str(uuid.uuid4()), "title": f"Question {i}", "description": "How do I join? " * 15, "user_id": "u", "user_name": "Name",
+     "user_role": "fresher", "is_anonymous": False, "replies": [], "reply_count": 3, "created_at": "2026-01-01T00:00:00+00:00"}
+    for i in range(20)
+]
+
+app = FastAPI()
+
+
+@app.get("/default/clubs", response_model=List[ClubResponse])
+async def default_clubs():
+    return CLUBS
+
+
+@app.get("/fast/clubs", response_model=List[ClubResponse], response_class=FastJSONResponse)
+async def fast_clubs():
+    return FastJSONResponse(CLUBS)
+
+
+@app.get("/default/questions", response_model=List[QuestionResponse])
+async def default_questions():
+    return QUESTIONS
+
+
+@app.get("/fast/questions", response_model=List[QuestionResponse], response_class=FastJSONResponse)
+async def fast_questions():
+    return FastJSONResponse(QUESTIONS)
+
+
+async def measure(client, path, requests):
+    await client.get(path)
+    start = time.process_time()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return (time.process_time() - start) / requests * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"encoder: {'orjson' if USE_ORJSON else 'stdlib json'}")
+        for name in ("clubs", "questions"):
+            default = await measure(client, f"/default/{name}", args.requests)
+            fast = await measure(client, f"/fast/{name}", args.requests)
+            print(f"{name:<10} default {default:8.1f} us CPU/request   fast {fast:8.1f} us CPU/request   ({default / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
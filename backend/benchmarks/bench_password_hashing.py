@@ -0,0 +1,79 @@
+"""Login burst benchmark: inline bcrypt vs the bounded password pool.
+
+Simulates a burst of concurrent logins while a cheap "GET /api/clubs"-style
+coroutine keeps running on the same event loop, and reports login p99 and the
+latency of the cheap requests in both modes.
+
+    python benchmarks/bench_password_hashing.py --logins 64 --concurrency 16
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from password_hashing import PasswordHasher, pwd_context  # noqa: E402
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)] * 1000 if ordered else 0.0
+
+
+async def run(mode, hashed, logins, concurrency, workers):
+    hasher = PasswordHasher(max_workers=workers, max_queue=logins) if mode == "pool" else None
+    login_latencies = []
+    clubs_latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+    done = asyncio.Event()
+
+    async def login(arrived):
+        # Latency is measured from arrival, so time spent blocked behind other
+        # logins on the event loop is counted too
+        async with semaphore:
+            if hasher:
+                await hasher.verify("password123", hashed)
+            else:
+                pwd_context.verify("password123", hashed)
+            login_latencies.append(time.perf_counter() - arrived)
+
+    async def clubs_probe():
+        # Stands in for a cheap, in-memory GET /api/clubs request
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            clubs_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.005)
+
+    probe = asyncio.create_task(clubs_probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(login(start) for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe
+    if hasher:
+        hasher.shutdown()
+
+    print(f"[{mode}] {logins} logins in {elapsed:.2f}s")
+    print(f"  login p50={percentile(login_latencies, 0.5):.1f}ms p99={percentile(login_latencies, 0.99):.1f}ms")
+    print(f"  clubs p50={percentile(clubs_latencies, 0.5):.2f}ms p99={percentile(clubs_latencies, 0.99):.2f}ms "
+          f"max={max(clubs_latencies) * 1000:.2f}ms mean={statistics.mean(clubs_latencies) * 1000:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    hashed = pwd_context.hash("password123")
+    for mode in ("inline", "pool"):
+        asyncio.run(run(mode, hashed, args.logins, args.concurrency, args.workers))
+
+
+if __name__ == "__main__":
+    main()
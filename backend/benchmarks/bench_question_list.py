@@ -0,0 +1,105 @@
+"""Question feed benchmark: full documents vs the summary aggregation.
+
+Seeds a scratch database with questions whose replies are still embedded
+(1k+ per thread, the worst case before migrate_replies.py has run), then
+compares the old ``find()`` feed query against the ``$size``/``$substrCP``
+pipeline used by ``GET /api/questions?view=summary``: bytes transferred and
+latency per page.
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_question_list.py --replies 1500
+    STORAGE_BACKEND=memory python benchmarks/bench_question_list.py
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from bson import BSON
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from storage import create_client  # noqa: E402
+
+# Mirrors server.QUESTION_SUMMARY_LENGTH
+QUESTION_SUMMARY_LENGTH = 280
+
+BENCH_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def summary_pipeline(limit):
+    return [
+        {"$sort": {"created_at": -1, "id": -1}},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0, "id": 1, "title": 1, "description": {"$substrCP": ["$description", 0, QUESTION_SUMMARY_LENGTH]},
+            "user_id": 1, "user_name": 1, "user_role": 1, "is_anonymous": 1, "created_at": 1,
+            "reply_count": {"$add": [{"$size": {"$ifNull": ["$replies", []]}}, {"$ifNull": ["$reply_count", 0]}]},
+        }},
+    ]
+
+
+def make_question(index, replies):
+    return {
+        "id": str(uuid.uuid4()),
+        "title": f"Question {index}",
+        "description": "How do I join the robotics club? " * 20,
+        "user_id": "bench-user",
+        "user_name": "Bench",
+        "user_role": "fresher",
+        "is_anonymous": False,
+        "created_at": BENCH_EPOCH + timedelta(seconds=index),
+        "replies": [
+            {"id": str(uuid.uuid4()), "content": "You can sign up at the stall during orientation week. " * 3,
+             "user_id": "senior", "user_name": "Senior", "user_role": "senior", "user_verified": True,
+             "created_at": "2026-01-02T00:00:00+00:00"}
+            for _ in range(replies)
+        ],
+    }
+
+
+async def timed(runs, func):
+    latencies, size = [], 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        docs = await func()
+        latencies.append(time.perf_counter() - start)
+        size = sum(len(BSON.encode(doc)) for doc in docs)
+        payload = len(json.dumps(docs, default=str))
+    return statistics.median(latencies) * 1000, size, payload
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--questions", type=int, default=40)
+    parser.add_argument("--replies", type=int, default=1500)
+    parser.add_argument("--page", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    client = create_client()
+    db = client["bench_question_list"]
+    try:
+        await db.questions.drop()
+        await db.questions.insert_many([make_question(i, args.replies) for i in range(args.questions)])
+        await db.questions.create_index([("created_at", -1), ("id", -1)])
+
+        full = await timed(args.runs, lambda: db.questions.find({}, {"_id": 0}).sort("created_at", -1).limit(args.page).to_list(args.page))
+        summary = await timed(args.runs, lambda: db.questions.aggregate(summary_pipeline(args.page)).to_list(args.page))
+
+        print(f"{args.page} questions/page, {args.replies} embedded replies each")
+        for label, (latency, bson_size, json_size) in (("find (full)", full), ("summary pipeline", summary)):
+            print(f"{label:<18} median {latency:8.2f}ms  wire {bson_size / 1024:10.1f} KiB  json {json_size / 1024:10.1f} KiB")
+    finally:
+        await client.drop_database("bench_question_list")
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
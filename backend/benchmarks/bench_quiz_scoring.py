@@ -0,0 +1,70 @@
+"""Quiz scoring micro-benchmark: linear scans vs the compiled scoring table.
+
+Reports single-core submissions per second for the original
+``next(...)``-based scan and for ``quiz.score_answers`` with text and
+index answers.
+
+    python benchmarks/bench_quiz_scoring.py --submissions 20000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quiz import QUIZ_QUESTIONS, score_answers  # noqa: E402
+
+
+def legacy_score_answers(answers):
+    scores = {}
+    for answer in answers:
+        question = next((q for q in QUIZ_QUESTIONS if q["id"] == answer.question_id), None)
+        if question:
+            selected_option = next((opt for opt in question["options"] if opt["text"] == answer.answer), None)
+            if selected_option:
+                for trait, weight in selected_option["weights"].items():
+                    scores[trait] = scores.get(trait, 0) + weight
+    return scores
+
+
+def make_submissions(count, by_index, rng):
+    submissions = []
+    for _ in range(count):
+        answers = []
+        for question in QUIZ_QUESTIONS:
+            index = rng.randrange(len(question["options"]))
+            answer = index if by_index else question["options"][index]["text"]
+            answers.append(SimpleNamespace(question_id=question["id"], answer=answer))
+        submissions.append(answers)
+    return submissions
+
+
+def measure(label, func, submissions):
+    start = time.perf_counter()
+    for answers in submissions:
+        func(answers)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24} {len(submissions) / elapsed:>12,.0f} submissions/s  ({elapsed / len(submissions) * 1e6:.2f} us each)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    by_text = make_submissions(args.submissions, False, rng)
+    by_index = make_submissions(args.submissions, True, rng)
+    assert all(legacy_score_answers(a) == score_answers(a) for a in by_text[:1000])
+
+    measure("legacy scan (text)", legacy_score_answers, by_text)
+    measure("compiled (text)", score_answers, by_text)
+    measure("compiled (index)", score_answers, by_index)
+
+
+if __name__ == "__main__":
+    main()
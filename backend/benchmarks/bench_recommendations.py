@@ -0,0 +1,107 @@
+"""Recommendation benchmark: per-club Python loop vs the matrix engine.
+
+Builds a synthetic catalog, checks that both implementations agree, then
+reports recommendations per second at the requested catalog size.
+
+    python benchmarks/bench_recommendations.py --clubs 5000 --users 500
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from quiz import QUIZ_QUESTIONS, score_answers  # noqa: E402
+from recommender import RecommendationEngine  # noqa: E402
+
+DOMAINS = ["Technical", "Cultural", "Sports", "Management", "Literary", "Social"]
+
+
+def legacy_recommend(scores, clubs):
+    club_matches = []
+    for club in clubs:
+        match_score = 0
+        reasons = []
+        domain_lower = club["domain"].lower()
+        if domain_lower == "technical" and scores.get("technical", 0) > 5:
+            match_score += scores.get("technical", 0) * 10
+            reasons.append("strong technical interest")
+        elif domain_lower == "cultural" and scores.get("creative", 0) > 5:
+            match_score += scores.get("creative", 0) * 10
+            reasons.append("creative mindset")
+        elif domain_lower == "sports" and scores.get("sports", 0) > 5:
+            match_score += scores.get("sports", 0) * 10
+            reasons.append("athletic inclination")
+        elif domain_lower == "management" and scores.get("leadership", 0) > 5:
+            match_score += scores.get("leadership", 0) * 10
+            reasons.append("leadership qualities")
+        elif domain_lower == "literary" and scores.get("literary", 0) > 5:
+            match_score += scores.get("literary", 0) * 10
+            reasons.append("literary interests")
+        elif domain_lower == "social" and scores.get("social", 0) > 5:
+            match_score += scores.get("social", 0) * 10
+            reasons.append("social consciousness")
+        if scores.get("competitive", 0) > 4:
+            match_score += 20
+            reasons.append("competitive spirit")
+        if scores.get("teamwork", 0) > 4:
+            match_score += 15
+            reasons.append("team player")
+        if scores.get("communication", 0) > 4:
+            match_score += 15
+            reasons.append("strong communication skills")
+        club_matches.append({
+            "club_id": club["id"],
+            "club_name": club["name"],
+            "match_percentage": min(int(match_score), 95) + 5,
+            "reason": f"You'd be great here because of your {', '.join(reasons[:2]) if reasons else 'diverse skills'}!",
+            "score": match_score,
+        })
+    club_matches.sort(key=lambda x: x["score"], reverse=True)
+    return [{k: v for k, v in match.items() if k != "score"} for match in club_matches[:3]]
+
+
+def random_scores(rng):
+    answers = [type("Answer", (), {"question_id": q["id"], "answer": rng.randrange(len(q["options"]))}) for q in QUIZ_QUESTIONS]
+    return score_answers(answers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clubs", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    clubs = [{"id": str(i), "name": f"Club {i}", "domain": rng.choice(DOMAINS)} for i in range(args.clubs)]
+    users = [random_scores(rng) for _ in range(args.users)]
+    engine = RecommendationEngine(clubs)
+
+    for scores in users[:200]:
+        assert engine.recommend(scores) == legacy_recommend(scores, clubs), scores
+
+    start = time.perf_counter()
+    for scores in users:
+        legacy_recommend(scores, clubs)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for scores in users:
+        engine.recommend(scores)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.recommend_many(users)
+    batch = time.perf_counter() - start
+
+    print(f"{args.clubs} clubs, {args.users} users")
+    print(f"legacy loop      {args.users / legacy:>10,.0f} users/s")
+    print(f"engine (single)  {args.users / single:>10,.0f} users/s")
+    print(f"engine (batch)   {args.users / batch:>10,.0f} users/s")
+
+
+if __name__ == "__main__":
+    main()
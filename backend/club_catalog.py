@@ -0,0 +1,110 @@
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogSnapshot:
+    """Immutable view of the club collection at one point in time."""
+
+    def __init__(self, clubs: List[dict], version: int, fingerprint: str):
+        self.clubs = clubs
+        self.version = version
+        self.fingerprint = fingerprint
+        self.loaded_at = datetime.now(timezone.utc)
+        self.by_id: Dict[str, dict] = {club["id"]: club for club in clubs}
+        self.by_domain: Dict[str, List[dict]] = {}
+        for club in clubs:
+            self.by_domain.setdefault(club["domain"], []).append(club)
+
+
+def _fingerprint(clubs: List[dict]) -> str:
+    encoded = json.dumps(clubs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ClubCatalog:
+    """Process-wide, in-memory copy of ``db.clubs``.
+
+    The catalog is reloaded every ``refresh_interval`` seconds (0 disables the
+    background task) or on demand through ``reload()``. A reload only swaps in
+    a new snapshot, and bumps ``version``, when the club documents changed.
+    """
+
+    def __init__(self, collection, refresh_interval: float = 300.0):
+        self.collection = collection
+        self.refresh_interval = refresh_interval
+        self.snapshot = CatalogSnapshot([], version=0, fingerprint="")
+        self.reloads = 0
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._listeners = []
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+    def add_listener(self, callback):
+        """Register ``callback(snapshot)`` to run whenever a new snapshot is swapped in."""
+        self._listeners.append(callback)
+
+    async def reload(self) -> bool:
+        async with self._lock:
+            clubs = await self.collection.find({}, {"_id": 0}).to_list(None)
+            self.reloads += 1
+            fingerprint = _fingerprint(clubs)
+            if fingerprint == self.snapshot.fingerprint:
+                return False
+            self.snapshot = CatalogSnapshot(clubs, self.snapshot.version + 1, fingerprint)
+            logger.info("Club catalog loaded version %d with %d clubs", self.snapshot.version, len(clubs))
+            for callback in self._listeners:
+                callback(self.snapshot)
+            return True
+
+    async def start(self):
+        await self.reload()
+        if self.refresh_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.reload()
+            except Exception:
+                logger.exception("Club catalog refresh failed; keeping version %d", self.version)
+
+    def list(self, domain: Optional[str] = None) -> List[dict]:
+        if domain:
+            return self.snapshot.by_domain.get(domain, [])
+        return self.snapshot.clubs
+
+    def get(self, club_id: str) -> Optional[dict]:
+        return self.snapshot.by_id.get(club_id)
+
+    def get_many(self, club_ids: Iterable[str]) -> List[dict]:
+        """Return the distinct clubs matching ``club_ids`` in request order, skipping unknown ids."""
+        by_id = self.snapshot.by_id
+        return [by_id[club_id] for club_id in dict.fromkeys(club_ids) if club_id in by_id]
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "version": self.snapshot.version,
+            "club_count": len(self.snapshot.clubs),
+            "loaded_at": self.snapshot.loaded_at.isoformat(),
+            "refresh_interval_seconds": self.refresh_interval,
+            "reloads": self.reloads,
+        }
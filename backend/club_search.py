@@ -0,0 +1,264 @@
+"""In-memory full-text and faceted search over the club catalog.
+
+``ClubSearchIndex`` keeps an inverted index (token -> club slot -> weight)
+over name, description, skills and tags, plus one slot set per facet value
+(domain, recruitment status, time commitment bucket). Each catalog snapshot
+is applied as a diff: only clubs whose searchable fields changed are
+re-indexed, so counter refreshes cost nothing.
+
+Queries run over numpy arrays compiled lazily from the postings. All terms
+must match, the last one as a prefix for search-as-you-type. Facet counts
+ignore the facet's own filter, so the UI can show how many clubs each other
+choice would give.
+"""
+import bisect
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Field weights: a hit in the name outranks one buried in the description
+FIELD_WEIGHTS = (("name", 4.0), ("tags", 2.0), ("skills", 2.0), ("description", 1.0))
+FACETS = ("domain", "recruitment_status", "time_commitment")
+STOPWORDS = frozenset("a an and are as at be by for from in is it of on or our the to we with you your".split())
+PREFIX_EXPANSION_LIMIT = 64
+
+# Upper bound of the weekly hours range -> bucket
+TIME_COMMITMENT_BUCKETS = ((5, "light"), (10, "moderate"), (float("inf"), "intensive"))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_HOURS_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def time_commitment_bucket(value: Optional[str]) -> str:
+    """``"5-8 hours/week"`` -> ``"moderate"``; unparseable values are ``"unknown"``."""
+    match = _HOURS_RE.search(value or "")
+    if not match:
+        return "unknown"
+    upper = int(match.group(2) or match.group(1))
+    return next(bucket for limit, bucket in TIME_COMMITMENT_BUCKETS if upper <= limit)
+
+
+def _field_text(club: dict, field: str) -> str:
+    value = club.get(field) or ""
+    return " ".join(value) if isinstance(value, list) else str(value)
+
+
+def _signature(club: dict) -> Tuple:
+    return tuple(_field_text(club, field) for field, _ in FIELD_WEIGHTS) + tuple(str(club.get(f)) for f in FACETS)
+
+
+def _facet_values(club: dict) -> Dict[str, str]:
+    return {
+        "domain": club.get("domain") or "unknown",
+        "recruitment_status": club.get("recruitment_status") or "unknown",
+        "time_commitment": time_commitment_bucket(club.get("time_commitment")),
+    }
+
+
+class SearchResult:
+    def __init__(self, club_ids: List[str], total: int, facets: Dict[str, Dict[str, int]]):
+        self.club_ids = club_ids
+        self.total = total
+        self.facets = facets
+
+
+class ClubSearchIndex:
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._signatures: Dict[str, Tuple] = {}
+        self._names: List[str] = []
+        self._terms: Dict[int, Dict[str, float]] = {}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._facets: Dict[str, Dict[str, Set[int]]] = {facet: {} for facet in FACETS}
+        self._slot_facets: Dict[int, Dict[str, str]] = {}
+        # Lazily compiled numpy views, dropped whenever the index changes
+        self._compiled: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._facet_masks: Dict[Tuple[str, str], np.ndarray] = {}
+        self._vocabulary: Optional[List[str]] = None
+        self._alive: Optional[np.ndarray] = None
+        self._rank: Optional[np.ndarray] = None
+        self.updates = 0
+        self.reindexed = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # Maintenance
+
+    def update(self, clubs: Iterable[dict]) -> Dict[str, int]:
+        """Bring the index in line with ``clubs``, touching only what changed."""
+        seen = set()
+        added = changed = 0
+        for club in clubs:
+            club_id = club["id"]
+            seen.add(club_id)
+            signature = _signature(club)
+            previous = self._signatures.get(club_id)
+            if previous == signature:
+                continue
+            if previous is None:
+                added += 1
+            else:
+                changed += 1
+                self._remove(club_id)
+            self._add(club, signature)
+        removed = [club_id for club_id in self._slots if club_id not in seen]
+        for club_id in removed:
+            self._remove(club_id)
+        if added or changed or removed:
+            self._invalidate()
+        self.updates += 1
+        self.reindexed += added + changed
+        return {"added": added, "changed": changed, "removed": len(removed)}
+
+    def _add(self, club: dict, signature: Tuple):
+        if self._free:
+            slot = self._free.pop()
+            self._ids[slot] = club["id"]
+            self._names[slot] = club.get("name", "").lower()
+        else:
+            slot = len(self._ids)
+            self._ids.append(club["id"])
+            self._names.append(club.get("name", "").lower())
+        self._slots[club["id"]] = slot
+        self._signatures[club["id"]] = signature
+
+        terms: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS:
+            for token in tokenize(_field_text(club, field)):
+                terms[token] = terms.get(token, 0.0) + weight
+        self._terms[slot] = terms
+        for token, weight in terms.items():
+            self._postings.setdefault(token, {})[slot] = weight
+
+        values = _facet_values(club)
+        self._slot_facets[slot] = values
+        for facet, value in values.items():
+            self._facets[facet].setdefault(value, set()).add(slot)
+
+    def _remove(self, club_id: str):
+        slot = self._slots.pop(club_id)
+        del self._signatures[club_id]
+        for token in self._terms.pop(slot):
+            posting = self._postings[token]
+            del posting[slot]
+            if not posting:
+                del self._postings[token]
+        for facet, value in self._slot_facets.pop(slot).items():
+            members = self._facets[facet][value]
+            members.discard(slot)
+            if not members:
+                del self._facets[facet][value]
+        self._ids[slot] = None
+        self._names[slot] = ""
+        self._free.append(slot)
+
+    def _invalidate(self):
+        self._compiled.clear()
+        self._facet_masks.clear()
+        self._vocabulary = None
+        self._alive = None
+        self._rank = None
+
+    # Compiled views
+
+    def _posting_arrays(self, token: str) -> Tuple[np.ndarray, np.ndarray]:
+        arrays = self._compiled.get(token)
+        if arrays is None:
+            posting = self._postings.get(token, {})
+            arrays = (np.fromiter(posting.keys(), dtype=np.intp, count=len(posting)),
+                      np.fromiter(posting.values(), dtype=np.float64, count=len(posting)))
+            self._compiled[token] = arrays
+        return arrays
+
+    def _facet_mask(self, facet: str, value: str) -> np.ndarray:
+        mask = self._facet_masks.get((facet, value))
+        if mask is None:
+            mask = np.zeros(len(self._ids), dtype=bool)
+            slots = self._facets[facet].get(value, ())
+            mask[np.fromiter(slots, dtype=np.intp, count=len(slots))] = True
+            self._facet_masks[(facet, value)] = mask
+        return mask
+
+    def _alive_mask(self) -> np.ndarray:
+        if self._alive is None:
+            self._alive = np.array([club_id is not None for club_id in self._ids], dtype=bool)
+        return self._alive
+
+    def _name_rank(self) -> np.ndarray:
+        # Position of each slot in name order, used to break score ties
+        if self._rank is None:
+            order = sorted(range(len(self._ids)), key=self._names.__getitem__)
+            self._rank = np.empty(len(self._ids), dtype=np.float64)
+            self._rank[order] = np.arange(len(order))
+        return self._rank
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        end = bisect.bisect_left(self._vocabulary, prefix + "￿", start)
+        return self._vocabulary[start:min(end, start + PREFIX_EXPANSION_LIMIT)]
+
+    # Queries
+
+    def search(self, query: str = "", filters: Optional[Dict[str, Optional[str]]] = None,
+               offset: int = 0, limit: int = 20, prefix: bool = True) -> SearchResult:
+        n = len(self._ids)
+        filters = {facet: value for facet, value in (filters or {}).items() if value}
+        tokens = tokenize(query)
+        scores = np.zeros(n, dtype=np.float64)
+        matched = self._alive_mask().copy()
+
+        for position, token in enumerate(tokens):
+            terms = self._expand_prefix(token) if prefix and position == len(tokens) - 1 else [token]
+            token_scores = np.zeros(n, dtype=np.float64)
+            for term in terms:
+                slots, weights = self._posting_arrays(term)
+                token_scores[slots] = np.maximum(token_scores[slots], weights)
+            matched &= token_scores > 0
+            scores += token_scores
+
+        filter_masks = {facet: self._facet_mask(facet, value) for facet, value in filters.items()}
+        facets = {}
+        for facet in FACETS:
+            base = matched
+            for other, mask in filter_masks.items():
+                if other != facet:
+                    base = base & mask
+            facets[facet] = {
+                value: count
+                for value in sorted(self._facets[facet])
+                if (count := int(np.count_nonzero(base & self._facet_mask(facet, value))))
+            }
+        for mask in filter_masks.values():
+            matched &= mask
+
+        candidates = np.flatnonzero(matched)
+        total = len(candidates)
+        k = min(offset + limit, total)
+        if k <= 0 or offset >= total:
+            return SearchResult([], total, facets)
+        # Higher score first, then name; one composite key so a partition finds the page
+        key = scores[candidates] * (n + 1) + (n - self._name_rank()[candidates])
+        if k < total:
+            top = np.argpartition(-key, k - 1)[:k]
+        else:
+            top = np.arange(total)
+        top = top[np.argsort(-key[top], kind="stable")][offset:k]
+        return SearchResult([self._ids[slot] for slot in candidates[top]], total, facets)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "clubs": len(self._slots),
+            "terms": len(self._postings),
+            "updates": self.updates,
+            "reindexed_clubs": self.reindexed,
+        }
@@ -0,0 +1,183 @@
+"""Denormalized per-club counters, written in coalesced batches.
+
+``CounterBuffer`` collects increments in memory and periodically flushes
+them as one unordered ``bulk_write`` of ``$inc`` updates, so a popular club
+receives one write per flush instead of one per request.
+
+Running this module rebuilds the counters from the source collections:
+
+    python counters.py
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+BOOKMARK_COUNT = "bookmark_count"
+INTEREST_COUNT = "interest_count"
+
+
+class CounterBuffer:
+    def __init__(self, collection, flush_interval: float = 5.0, key_field: str = "id"):
+        self.collection = collection
+        self.flush_interval = flush_interval
+        self.key_field = key_field
+        self._pending: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._task = None
+        # Held by flushes and by reconcile(), so no flush lands mid-recount
+        self._lock = asyncio.Lock()
+        self.flushes = 0
+        self.flushed_updates = 0
+        self.failures = 0
+
+    def incr(self, key: str, field: str, amount: int = 1):
+        self._pending[key][field] += amount
+
+    async def flush(self) -> int:
+        async with self._lock:
+            return await self._flush()
+
+    async def _flush(self) -> int:
+        if not self._pending:
+            return 0
+        pending, self._pending = self._pending, defaultdict(lambda: defaultdict(int))
+        batch = []
+        for key, deltas in pending.items():
+            deltas = {field: delta for field, delta in deltas.items() if delta}
+            if deltas:
+                batch.append((key, deltas))
+        if not batch:
+            return 0
+        operations = [UpdateOne({self.key_field: key}, {"$inc": deltas}) for key, deltas in batch]
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            # The unordered batch applied every other update; retrying those
+            # would count them twice, so only the failed ones go back
+            self.failures += 1
+            self._requeue(batch[err["index"]] for err in e.details["writeErrors"])
+            raise
+        except Exception:
+            # Nothing is known to have been applied; put every delta back
+            self.failures += 1
+            self._requeue(batch)
+            raise
+        self.flushes += 1
+        self.flushed_updates += len(operations)
+        return len(operations)
+
+    async def reconcile(self, recount: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run ``recount`` against flushed counters, with flushing held off.
+
+        Increments buffered while ``recount`` runs belong to writes it may
+        already have counted, so they are dropped rather than flushed on top
+        of the new totals.
+        """
+        async with self._lock:
+            await self._flush()
+            stats = await recount()
+            dropped, self._pending = len(self._pending), defaultdict(lambda: defaultdict(int))
+        return {**stats, "dropped_pending_keys": dropped}
+
+    def _requeue(self, batch: Iterable[Tuple[str, Dict[str, int]]]):
+        for key, deltas in batch:
+            for field, delta in deltas.items():
+                self._pending[key][field] += delta
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Counter flush failed; will retry")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final counter flush failed; %d clubs had pending increments", len(self._pending))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending_keys": len(self._pending),
+            "flush_interval_seconds": self.flush_interval,
+            "flushes": self.flushes,
+            "flushed_updates": self.flushed_updates,
+            "failures": self.failures,
+        }
+
+
+async def reconcile_club_counters(db) -> Dict[str, int]:
+    """Recompute bookmark and interest counters for every club from scratch.
+
+    Bookmarks are counted per club; interest is the number of stored quiz
+    results that recommended the club.
+    """
+    bookmark_counts = {
+        row["_id"]: row["count"]
+        async for row in db.bookmarks.aggregate([{"$group": {"_id": "$club_id", "count": {"$sum": 1}}}])
+    }
+    interest_counts = {
+        row["_id"]: row["count"]
+        async for row in db.quiz_responses.aggregate([
+            {"$unwind": "$recommendations"},
+            {"$group": {"_id": "$recommendations.club_id", "count": {"$sum": 1}}},
+        ])
+    }
+    counted = list(bookmark_counts.keys() | interest_counts.keys())
+    # Clubs with neither bookmarks nor recommendations go back to zero; the
+    # two writes touch disjoint clubs, so their counts are reported apart
+    reset = await db.clubs.update_many({"id": {"$nin": counted}}, {"$set": {BOOKMARK_COUNT: 0, INTEREST_COUNT: 0}})
+    updated = 0
+    if counted:
+        operations = [
+            UpdateOne(
+                {"id": club_id},
+                {"$set": {BOOKMARK_COUNT: bookmark_counts.get(club_id, 0), INTEREST_COUNT: interest_counts.get(club_id, 0)}},
+            )
+            for club_id in counted
+        ]
+        updated = (await db.clubs.bulk_write(operations, ordered=False)).modified_count
+    return {
+        "clubs_updated": updated,
+        "clubs_reset": reset.modified_count,
+        "bookmarked_clubs": len(bookmark_counts),
+        "recommended_clubs": len(interest_counts),
+    }
+
+
+async def main():
+    from dotenv import load_dotenv
+
+    load_dotenv(Path(__file__).parent / '.env')
+    # Imported after load_dotenv so STORAGE_BACKEND from .env applies
+    from storage import create_client, database_name
+
+    client = create_client()
+    db = client[database_name()]
+    try:
+        print(f"Done: {await reconcile_club_counters(db)}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,262 @@
+"""In-process pub/sub for Q&A activity, served to browsers as Server-Sent Events.
+
+``EventBroker.publish`` fans an event out to every subscription following
+one of its topics (``questions`` for the feed, ``question:<id>`` for one
+thread). Each subscription has a bounded queue. A client that falls
+``queue_size`` events behind is disconnected instead of buffering without
+limit. Its browser reconnects with ``Last-Event-ID`` and the missed events are
+replayed from a ring buffer, or a ``reset`` event tells it to refetch.
+
+Publishing is local to the process. With several workers, set
+``EVENTS_SOURCE=change_stream`` so every worker publishes from a MongoDB
+change stream instead (replica sets only). Question deletes are published
+from change streams only where MongoDB 6.0+ records pre-images.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import secrets
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set
+
+from pymongo.errors import OperationFailure
+
+from timestamps import api_timestamp
+
+logger = logging.getLogger(__name__)
+
+FEED_TOPIC = "questions"
+
+
+def question_topic(question_id: str) -> str:
+    return f"question:{question_id}"
+
+
+class TooManySubscribers(Exception):
+    pass
+
+
+def _json_default(value: Any) -> Any:
+    # Stored datetimes go out in the same format as the REST responses
+    return api_timestamp(value) if isinstance(value, datetime) else str(value)
+
+
+class Event:
+    __slots__ = ("id", "type", "data", "topics")
+
+    def __init__(self, event_id: str, event_type: str, data: Any, topics: Iterable[str]):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+        self.topics = frozenset(topics)
+
+    def encode(self) -> bytes:
+        payload = json.dumps(self.data, separators=(",", ":"), default=_json_default)
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n".encode("utf-8")
+
+
+class Subscription:
+    def __init__(self, broker: "EventBroker", topics: Set[str], queue_size: int):
+        self.broker = broker
+        self.topics = topics
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def offer(self, event: Event) -> bool:
+        if self.overflowed:
+            return False
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            # Discard the backlog and wake the reader so it closes the stream;
+            # the client reconnects and resumes from Last-Event-ID
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return False
+
+    async def next(self, timeout: float) -> Optional[Event]:
+        """The next event, or None after ``timeout`` seconds of silence. Raises ``ConnectionAbortedError`` on overflow."""
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is None:
+            raise ConnectionAbortedError("subscriber fell too far behind")
+        return event
+
+    def close(self):
+        self.broker._subscribers.discard(self)
+
+
+class EventBroker:
+    def __init__(self, max_subscribers: int = 1000, queue_size: int = 100, replay_size: int = 1000):
+        self.max_subscribers = max_subscribers
+        self.queue_size = queue_size
+        self._subscribers: Set[Subscription] = set()
+        self._replay: Deque[Event] = deque(maxlen=replay_size)
+        # Ids are "<boot>-<seq>" so a Last-Event-ID from another process or an
+        # earlier run is recognised and answered with a reset
+        self._boot = secrets.token_hex(4)
+        self._sequence = itertools.count(1)
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    def subscribe(self, topics: Iterable[str]) -> Subscription:
+        if len(self._subscribers) >= self.max_subscribers:
+            self.rejected += 1
+            raise TooManySubscribers()
+        subscription = Subscription(self, set(topics), self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def publish(self, event_type: str, data: Any, topics: Iterable[str]) -> Event:
+        event = Event(f"{self._boot}-{next(self._sequence)}", event_type, data, topics)
+        self._replay.append(event)
+        self.published += 1
+        for subscription in list(self._subscribers):
+            if subscription.topics & event.topics:
+                if subscription.offer(event):
+                    self.delivered += 1
+                elif subscription.overflowed and subscription in self._subscribers:
+                    self.dropped += 1
+                    subscription.close()
+        return event
+
+    def replay_after(self, last_event_id: str, topics: Set[str]) -> Optional[List[Event]]:
+        """Events after ``last_event_id`` for ``topics``; None if they are no longer all buffered."""
+        boot, _, sequence = last_event_id.partition("-")
+        if boot != self._boot or not sequence.isdigit() or not self._replay:
+            return None
+        after = int(sequence)
+        oldest = int(self._replay[0].id.partition("-")[2])
+        if after < oldest - 1:
+            return None
+        return [event for event in self._replay if int(event.id.partition("-")[2]) > after and event.topics & topics]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": len(self._subscribers),
+            "max_subscribers": self.max_subscribers,
+            "queue_size": self.queue_size,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_slow_subscribers": self.dropped,
+            "rejected_subscribers": self.rejected,
+        }
+
+
+async def sse_stream(subscription: Subscription, heartbeat: float, last_event_id: Optional[str] = None,
+                     retry_ms: int = 3000) -> AsyncIterator[bytes]:
+    """Encode a subscription as an SSE byte stream with comment heartbeats."""
+    try:
+        yield f"retry: {retry_ms}\n\n".encode("ascii")
+        if last_event_id:
+            missed = subscription.broker.replay_after(last_event_id, subscription.topics)
+            if missed is None:
+                yield b"event: reset\ndata: {}\n\n"
+            else:
+                for event in missed:
+                    yield event.encode()
+        while True:
+            try:
+                event = await subscription.next(heartbeat)
+            except ConnectionAbortedError:
+                return
+            # Heartbeats keep proxies from timing out idle connections
+            yield b": ping\n\n" if event is None else event.encode()
+    finally:
+        subscription.close()
+
+
+class ChangeStreamSource:
+    """Publishes question and reply inserts/deletes from MongoDB change streams.
+
+    Deleted questions are reported with their ``id`` only when the collection
+    records pre-images (MongoDB 6.0+, ``changeStreamPreAndPostImages``).
+    Otherwise the delete is skipped and clients see it on their next refetch.
+    A server that rejects the pre-image option is watched without it, after
+    one warning.
+    """
+
+    def __init__(self, db, broker: EventBroker, summarize, retry_delay: float = 5.0):
+        self.db = db
+        self.broker = broker
+        self.summarize = summarize
+        self.retry_delay = retry_delay
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self):
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._watch("questions")), asyncio.create_task(self._watch("replies"))]
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+    async def _watch(self, collection: str):
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "delete"]}}}]
+        resume_token = None
+        pre_images = True
+        while True:
+            options = {"full_document_before_change": "whenAvailable"} if pre_images else {}
+            try:
+                async with self.db[collection].watch(pipeline, resume_after=resume_token, **options) as stream:
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        self._handle(collection, change)
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if not pre_images:
+                    logger.exception("Change stream on %s failed; resuming in %.0fs", collection, self.retry_delay)
+                    await asyncio.sleep(self.retry_delay)
+                    continue
+                # MongoDB < 6.0 rejects fullDocumentBeforeChange; retrying with it
+                # would fail forever, so watch without pre-images from now on
+                pre_images = False
+                logger.warning("Change stream on %s rejected pre-images (%s); question deletes will not be "
+                               "published", collection, e)
+            except Exception:
+                logger.exception("Change stream on %s failed; resuming in %.0fs", collection, self.retry_delay)
+                await asyncio.sleep(self.retry_delay)
+
+    def _handle(self, collection: str, change: Dict[str, Any]):
+        if change["operationType"] == "insert":
+            doc = change["fullDocument"]
+            if collection == "questions":
+                publish_question_created(self.broker, self.summarize(doc))
+            else:
+                publish_reply_added(self.broker, doc["question_id"], doc)
+        elif collection == "questions":
+            before = change.get("fullDocumentBeforeChange")
+            if before and "id" in before:
+                publish_question_deleted(self.broker, before["id"])
+
+
+# Event shapes shared by the endpoints and the change stream source
+
+def publish_question_created(broker: EventBroker, summary: dict):
+    broker.publish("question_created", summary, [FEED_TOPIC])
+
+
+def publish_reply_added(broker: EventBroker, question_id: str, reply: dict):
+    reply = {key: value for key, value in reply.items() if key not in ("_id", "question_id")}
+    broker.publish("reply_added", {"question_id": question_id, "reply_id": reply.get("id")}, [FEED_TOPIC])
+    broker.publish("reply_added", {"question_id": question_id, "reply": reply}, [question_topic(question_id)])
+
+
+def publish_question_deleted(broker: EventBroker, question_id: str):
+    broker.publish("question_deleted", {"question_id": question_id}, [FEED_TOPIC, question_topic(question_id)])
@@ -0,0 +1,43 @@
+import json
+import os
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# FAST_JSON=false forces the stdlib encoder even when orjson is installed
+USE_ORJSON = orjson is not None and os.environ.get('FAST_JSON', 'true').lower() == 'true'
+
+
+def dumps(content: Any) -> bytes:
+    if USE_ORJSON:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available, stdlib json otherwise.
+
+    Use it as a route's ``response_class`` and return an instance directly
+    from the handler for data that is already in response shape: FastAPI then
+    skips ``response_model`` validation and ``jsonable_encoder`` entirely.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RawJSONResponse(JSONResponse):
+    """Response whose content is already-encoded JSON bytes."""
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+def json_array(items) -> bytes:
+    """Join already-encoded JSON values into a JSON array without re-encoding them."""
+    return b"[" + b",".join(items) + b"]"
@@ -0,0 +1,46 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class PrecomputedJSON:
+    """A JSON body serialized once, together with its strong ETag.
+
+    Serialization matches Starlette's ``JSONResponse`` so clients see the same
+    bytes they would get from a regular endpoint.
+    """
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, content: Any):
+        self.body = json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 section 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def precomputed_response(request: Request, payload: PrecomputedJSON, cache_control: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serve ``payload`` as-is, or a bodiless 304 when the client already has it."""
+    response_headers = {"ETag": payload.etag, "Cache-Control": cache_control}
+    if headers:
+        response_headers.update(headers)
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=response_headers)
+    return Response(content=payload.body, media_type="application/json", headers=response_headers)
@@ -0,0 +1,90 @@
+import logging
+from typing import Any, Dict, List
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# Indexes backing the query paths in server.py, by collection. Names are fixed
+# so bootstrapping is idempotent and health checks can tell what is missing.
+REQUIRED_INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+    ],
+    "clubs": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("domain", ASCENDING)], name="domain"),
+    ],
+    "bookmarks": [
+        IndexModel([("user_id", ASCENDING), ("club_id", ASCENDING)], name="user_club_unique", unique=True),
+        IndexModel([("user_id", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)], name="user_created_at"),
+    ],
+    "questions": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        # GET /api/questions/search; replies.content covers threads not yet migrated
+        IndexModel([("title", TEXT), ("description", TEXT), ("replies.content", TEXT)], name="text_search",
+                   weights={"title": 10, "description": 4, "replies.content": 1}),
+    ],
+    "replies": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("question_id", ASCENDING), ("created_at", ASCENDING), ("id", ASCENDING)], name="question_created_at"),
+        IndexModel([("content", TEXT)], name="text_search"),
+    ],
+    "quiz_responses": [
+        # Backfill of latest_quiz_results walks this index; the API no longer reads history
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)], name="user_created_at"),
+    ],
+    "latest_quiz_results": [
+        IndexModel([("user_id", ASCENDING)], name="user_unique", unique=True),
+    ],
+}
+
+
+async def ensure_indexes(db) -> Dict[str, Dict[str, List[str]]]:
+    """Create any missing required index; existing ones are left untouched.
+
+    A failing index (for example a unique index over data that already holds
+    duplicates) is logged and reported but does not stop the others.
+    """
+    report = {}
+    for collection_name, models in REQUIRED_INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        created, failed = [], []
+        for model in models:
+            name = model.document["name"]
+            if name in existing:
+                continue
+            try:
+                await collection.create_indexes([model])
+                created.append(name)
+            except OperationFailure as e:
+                logger.error("Could not create index %s.%s: %s", collection_name, name, e)
+                failed.append(name)
+        if created:
+            logger.info("Created indexes on %s: %s", collection_name, ", ".join(created))
+        report[collection_name] = {"created": created, "failed": failed}
+    return report
+
+
+async def index_health(db) -> Dict[str, Any]:
+    """Required vs present indexes per collection, with usage counters where available."""
+    health = {"healthy": True, "collections": {}}
+    for collection_name, models in REQUIRED_INDEXES.items():
+        collection = db[collection_name]
+        existing = await collection.index_information()
+        required = [model.document["name"] for model in models]
+        missing = [name for name in required if name not in existing]
+        entry = {"required": required, "present": sorted(existing), "missing": missing}
+        try:
+            stats = await collection.aggregate([{"$indexStats": {}}]).to_list(None)
+            entry["usage"] = {s["name"]: s["accesses"]["ops"] for s in stats}
+        except OperationFailure:
+            pass
+        if missing:
+            health["healthy"] = False
+        health["collections"][collection_name] = entry
+    return health
@@ -0,0 +1,142 @@
+"""Latest quiz result per user, materialized in ``latest_quiz_results``.
+
+``quiz_responses`` keeps every submission for analytics. The dashboard only
+needs the newest one, so each user has one document here, keyed by the
+unique ``user_id`` index and written alongside the history insert.
+
+Writes are conditional upserts on ``created_at``. An older result never
+replaces a newer one: the filter misses, the upsert collides with the unique
+index and the duplicate key error is ignored. That is what makes the backfill
+safe to run while users keep submitting, and safe to re-run.
+
+    python latest_quiz_results.py
+    python latest_quiz_results.py --dry-run
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+DUPLICATE_KEY = 11000
+RESULT_FIELDS = ("personality_type", "personality_description", "recommendations")
+
+
+def latest_result_upsert(response: dict) -> Tuple[dict, dict]:
+    """Filter and update storing ``response`` (a ``quiz_responses`` document) unless a newer result exists."""
+    created_at = response["created_at"]
+    query = {"user_id": response["user_id"], "created_at": {"$lte": created_at}}
+    if isinstance(created_at, datetime):
+        # A result still stored with a legacy ISO string is older than any date
+        del query["created_at"]
+        query["$or"] = [{"created_at": {"$lte": created_at}}, {"created_at": {"$type": "string"}}]
+    return (
+        query,
+        {"$set": {
+            "response_id": response["id"],
+            "created_at": response["created_at"],
+            **{field: response[field] for field in RESULT_FIELDS},
+        }},
+    )
+
+
+def latest_result_document(response: dict) -> dict:
+    """The API view of a stored result."""
+    return {field: response[field] for field in RESULT_FIELDS}
+
+
+async def record_latest_result(db, response: dict) -> bool:
+    """Make ``response`` the user's latest result; False if a newer one is already stored."""
+    try:
+        await db.latest_quiz_results.update_one(*latest_result_upsert(response), upsert=True)
+    except DuplicateKeyError:
+        return False
+    return True
+
+
+async def backfill_latest_quiz_results(
+    db,
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Rebuild ``latest_quiz_results`` from ``quiz_responses``.
+
+    Streams the history in ``user_created_at`` index order, so the first
+    response seen for each user is their newest and nothing is sorted in
+    memory. Results already newer than the history (written by a concurrent
+    submission) are kept.
+    """
+    stats = {"users": 0, "written": 0, "kept_newer": 0, "seconds": 0.0, "dry_run": dry_run}
+    start = time.perf_counter()
+
+    async def flush(operations: List[UpdateOne]):
+        if not dry_run:
+            try:
+                result = await db.latest_quiz_results.bulk_write(operations, ordered=False)
+                written = result.upserted_count + result.matched_count
+            except BulkWriteError as e:
+                errors = e.details.get("writeErrors", [])
+                if any(err["code"] != DUPLICATE_KEY for err in errors):
+                    raise
+                written = e.details.get("nUpserted", 0) + e.details.get("nMatched", 0)
+                stats["kept_newer"] += len(errors)
+            stats["written"] += written
+        stats["users"] += len(operations)
+        stats["seconds"] = round(time.perf_counter() - start, 3)
+        if progress:
+            progress(dict(stats))
+
+    projection = {"_id": 0, "id": 1, "user_id": 1, "created_at": 1, **{field: 1 for field in RESULT_FIELDS}}
+    cursor = db.quiz_responses.find({}, projection).sort([("user_id", 1), ("created_at", -1)]).batch_size(batch_size)
+    operations = []
+    previous_user = None
+    async for response in cursor:
+        if response["user_id"] == previous_user:
+            continue
+        previous_user = response["user_id"]
+        operations.append(UpdateOne(*latest_result_upsert(response), upsert=True))
+        if len(operations) >= batch_size:
+            await flush(operations)
+            operations = []
+    if operations:
+        await flush(operations)
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+async def main():
+    from dotenv import load_dotenv
+
+    from indexes import ensure_indexes
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="count users without writing")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+    # Imported after load_dotenv so STORAGE_BACKEND from .env applies
+    from storage import create_client, database_name
+
+    client = create_client()
+    db = client[database_name()]
+    try:
+        if not args.dry_run:
+            # The unique user_id index is what stops an older result overwriting a newer one
+            await ensure_indexes(db)
+        stats = await backfill_latest_quiz_results(
+            db, batch_size=args.batch_size, dry_run=args.dry_run,
+            progress=lambda s: print(f"{s['users']} users backfilled"),
+        )
+        print(f"Done: {stats}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,804 @@
+"""In-memory stand-in for the subset of Motor that the backend uses.
+
+``InMemoryClient`` mimics ``AsyncIOMotorClient`` closely enough for
+server.py, the maintenance scripts and the benchmarks to run without a
+MongoDB server: async CRUD, cursors with sort/skip/limit, ``bulk_write``,
+unique indexes with duplicate key errors, and the aggregation stages and
+expressions those modules use. It returns real pymongo result and error
+types. Documents are deep-copied on the way in and out, like a round trip
+through BSON.
+
+It is a test and benchmarking backend, not a database: everything lives
+in process memory and is lost on exit.
+"""
+import copy
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import DeleteMany, DeleteOne, IndexModel, InsertOne, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import BulkWriteResult, DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+_MISSING = object()
+
+
+# Value helpers
+
+def _get_path(doc: Any, path: str) -> Any:
+    for part in path.split("."):
+        if isinstance(doc, dict):
+            doc = doc.get(part, _MISSING)
+        elif isinstance(doc, list) and part.isdigit() and int(part) < len(doc):
+            doc = doc[int(part)]
+        elif isinstance(doc, list):
+            values = [_get_path(item, part) for item in doc if isinstance(item, dict)]
+            doc = [v for v in values if v is not _MISSING] or _MISSING
+        else:
+            return _MISSING
+        if doc is _MISSING:
+            return _MISSING
+    return doc
+
+
+def _set_path(doc: dict, path: str, value: Any):
+    parts = path.split(".")
+    for part in parts[:-1]:
+        doc = doc.setdefault(part, {})
+    doc[parts[-1]] = value
+
+
+def _unset_path(doc: dict, path: str):
+    parts = path.split(".")
+    for part in parts[:-1]:
+        doc = doc.get(part)
+        if not isinstance(doc, dict):
+            return
+    doc.pop(parts[-1], None)
+
+
+def _type_rank(value: Any) -> int:
+    # Follows the BSON comparison order for the types this app stores
+    if value is None or value is _MISSING:
+        return 1
+    if isinstance(value, bool):
+        return 8
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, str):
+        return 3
+    if isinstance(value, dict):
+        return 4
+    if isinstance(value, list):
+        return 5
+    if isinstance(value, ObjectId):
+        return 7
+    if isinstance(value, datetime):
+        return 9
+    return 10
+
+
+# $type aliases for the ranks above
+_TYPE_RANKS = {"null": 1, "number": 2, "double": 2, "int": 2, "long": 2, "string": 3, "object": 4, "array": 5,
+               "objectId": 7, "bool": 8, "date": 9}
+
+
+def _sort_key(value: Any):
+    rank = _type_rank(value)
+    if rank == 1:
+        return (rank, 0)
+    if rank in (4, 5):
+        return (rank, repr(value))
+    return (rank, value)
+
+
+def _compare(a: Any, b: Any) -> Optional[int]:
+    """-1/0/1, or None when the types are not comparable (Mongo type bracketing)."""
+    if _type_rank(a) != _type_rank(b):
+        return None
+    ka, kb = _sort_key(a), _sort_key(b)
+    return (ka > kb) - (ka < kb)
+
+
+# Query matching
+
+def _values_for(doc: dict, path: str) -> List[Any]:
+    value = _get_path(doc, path)
+    if value is _MISSING:
+        return [_MISSING]
+    if isinstance(value, list):
+        return [value] + value
+    return [value]
+
+
+def _match_operator(values: List[Any], op: str, arg: Any) -> bool:
+    if op == "$eq":
+        return any(_equals(v, arg) for v in values)
+    if op == "$ne":
+        return not any(_equals(v, arg) for v in values)
+    if op == "$in":
+        return any(_equals(v, a) for v in values for a in arg)
+    if op == "$nin":
+        return not any(_equals(v, a) for v in values for a in arg)
+    if op == "$exists":
+        return (values != [_MISSING]) == bool(arg)
+    if op in ("$gt", "$gte", "$lt", "$lte"):
+        for v in values:
+            if v is _MISSING:
+                continue
+            c = _compare(v, arg)
+            if c is None:
+                continue
+            if (op == "$gt" and c > 0) or (op == "$gte" and c >= 0) or (op == "$lt" and c < 0) or (op == "$lte" and c <= 0):
+                return True
+        return False
+    if op == "$type":
+        ranks = {_TYPE_RANKS[name] for name in (arg if isinstance(arg, list) else [arg])}
+        return any(v is not _MISSING and _type_rank(v) in ranks for v in values)
+    if op == "$regex":
+        pattern = re.compile(arg) if isinstance(arg, str) else arg
+        return any(isinstance(v, str) and pattern.search(v) for v in values)
+    if op == "$size":
+        return any(isinstance(v, list) and len(v) == arg for v in values)
+    raise OperationFailure(f"Unsupported query operator {op} in memory backend")
+
+
+def _equals(value: Any, expected: Any) -> bool:
+    if value is _MISSING:
+        return expected is None
+    if isinstance(value, bool) != isinstance(expected, bool):
+        return False
+    return value == expected
+
+
+def matches(doc: dict, query: Dict[str, Any]) -> bool:
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$nor":
+            if any(matches(doc, sub) for sub in condition):
+                return False
+        elif key.startswith("$"):
+            raise OperationFailure(f"Unsupported query operator {key} in memory backend")
+        else:
+            values = _values_for(doc, key)
+            if isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+                if not all(_match_operator(values, op, arg) for op, arg in condition.items() if op != "$options"):
+                    return False
+            elif not any(_equals(v, condition) for v in values):
+                return False
+    return True
+
+
+# Aggregation expressions
+
+def evaluate(expr: Any, doc: dict) -> Any:
+    if isinstance(expr, str) and expr.startswith("$"):
+        value = _get_path(doc, expr[1:])
+        return None if value is _MISSING else value
+    if isinstance(expr, list):
+        return [evaluate(e, doc) for e in expr]
+    if not isinstance(expr, dict) or not expr:
+        return expr
+    op, arg = next(iter(expr.items()))
+    if not op.startswith("$"):
+        return {k: evaluate(v, doc) for k, v in expr.items()}
+    if op == "$literal":
+        return arg
+    args = [evaluate(a, doc) for a in arg] if isinstance(arg, list) else evaluate(arg, doc)
+    if op == "$add":
+        return sum(a for a in args if a is not None)
+    if op == "$subtract":
+        return args[0] - args[1]
+    if op == "$multiply":
+        result = 1
+        for a in args:
+            result *= a
+        return result
+    if op == "$size":
+        if not isinstance(args, list):
+            raise OperationFailure("The argument to $size must be an array")
+        return len(args)
+    if op == "$ifNull":
+        return next((a for a in args[:-1] if a is not None), args[-1])
+    if op == "$substrCP":
+        text, start, length = args
+        return (text or "")[start:start + length]
+    if op == "$toLower":
+        return (args or "").lower()
+    if op == "$concat":
+        return "".join(args)
+    if op == "$cond":
+        if isinstance(arg, dict):
+            args = [evaluate(arg["if"], doc), evaluate(arg["then"], doc), evaluate(arg["else"], doc)]
+        return args[1] if args[0] else args[2]
+    if op in ("$gt", "$gte", "$lt", "$lte", "$eq", "$ne"):
+        c = _compare(args[0], args[1])
+        if op == "$eq":
+            return c == 0
+        if op == "$ne":
+            return c != 0
+        if c is None:
+            return _type_rank(args[0]) > _type_rank(args[1]) if op in ("$gt", "$gte") else _type_rank(args[0]) < _type_rank(args[1])
+        return {"$gt": c > 0, "$gte": c >= 0, "$lt": c < 0, "$lte": c <= 0}[op]
+    raise OperationFailure(f"Unsupported expression {op} in memory backend")
+
+
+def _project_path(value: Any, parts: List[str]) -> Any:
+    # Like Mongo, "a.b" keeps the shape of "a": through an array of
+    # subdocuments it yields [{"b": ...}, ...], not a flat list of values
+    if not parts:
+        return copy.deepcopy(value)
+    if isinstance(value, dict):
+        if parts[0] not in value:
+            return _MISSING
+        inner = _project_path(value[parts[0]], parts[1:])
+        return _MISSING if inner is _MISSING else {parts[0]: inner}
+    if isinstance(value, list):
+        projected = [_project_path(item, parts) for item in value if isinstance(item, (dict, list))]
+        return [{} if item is _MISSING else item for item in projected]
+    return _MISSING
+
+
+def _merge_projection(target: Any, source: Any) -> Any:
+    if isinstance(target, dict) and isinstance(source, dict):
+        for key, value in source.items():
+            target[key] = _merge_projection(target[key], value) if key in target else value
+        return target
+    if isinstance(target, list) and isinstance(source, list) and len(target) == len(source):
+        return [_merge_projection(t, v) for t, v in zip(target, source)]
+    return source
+
+
+def project(doc: dict, projection: Optional[Dict[str, Any]]) -> dict:
+    if not projection:
+        return doc
+    include_id = projection.get("_id", 1) not in (0, False)
+    fields = {k: v for k, v in projection.items() if k != "_id"}
+    inclusive = any(v not in (0, False) for v in fields.values())
+    if not fields and not include_id:
+        inclusive = False
+    if inclusive:
+        result = {}
+        if include_id and "_id" in doc:
+            result["_id"] = doc["_id"]
+        for key, spec in fields.items():
+            if spec in (1, True):
+                value = _project_path(doc, key.split("."))
+                if value is not _MISSING:
+                    _merge_projection(result, value)
+            else:
+                _set_path(result, key, evaluate(spec, doc))
+        return result
+    result = copy.copy(doc)
+    for key in fields:
+        _unset_path(result, key)
+    if not include_id:
+        result.pop("_id", None)
+    return result
+
+
+def sort_documents(docs: List[dict], spec: Iterable[Tuple[str, int]]) -> List[dict]:
+    # Stable sorts applied from the least significant key backwards
+    for field, direction in reversed(list(spec)):
+        docs.sort(key=lambda d: _sort_key(_get_path(d, field)), reverse=direction < 0)
+    return docs
+
+
+def _normalize_sort(key_or_list, direction=None) -> List[Tuple[str, int]]:
+    if isinstance(key_or_list, str):
+        return [(key_or_list, direction if direction is not None else 1)]
+    if isinstance(key_or_list, dict):
+        return list(key_or_list.items())
+    return list(key_or_list)
+
+
+# Updates
+
+def apply_update(doc: dict, update: Any, inserting: bool = False) -> dict:
+    if isinstance(update, list):
+        for stage in update:
+            if "$set" in stage or "$addFields" in stage:
+                values = {k: evaluate(v, doc) for k, v in (stage.get("$set") or stage["$addFields"]).items()}
+                for key, value in values.items():
+                    _set_path(doc, key, value)
+            elif "$unset" in stage:
+                fields = stage["$unset"]
+                for key in [fields] if isinstance(fields, str) else fields:
+                    _unset_path(doc, key)
+            else:
+                raise OperationFailure(f"Unsupported pipeline update stage {list(stage)} in memory backend")
+        return doc
+    for op, fields in update.items():
+        if op == "$set":
+            for key, value in fields.items():
+                _set_path(doc, key, copy.deepcopy(value))
+        elif op == "$setOnInsert":
+            if inserting:
+                for key, value in fields.items():
+                    _set_path(doc, key, copy.deepcopy(value))
+        elif op == "$unset":
+            for key in fields:
+                _unset_path(doc, key)
+        elif op == "$inc":
+            for key, amount in fields.items():
+                current = _get_path(doc, key)
+                _set_path(doc, key, (0 if current is _MISSING else current) + amount)
+        elif op == "$push":
+            for key, value in fields.items():
+                current = _get_path(doc, key)
+                items = [] if current is _MISSING else current
+                if isinstance(value, dict) and "$each" in value:
+                    items.extend(copy.deepcopy(value["$each"]))
+                else:
+                    items.append(copy.deepcopy(value))
+                _set_path(doc, key, items)
+        elif op == "$addToSet":
+            for key, value in fields.items():
+                current = _get_path(doc, key)
+                items = [] if current is _MISSING else current
+                if value not in items:
+                    items.append(copy.deepcopy(value))
+                _set_path(doc, key, items)
+        elif op == "$pull":
+            for key, value in fields.items():
+                current = _get_path(doc, key)
+                if isinstance(current, list):
+                    _set_path(doc, key, [item for item in current if item != value])
+        else:
+            raise OperationFailure(f"Unsupported update operator {op} in memory backend")
+    return doc
+
+
+def _upsert_seed(query: Dict[str, Any]) -> dict:
+    doc = {}
+    for key, value in query.items():
+        if not key.startswith("$") and not (isinstance(value, dict) and any(k.startswith("$") for k in value)):
+            _set_path(doc, key, copy.deepcopy(value))
+    return doc
+
+
+# Cursors
+
+class InMemoryCursor:
+    def __init__(self, loader):
+        self._loader = loader
+        self._sort: List[Tuple[str, int]] = []
+        self._skip = 0
+        self._limit = 0
+        self._results: Optional[List[dict]] = None
+
+    def sort(self, key_or_list, direction=None) -> "InMemoryCursor":
+        self._sort = _normalize_sort(key_or_list, direction)
+        return self
+
+    def skip(self, count: int) -> "InMemoryCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "InMemoryCursor":
+        self._limit = count
+        return self
+
+    def batch_size(self, size: int) -> "InMemoryCursor":
+        return self
+
+    def _materialize(self) -> List[dict]:
+        if self._results is None:
+            self._results = self._loader(self._sort, self._skip, self._limit)
+        return self._results
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]:
+        results = self._materialize()
+        return results if not length else results[:length]
+
+    def __aiter__(self):
+        self._iter = iter(self._materialize())
+        return self
+
+    async def __anext__(self) -> dict:
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+# Collections
+
+class InMemoryCollection:
+    def __init__(self, database: "InMemoryDatabase", name: str):
+        self.database = database
+        self.name = name
+        self._docs: Dict[Any, dict] = {}
+        self._indexes: Dict[str, dict] = {"_id_": {"key": [("_id", 1)], "unique": True}}
+        # Equality lookup tables for the leading field of every index
+        self._lookup: Dict[str, Dict[Any, set]] = {"_id": {}}
+        self._unique: Dict[str, Dict[Tuple, Any]] = {}
+        self._seq: Dict[Any, int] = {}
+        self._next_seq = 0
+
+    # Index bookkeeping
+
+    @staticmethod
+    def _hashable(value):
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return _MISSING
+
+    def _index_doc(self, doc: dict):
+        for field, table in self._lookup.items():
+            value = self._hashable(_get_path(doc, field))
+            if value is not _MISSING:
+                table.setdefault(value, set()).add(doc["_id"])
+        for name, table in self._unique.items():
+            table[self._unique_key(name, doc)] = doc["_id"]
+
+    def _unindex_doc(self, doc: dict):
+        for field, table in self._lookup.items():
+            value = self._hashable(_get_path(doc, field))
+            if value is not _MISSING and value in table:
+                table[value].discard(doc["_id"])
+                if not table[value]:
+                    del table[value]
+        for name, table in self._unique.items():
+            key = self._unique_key(name, doc)
+            if table.get(key) == doc["_id"]:
+                del table[key]
+
+    def _unique_key(self, name: str, doc: dict) -> Tuple:
+        values = []
+        for field, _ in self._indexes[name]["key"]:
+            value = _get_path(doc, field)
+            values.append(None if value is _MISSING else repr(value) if self._hashable(value) is _MISSING else value)
+        return tuple(values)
+
+    def _check_unique(self, doc: dict, ignore_id=_MISSING):
+        for name, table in self._unique.items():
+            owner = table.get(self._unique_key(name, doc), _MISSING)
+            if owner is not _MISSING and owner != ignore_id:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.database.name}.{self.name} index: {name}",
+                    code=11000,
+                )
+        if ignore_id is _MISSING and doc["_id"] in self._docs:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.database.name}.{self.name} index: _id_", code=11000)
+
+    async def create_indexes(self, models) -> List[str]:
+        names = []
+        for model in models:
+            spec = model.document
+            name = spec["name"]
+            key = list(spec["key"].items())
+            if name not in self._indexes:
+                self._indexes[name] = {"key": key, **{k: v for k, v in spec.items() if k not in ("key", "name")}}
+                if spec.get("unique"):
+                    table = {}
+                    for doc in self._docs.values():
+                        unique_key = self._unique_key(name, doc)
+                        if unique_key in table:
+                            del self._indexes[name]
+                            raise OperationFailure(f"E11000 duplicate key error building index {name}", code=11000)
+                        table[unique_key] = doc["_id"]
+                    self._unique[name] = table
+                field = key[0][0]
+                if field not in self._lookup and key[0][1] in (1, -1):
+                    self._lookup[field] = {}
+                    for doc in self._docs.values():
+                        value = self._hashable(_get_path(doc, field))
+                        if value is not _MISSING:
+                            self._lookup[field].setdefault(value, set()).add(doc["_id"])
+            names.append(name)
+        return names
+
+    async def create_index(self, keys, **kwargs) -> str:
+        return (await self.create_indexes([IndexModel(keys, **kwargs)]))[0]
+
+    async def index_information(self) -> Dict[str, dict]:
+        return {name: copy.deepcopy(spec) for name, spec in self._indexes.items()}
+
+    async def drop(self):
+        self.database._collections.pop(self.name, None)
+
+    # Reads
+
+    def _candidates(self, query: Dict[str, Any]) -> Iterable[dict]:
+        # Narrow the scan with an indexed equality or $in condition when there is one
+        for field, condition in query.items():
+            table = self._lookup.get(field)
+            if table is None:
+                continue
+            if isinstance(condition, dict):
+                if set(condition) != {"$in"}:
+                    continue
+                ids = set()
+                for value in condition["$in"]:
+                    ids |= table.get(self._hashable(value), set())
+            else:
+                value = self._hashable(condition)
+                if value is _MISSING:
+                    continue
+                ids = table.get(value, ())
+            # Keep insertion (natural) order, as a collection scan would
+            return sorted((self._docs[i] for i in ids), key=lambda d: self._seq[d["_id"]])
+        return list(self._docs.values())
+
+    def _select(self, query: Optional[Dict[str, Any]]) -> List[dict]:
+        query = query or {}
+        return [doc for doc in self._candidates(query) if matches(doc, query)]
+
+    def find(self, filter: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None, sort=None, skip: int = 0, limit: int = 0, **kwargs) -> InMemoryCursor:
+        def load(sort_spec, skip_count, limit_count):
+            docs = self._select(filter)
+            if sort_spec:
+                docs = sort_documents(list(docs), sort_spec)
+            if skip_count:
+                docs = docs[skip_count:]
+            if limit_count:
+                docs = docs[:limit_count]
+            return [copy.deepcopy(project(doc, projection)) for doc in docs]
+
+        cursor = InMemoryCursor(load)
+        if sort:
+            cursor.sort(sort)
+        return cursor.skip(skip).limit(limit)
+
+    async def find_one(self, filter: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None, sort=None, **kwargs) -> Optional[dict]:
+        results = await self.find(filter, projection, sort=sort).limit(1).to_list(1)
+        return results[0] if results else None
+
+    async def count_documents(self, filter: Dict[str, Any], **kwargs) -> int:
+        return len(self._select(filter))
+
+    async def estimated_document_count(self) -> int:
+        return len(self._docs)
+
+    async def distinct(self, key: str, filter: Optional[Dict[str, Any]] = None) -> List[Any]:
+        values = []
+        for doc in self._select(filter):
+            value = _get_path(doc, key)
+            for item in value if isinstance(value, list) else [value]:
+                if item is not _MISSING and item not in values:
+                    values.append(item)
+        return values
+
+    # Writes
+
+    def _insert(self, document: dict) -> Any:
+        doc = copy.deepcopy(document)
+        if "_id" not in doc:
+            doc["_id"] = ObjectId()
+        self._check_unique(doc)
+        self._docs[doc["_id"]] = doc
+        self._seq[doc["_id"]] = self._next_seq
+        self._next_seq += 1
+        self._index_doc(doc)
+        document.setdefault("_id", doc["_id"])
+        return doc["_id"]
+
+    def _replace(self, old: dict, new: dict):
+        self._check_unique(new, ignore_id=old["_id"])
+        self._unindex_doc(old)
+        self._docs[old["_id"]] = new
+        self._index_doc(new)
+
+    def _update(self, query, update, upsert: bool, multi: bool) -> Dict[str, Any]:
+        targets = self._select(query)
+        if not multi:
+            targets = targets[:1]
+        if not targets:
+            if not upsert:
+                return {"n": 0, "nModified": 0}
+            doc = apply_update(_upsert_seed(query), update, inserting=True)
+            return {"n": 1, "nModified": 0, "upserted": self._insert(doc)}
+        modified = 0
+        for doc in targets:
+            new = apply_update(copy.deepcopy(doc), update)
+            if new != doc:
+                self._replace(doc, new)
+                modified += 1
+        return {"n": len(targets), "nModified": modified}
+
+    def _delete(self, query, multi: bool) -> int:
+        targets = self._select(query)
+        if not multi:
+            targets = targets[:1]
+        for doc in targets:
+            self._unindex_doc(doc)
+            del self._docs[doc["_id"]]
+            del self._seq[doc["_id"]]
+        return len(targets)
+
+    async def insert_one(self, document: dict, **kwargs) -> InsertOneResult:
+        return InsertOneResult(self._insert(document), True)
+
+    async def insert_many(self, documents: Iterable[dict], ordered: bool = True, **kwargs) -> InsertManyResult:
+        _, inserted_ids = self._bulk_write([InsertOne(doc) for doc in documents], ordered)
+        return InsertManyResult(inserted_ids, True)
+
+    async def update_one(self, filter, update, upsert: bool = False, **kwargs) -> UpdateResult:
+        return UpdateResult(self._update(filter, update, upsert, multi=False), True)
+
+    async def update_many(self, filter, update, upsert: bool = False, **kwargs) -> UpdateResult:
+        return UpdateResult(self._update(filter, update, upsert, multi=True), True)
+
+    async def replace_one(self, filter, replacement, upsert: bool = False, **kwargs) -> UpdateResult:
+        targets = self._select(filter)[:1]
+        if not targets:
+            if not upsert:
+                return UpdateResult({"n": 0, "nModified": 0}, True)
+            return UpdateResult({"n": 1, "nModified": 0, "upserted": self._insert(dict(replacement))}, True)
+        new = dict(copy.deepcopy(replacement), _id=targets[0]["_id"])
+        self._replace(targets[0], new)
+        return UpdateResult({"n": 1, "nModified": 1}, True)
+
+    async def delete_one(self, filter, **kwargs) -> DeleteResult:
+        return DeleteResult({"n": self._delete(filter, multi=False)}, True)
+
+    async def delete_many(self, filter, **kwargs) -> DeleteResult:
+        return DeleteResult({"n": self._delete(filter, multi=True)}, True)
+
+    async def bulk_write(self, requests, ordered: bool = True, **kwargs) -> BulkWriteResult:
+        summary, _ = self._bulk_write(requests, ordered)
+        return BulkWriteResult(summary, True)
+
+    def _bulk_write(self, requests, ordered: bool) -> Tuple[Dict[str, Any], List[Any]]:
+        summary = {"nInserted": 0, "nUpserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0,
+                   "upserted": [], "writeErrors": [], "writeConcernErrors": []}
+        inserted_ids = []
+        for index, op in enumerate(requests):
+            try:
+                if isinstance(op, InsertOne):
+                    inserted_ids.append(self._insert(op._doc))
+                    summary["nInserted"] += 1
+                elif isinstance(op, (UpdateOne, UpdateMany)):
+                    raw = self._update(op._filter, op._doc, bool(op._upsert), multi=isinstance(op, UpdateMany))
+                    if "upserted" in raw:
+                        summary["nUpserted"] += 1
+                        summary["upserted"].append({"index": index, "_id": raw["upserted"]})
+                    else:
+                        summary["nMatched"] += raw["n"]
+                        summary["nModified"] += raw["nModified"]
+                elif isinstance(op, (DeleteOne, DeleteMany)):
+                    summary["nRemoved"] += self._delete(op._filter, multi=isinstance(op, DeleteMany))
+                else:
+                    raise OperationFailure(f"Unsupported bulk operation {type(op).__name__} in memory backend")
+            except DuplicateKeyError as e:
+                summary["writeErrors"].append({"index": index, "code": 11000, "errmsg": str(e), "op": getattr(op, "_doc", None)})
+                if ordered:
+                    break
+        if summary["writeErrors"]:
+            raise BulkWriteError(summary)
+        return summary, inserted_ids
+
+    # Aggregation
+
+    def aggregate(self, pipeline: List[Dict[str, Any]], **kwargs) -> InMemoryCursor:
+        def load(sort_spec, skip_count, limit_count):
+            docs = [copy.deepcopy(doc) for doc in self._select(pipeline[0]["$match"])] if pipeline and "$match" in pipeline[0] else [
+                copy.deepcopy(doc) for doc in self._docs.values()]
+            for stage in pipeline[1:] if pipeline and "$match" in pipeline[0] else pipeline:
+                docs = self._run_stage(stage, docs)
+            return docs
+
+        return InMemoryCursor(load)
+
+    def _run_stage(self, stage: Dict[str, Any], docs: List[dict]) -> List[dict]:
+        name, spec = next(iter(stage.items()))
+        if name == "$match":
+            return [doc for doc in docs if matches(doc, spec)]
+        if name == "$sort":
+            return sort_documents(docs, spec.items())
+        if name == "$skip":
+            return docs[spec:]
+        if name == "$limit":
+            return docs[:spec]
+        if name == "$project":
+            return [project(doc, spec) for doc in docs]
+        if name in ("$addFields", "$set"):
+            for doc in docs:
+                for key, expr in spec.items():
+                    _set_path(doc, key, evaluate(expr, doc))
+            return docs
+        if name == "$unwind":
+            path = (spec if isinstance(spec, str) else spec["path"])[1:]
+            unwound = []
+            for doc in docs:
+                value = _get_path(doc, path)
+                if isinstance(value, list):
+                    for item in value:
+                        copy_doc = copy.deepcopy(doc)
+                        _set_path(copy_doc, path, item)
+                        unwound.append(copy_doc)
+                elif value is not _MISSING and value is not None:
+                    unwound.append(doc)
+            return unwound
+        if name == "$group":
+            groups: Dict[Any, dict] = {}
+            for doc in docs:
+                key = evaluate(spec["_id"], doc)
+                group_key = repr(key)
+                group = groups.setdefault(group_key, {"_id": key})
+                for field, accumulator in spec.items():
+                    if field == "_id":
+                        continue
+                    op, expr = next(iter(accumulator.items()))
+                    value = evaluate(expr, doc)
+                    if op == "$sum":
+                        group[field] = group.get(field, 0) + (value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0)
+                    elif op == "$first":
+                        group.setdefault(field, value)
+                    elif op == "$last":
+                        group[field] = value
+                    elif op == "$max":
+                        group[field] = value if field not in group or _sort_key(value) > _sort_key(group[field]) else group[field]
+                    elif op == "$min":
+                        group[field] = value if field not in group or _sort_key(value) < _sort_key(group[field]) else group[field]
+                    elif op == "$push":
+                        group.setdefault(field, []).append(value)
+                    else:
+                        raise OperationFailure(f"Unsupported accumulator {op} in memory backend")
+            return list(groups.values())
+        if name == "$replaceRoot":
+            return [evaluate(spec["newRoot"], doc) for doc in docs]
+        if name == "$count":
+            return [{spec: len(docs)}]
+        if name == "$lookup":
+            other = self.database[spec["from"]]
+            for doc in docs:
+                local = _get_path(doc, spec["localField"])
+                doc[spec["as"]] = [copy.deepcopy(d) for d in other._select({spec["foreignField"]: None if local is _MISSING else local})]
+            return docs
+        raise OperationFailure(f"Unsupported aggregation stage {name} in memory backend")
+
+
+class InMemoryDatabase:
+    def __init__(self, client: "InMemoryClient", name: str):
+        self.client = client
+        self.name = name
+        self._collections: Dict[str, InMemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> InMemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = InMemoryCollection(self, name)
+        return self._collections[name]
+
+    def __getattr__(self, name: str) -> InMemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    async def list_collection_names(self) -> List[str]:
+        return list(self._collections)
+
+    async def command(self, command, *args, **kwargs):
+        if command in ("ping", {"ping": 1}):
+            return {"ok": 1.0}
+        raise OperationFailure(f"Unsupported command {command} in memory backend")
+
+
+class InMemoryClient:
+    def __init__(self):
+        self._databases: Dict[str, InMemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> InMemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = InMemoryDatabase(self, name)
+        return self._databases[name]
+
+    def __getattr__(self, name: str) -> InMemoryDatabase:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    async def drop_database(self, name: str):
+        self._databases.pop(name, None)
+
+    def close(self):
+        pass
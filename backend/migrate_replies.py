@@ -0,0 +1,83 @@
+"""Move replies embedded in ``questions.replies`` into the ``replies`` collection.
+
+Each question that still has an embedded array gets its replies copied into
+``replies`` (tagged with ``question_id``), the embedded count folded into
+``reply_count`` and the embedded array removed. Safe to re-run: replies are
+keyed by their unique ``id`` so already-copied ones are skipped.
+
+    python migrate_replies.py
+    python migrate_replies.py --dry-run
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from pymongo.errors import BulkWriteError
+
+DUPLICATE_KEY = 11000
+
+
+async def migrate_question(db, question: dict) -> int:
+    replies = [dict(reply, question_id=question["id"]) for reply in question.get("replies", [])]
+    if replies:
+        try:
+            await db.replies.insert_many(replies, ordered=False)
+        except BulkWriteError as e:
+            if any(err["code"] != DUPLICATE_KEY for err in e.details.get("writeErrors", [])):
+                raise
+    # Fold the embedded replies into the counter in one atomic pipeline update,
+    # so replies added concurrently through the API are never lost
+    await db.questions.update_one(
+        {"id": question["id"], "replies": {"$exists": True}},
+        [
+            {"$set": {"reply_count": {"$add": [{"$ifNull": ["$reply_count", 0]}, {"$size": "$replies"}]}}},
+            {"$unset": "replies"},
+        ],
+    )
+    return len(replies)
+
+
+async def migrate_replies(db, dry_run: bool = False) -> dict:
+    stats = {"questions": 0, "replies": 0}
+    start = time.perf_counter()
+    async for question in db.questions.find({"replies": {"$exists": True}}, {"_id": 0, "id": 1, "replies": 1}):
+        if dry_run:
+            moved = len(question.get("replies", []))
+        else:
+            moved = await migrate_question(db, question)
+        stats["questions"] += 1
+        stats["replies"] += moved
+        if stats["questions"] % 100 == 0:
+            print(f"{stats['questions']} questions, {stats['replies']} replies migrated")
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+async def main():
+    from dotenv import load_dotenv
+
+    from indexes import ensure_indexes
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="count what would move without writing")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+    # Imported after load_dotenv so STORAGE_BACKEND from .env applies
+    from storage import create_client, database_name
+
+    client = create_client()
+    db = client[database_name()]
+    try:
+        if not args.dry_run:
+            # Re-runs skip copied replies only because of the unique replies.id index
+            await ensure_indexes(db)
+        stats = await migrate_replies(db, dry_run=args.dry_run)
+        print(f"Done: {stats}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""Convert ISO-string ``created_at`` values to native BSON dates.
+
+Runs online, against a live database, one collection at a time:
+
+* Newest documents first. BSON orders every string before every date, so
+  while both types coexist each remaining string must be older than each
+  date for ``created_at`` sorts to stay chronological. New writes are dates
+  and the newest strings convert first, which keeps that true throughout
+  (``pagination.timestamp_keyset_filter`` relies on it).
+* Batches of unordered ``UpdateOne`` operations, each conditional on the
+  value still being the string that was read, so a concurrent write is never
+  overwritten. ``--pause`` spaces batches out to limit load on the primary.
+* Safe to re-run: only string values are selected.
+
+Replies still embedded in ``questions.replies`` keep their strings (the API
+renders both forms the same). Run migrate_replies.py first, or re-run this
+afterwards, to convert them in the ``replies`` collection.
+
+    python migrate_timestamps.py
+    python migrate_timestamps.py --collections questions replies --batch-size 500 --pause 0.2
+    python migrate_timestamps.py --dry-run
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pymongo import UpdateOne
+
+from timestamps import parse_timestamp
+
+FIELD = "created_at"
+COLLECTIONS = ("users", "bookmarks", "quiz_responses", "latest_quiz_results", "questions", "replies")
+
+
+async def migrate_collection(
+    collection,
+    batch_size: int = 1000,
+    pause: float = 0.0,
+    dry_run: bool = False,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    stats = {"collection": collection.name, "scanned": 0, "converted": 0, "invalid": 0, "seconds": 0.0}
+    start = time.perf_counter()
+
+    async def flush(operations: List[UpdateOne]):
+        if dry_run:
+            stats["converted"] += len(operations)
+        elif operations:
+            result = await collection.bulk_write(operations, ordered=False)
+            stats["converted"] += result.modified_count
+        stats["seconds"] = round(time.perf_counter() - start, 3)
+        if progress:
+            progress(dict(stats))
+        if pause:
+            await asyncio.sleep(pause)
+
+    cursor = collection.find({FIELD: {"$type": "string"}}, {"_id": 1, FIELD: 1}, allow_disk_use=True)
+    cursor = cursor.sort(FIELD, -1).batch_size(batch_size)
+    operations = []
+    async for doc in cursor:
+        stats["scanned"] += 1
+        try:
+            value = parse_timestamp(doc[FIELD])
+        except ValueError:
+            stats["invalid"] += 1
+            continue
+        operations.append(UpdateOne({"_id": doc["_id"], FIELD: doc[FIELD]}, {"$set": {FIELD: value}}))
+        if len(operations) >= batch_size:
+            await flush(operations)
+            operations = []
+    await flush(operations)
+    return stats
+
+
+async def migrate_timestamps(db, collections: Iterable[str] = COLLECTIONS, **options) -> List[Dict[str, Any]]:
+    return [await migrate_collection(db[name], **options) for name in collections]
+
+
+async def main():
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--collections", nargs="+", choices=COLLECTIONS, default=list(COLLECTIONS))
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between batches")
+    parser.add_argument("--dry-run", action="store_true", help="count what would convert without writing")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+    # Imported after load_dotenv so STORAGE_BACKEND from .env applies
+    from storage import create_client, database_name
+
+    client = create_client()
+    db = client[database_name()]
+    try:
+        results = await migrate_timestamps(
+            db, args.collections, batch_size=args.batch_size, pause=args.pause, dry_run=args.dry_run,
+            progress=lambda s: print(f"{s['collection']}: {s['converted']} converted, {s['invalid']} invalid"),
+        )
+        for stats in results:
+            print(f"Done: {stats}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
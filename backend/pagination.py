@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+
+def _encode_value(value: Any) -> Any:
+    # Datetimes must come back as datetimes to compare against BSON dates
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    return str(value)
+
+
+def _decode_value(obj: dict) -> Any:
+    if obj.keys() == {"$date"}:
+        return datetime.fromisoformat(obj["$date"])
+    return obj
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque, URL-safe cursor for the sort key of the last item on a page."""
+    raw = json.dumps(values, separators=(",", ":"), default=_encode_value).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> Tuple[Any, ...]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw, object_hook=_decode_value)
+    except (ValueError, TypeError):
+        raise ValueError("Malformed cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Malformed cursor")
+    # Values end up in query filters, so anything else (e.g. {"$ne": null})
+    # could inject operators
+    if any(isinstance(value, bool) or not isinstance(value, (str, int, float, datetime)) for value in values):
+        raise ValueError("Malformed cursor")
+    return tuple(values)
+
+
+def keyset_filter(field: str, value: Any, tiebreak_value: Any, descending: bool, tiebreak_field: str = "id") -> Dict[str, Any]:
+    """Mongo filter selecting documents strictly after (field, tiebreak) in sort order."""
+    op = "$lt" if descending else "$gt"
+    return {"$or": [
+        {field: {op: value}},
+        {field: value, tiebreak_field: {op: tiebreak_value}},
+    ]}
+
+
+def timestamp_keyset_filter(field: str, value: Any, tiebreak_value: Any, descending: bool, tiebreak_field: str = "id") -> Dict[str, Any]:
+    """``keyset_filter`` for a timestamp field that may still hold legacy ISO strings.
+
+    BSON orders every string before every date. migrate_timestamps.py
+    converts newest first, so while both types coexist each string is older
+    than each date and the sort stays chronological. The extra clause carries
+    a page across the string/date boundary, which a plain range cannot.
+    """
+    query = keyset_filter(field, value, tiebreak_value, descending, tiebreak_field)
+    if descending and isinstance(value, datetime):
+        query["$or"].append({field: {"$type": "string"}})
+    elif not descending and isinstance(value, str):
+        query["$or"].append({field: {"$type": "date"}})
+    return query
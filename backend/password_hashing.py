@@ -0,0 +1,122 @@
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple
+
+from passlib.context import CryptContext
+
+# Module level so process pool workers build their own context on import
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+class PasswordHasherOverloaded(Exception):
+    """Raised when the password pool already has too much work queued."""
+
+
+def _timed_call(func: Callable, *args) -> Tuple[Any, float]:
+    # Wall clock is used so the start time is comparable across processes.
+    # Taken before the call, so queue wait excludes the hashing itself.
+    started = time.time()
+    return func(*args), started
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs bcrypt work on a bounded executor so it never blocks the event loop.
+
+    At most ``max_workers + max_queue`` jobs are accepted at once; anything
+    beyond that is rejected with ``PasswordHasherOverloaded`` so callers can
+    shed load instead of building an unbounded backlog.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 64, kind: str = "thread", sample_size: int = 1024):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown password executor kind: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: Executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._queue_wait_total = 0.0
+        self._queue_waits = deque(maxlen=sample_size)
+
+    @classmethod
+    def from_env(cls) -> "PasswordHasher":
+        return cls(
+            max_workers=int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 2)),
+            max_queue=int(os.environ.get('PASSWORD_HASH_QUEUE_LIMIT', '64')),
+            kind=os.environ.get('PASSWORD_HASH_EXECUTOR', 'thread'),
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password")
+        return self._executor
+
+    async def _run(self, func: Callable, *args):
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHasherOverloaded("Password hashing queue is full")
+            self._pending += 1
+            self._submitted += 1
+        submitted_at = time.time()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at = await loop.run_in_executor(self._get_executor(), _timed_call, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+        wait = max(started_at - submitted_at, 0.0)
+        with self._lock:
+            self._completed += 1
+            self._queue_wait_total += wait
+            self._queue_waits.append(wait)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._queue_waits)
+            completed = self._completed
+            stats = {
+                "executor": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "submitted": self._submitted,
+                "completed": completed,
+                "rejected": self._rejected,
+                "queue_wait_avg_ms": round(self._queue_wait_total / completed * 1000, 3) if completed else 0.0,
+            }
+        for label, q in (("p50", 0.50), ("p99", 0.99)):
+            stats[f"queue_wait_{label}_ms"] = round(waits[min(int(len(waits) * q), len(waits) - 1)] * 1000, 3) if waits else 0.0
+        stats["queue_wait_max_ms"] = round(waits[-1] * 1000, 3) if waits else 0.0
+        return stats
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,106 @@
+"""Opt-in cProfile capture for slow requests.
+
+Profiling is enabled for every request with ``PROFILE_REQUESTS=true`` (with
+``PROFILE_SAMPLE_RATE`` controlling the fraction profiled), or for a single
+request by sending ``X-Profile: <ADMIN_TOKEN>``. A profiled request slower
+than ``PROFILE_THRESHOLD_MS`` (forced requests are always kept) is written to
+``PROFILE_DIR`` as a pstats file, plus a JSON file with the route and timings:
+
+    python -m pstats profiles/20261017T101500_POST_api-quiz-submit_412ms.prof
+
+Only one request is profiled at a time because cProfile hooks the whole
+interpreter; other requests on the event loop may show up in the profile
+while they interleave with it.
+"""
+import asyncio
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    def __init__(self, app, output_dir: str, threshold_ms: float = 200.0, always: bool = False,
+                 sample_rate: float = 1.0, admin_token: Optional[str] = None):
+        self.app = app
+        self.output_dir = Path(output_dir)
+        self.threshold = threshold_ms / 1000
+        self.always = always
+        self.sample_rate = sample_rate
+        self.admin_token = admin_token.encode() if admin_token else None
+        self._busy = False
+
+    @classmethod
+    def enabled_by_env(cls, admin_token: Optional[str]) -> bool:
+        return os.environ.get('PROFILE_REQUESTS', 'false').lower() == 'true' or bool(admin_token)
+
+    @classmethod
+    def options_from_env(cls, admin_token: Optional[str]) -> dict:
+        return {
+            "output_dir": os.environ.get('PROFILE_DIR', str(Path(__file__).parent / 'profiles')),
+            "threshold_ms": float(os.environ.get('PROFILE_THRESHOLD_MS', '200')),
+            "always": os.environ.get('PROFILE_REQUESTS', 'false').lower() == 'true',
+            "sample_rate": float(os.environ.get('PROFILE_SAMPLE_RATE', '1.0')),
+            "admin_token": admin_token,
+        }
+
+    def _forced(self, scope) -> bool:
+        if self.admin_token is None:
+            return False
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                return secrets.compare_digest(value, self.admin_token)
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._busy:
+            await self.app(scope, receive, send)
+            return
+        forced = self._forced(scope)
+        if not forced and not (self.always and random.random() < self.sample_rate):
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self._busy = False
+            elapsed = time.perf_counter() - start
+            if forced or elapsed >= self.threshold:
+                route = scope.get("route")
+                route_path = route.path if route is not None else scope["path"]
+                try:
+                    await asyncio.to_thread(self._write, profiler, scope["method"], route_path, scope["path"], elapsed, forced)
+                except OSError:
+                    logger.exception("Could not write request profile")
+
+    def _write(self, profiler: cProfile.Profile, method: str, route: str, path: str, elapsed: float, forced: bool):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(timezone.utc)
+        slug = re.sub(r"[^A-Za-z0-9]+", "-", route).strip("-") or "root"
+        stem = f"{timestamp.strftime('%Y%m%dT%H%M%S%f')}_{method}_{slug}_{elapsed * 1000:.0f}ms"
+        profiler.dump_stats(self.output_dir / f"{stem}.prof")
+        (self.output_dir / f"{stem}.json").write_text(json.dumps({
+            "method": method,
+            "route": route,
+            "path": path,
+            "duration_ms": round(elapsed * 1000, 3),
+            "threshold_ms": self.threshold * 1000,
+            "forced": forced,
+            "captured_at": timestamp.isoformat(),
+        }, indent=2))
+        logger.info("Profiled %s %s in %.1fms -> %s.prof", method, route, elapsed * 1000, stem)
@@ -0,0 +1,193 @@
+"""Relevance search over Q&A threads: titles, descriptions and reply content.
+
+Two interchangeable backends, chosen with ``QUESTION_SEARCH_BACKEND``:
+
+* ``mongo``: ``$text`` queries against the ``text_search`` indexes on
+  ``questions`` (title, description, embedded replies) and ``replies``. Reply
+  hits are folded into their question's score with ``REPLY_WEIGHT``.
+* ``local``: an in-process inverted index built at startup and kept current
+  by the write endpoints. It is the default with ``STORAGE_BACKEND=memory``,
+  which has no text index. The index only sees writes made by this process,
+  so it is not meant for multi-worker deployments.
+
+Both return ``(score, question_id)`` pairs, best first, capped at
+``SEARCH_CANDIDATES``; the endpoint paginates over that ranking.
+"""
+import heapq
+import math
+import os
+import re
+from typing import Dict, Iterable, List, Tuple
+
+from pymongo.errors import OperationFailure
+
+SEARCH_CANDIDATES = 1000
+# A reply mentioning the terms counts for less than the question itself
+REPLY_WEIGHT = 0.3
+FIELD_WEIGHTS = {"title": 10.0, "description": 4.0, "reply": 1.0}
+# Similar-question lookups use at most this many words of the draft and
+# drop hits scoring below this fraction of the best one
+SIMILAR_QUERY_TERMS = 32
+SIMILAR_MIN_RELATIVE_SCORE = 0.3
+
+STOPWORDS = frozenset(
+    "a about an and any are as at be but by can do does for from how i if in into is it me my of on or "
+    "should so than that the their there this to was what when where which who why will with would you your".split()
+)
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+Hit = Tuple[float, str]
+
+
+def _stem(token: str) -> str:
+    # Plural folding only, so "clubs" finds "club" as Mongo's stemmer would
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    return [_stem(token) for token in _TOKEN_RE.findall((text or "").lower()) if token not in STOPWORDS]
+
+
+def similar_query(title: str, description: str = "") -> str:
+    # The title twice: it says more about the topic than the body does
+    return " ".join((tokenize(title) * 2 + tokenize(description))[:SIMILAR_QUERY_TERMS])
+
+
+def strong_hits(hits: List[Hit], limit: int) -> List[Hit]:
+    if not hits:
+        return []
+    floor = hits[0][0] * SIMILAR_MIN_RELATIVE_SCORE
+    return [hit for hit in hits[:limit] if hit[0] >= floor]
+
+
+class SearchUnavailable(Exception):
+    """The backend cannot answer queries yet, e.g. the text index is still missing."""
+
+
+class MongoQuestionSearch:
+    def __init__(self, db):
+        self.db = db
+
+    async def start(self):
+        pass
+
+    async def search(self, query: str, limit: int = SEARCH_CANDIDATES) -> List[Hit]:
+        if not tokenize(query):
+            return []
+        text = {"$text": {"$search": query}}
+        try:
+            questions = await self.db.questions.aggregate([
+                {"$match": text},
+                {"$project": {"_id": 0, "id": 1, "score": {"$meta": "textScore"}}},
+                {"$sort": {"score": -1}},
+                {"$limit": limit},
+            ]).to_list(limit)
+            replies = await self.db.replies.aggregate([
+                {"$match": text},
+                {"$project": {"_id": 0, "question_id": 1, "score": {"$meta": "textScore"}}},
+                {"$group": {"_id": "$question_id", "score": {"$sum": "$score"}}},
+                {"$sort": {"score": -1}},
+                {"$limit": limit},
+            ]).to_list(limit)
+        except OperationFailure as e:
+            raise SearchUnavailable(str(e)) from e
+        scores: Dict[str, float] = {q["id"]: q["score"] for q in questions}
+        for row in replies:
+            scores[row["_id"]] = scores.get(row["_id"], 0.0) + REPLY_WEIGHT * row["score"]
+        return heapq.nsmallest(limit, ((score, question_id) for question_id, score in scores.items()),
+                               key=lambda hit: (-hit[0], hit[1]))
+
+    # Mongo maintains its own indexes
+    def question_added(self, question: dict):
+        pass
+
+    def reply_added(self, question_id: str, content: str):
+        pass
+
+    def question_removed(self, question_id: str):
+        pass
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": "mongo"}
+
+
+class LocalQuestionSearch:
+    """Inverted index: token -> question id -> weighted term frequency.
+
+    Scores are BM25-style: per-term frequency saturates, rarer terms weigh
+    more. ``tokenize`` folds plurals, so "clubs" matches "club", but there
+    is no further stemming ("joining" and "join" stay different terms).
+    """
+
+    K1 = 1.2
+
+    def __init__(self, db):
+        self.db = db
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._terms: Dict[str, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    async def start(self, batch_size: int = 1000):
+        """(Re)build from the database, including replies still embedded in questions."""
+        self._postings.clear()
+        self._terms.clear()
+        async for question in self.db.questions.find({}, {"_id": 0, "id": 1, "title": 1, "description": 1, "replies.content": 1}).batch_size(batch_size):
+            self.question_added(question)
+            for reply in question.get("replies", []):
+                self.reply_added(question["id"], reply.get("content", ""))
+        async for reply in self.db.replies.find({}, {"_id": 0, "question_id": 1, "content": 1}).batch_size(batch_size):
+            self.reply_added(reply["question_id"], reply.get("content", ""))
+
+    def _add_terms(self, question_id: str, tokens: Iterable[str], weight: float):
+        terms = self._terms.get(question_id)
+        if terms is None:
+            return
+        for token in tokens:
+            terms[token] = terms.get(token, 0.0) + weight
+            self._postings.setdefault(token, {})[question_id] = terms[token]
+
+    def question_added(self, question: dict):
+        self._terms.setdefault(question["id"], {})
+        self._add_terms(question["id"], tokenize(question.get("title", "")), FIELD_WEIGHTS["title"])
+        self._add_terms(question["id"], tokenize(question.get("description", "")), FIELD_WEIGHTS["description"])
+
+    def reply_added(self, question_id: str, content: str):
+        self._add_terms(question_id, tokenize(content), FIELD_WEIGHTS["reply"])
+
+    def question_removed(self, question_id: str):
+        for token in self._terms.pop(question_id, {}):
+            posting = self._postings[token]
+            del posting[question_id]
+            if not posting:
+                del self._postings[token]
+
+    async def search(self, query: str, limit: int = SEARCH_CANDIDATES) -> List[Hit]:
+        total = len(self._terms)
+        scores: Dict[str, float] = {}
+        for token in set(tokenize(query)):
+            posting = self._postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (total - len(posting) + 0.5) / (len(posting) + 0.5))
+            for question_id, frequency in posting.items():
+                scores[question_id] = scores.get(question_id, 0.0) + idf * frequency * (self.K1 + 1) / (frequency + self.K1)
+        return heapq.nsmallest(limit, ((score, question_id) for question_id, score in scores.items()),
+                               key=lambda hit: (-hit[0], hit[1]))
+
+    def stats(self) -> Dict[str, object]:
+        return {"backend": "local", "questions": len(self._terms), "terms": len(self._postings)}
+
+
+def create_question_search(db, memory_storage: bool = False):
+    backend = os.environ.get('QUESTION_SEARCH_BACKEND', 'local' if memory_storage else 'mongo').lower()
+    if backend == 'local':
+        return LocalQuestionSearch(db)
+    if backend != 'mongo':
+        raise ValueError(f"Unknown QUESTION_SEARCH_BACKEND {backend!r}; expected 'mongo' or 'local'")
+    return MongoQuestionSearch(db)
@@ -0,0 +1,169 @@
+from typing import Dict, Tuple, Union
+
+# Quiz questions and algorithm
+QUIZ_QUESTIONS = [
+    {
+        "id": 1,
+        "question": "How do you prefer to spend your free time?",
+        "options": [
+            {"text": "Coding or building tech projects", "weights": {"technical": 3, "creative": 1}},
+            {"text": "Creating art, music, or performing", "weights": {"creative": 3, "social": 1}},
+            {"text": "Playing sports or exercising", "weights": {"sports": 3, "teamwork": 2}},
+            {"text": "Reading, writing, or debating", "weights": {"literary": 3, "communication": 2}}
+        ]
+    },
+    {
+        "id": 2,
+        "question": "What motivates you the most?",
+        "options": [
+            {"text": "Solving complex problems", "weights": {"technical": 3, "analytical": 2}},
+            {"text": "Expressing myself creatively", "weights": {"creative": 3, "independent": 1}},
+            {"text": "Competing and winning", "weights": {"competitive": 3, "sports": 2}},
+            {"text": "Making a social impact", "weights": {"social": 3, "leadership": 2}}
+        ]
+    },
+    {
+        "id": 3,
+        "question": "How do you work best?",
+        "options": [
+            {"text": "Independently with clear goals", "weights": {"independent": 3, "technical": 1}},
+            {"text": "In a team with collaborative energy", "weights": {"teamwork": 3, "social": 2}},
+            {"text": "Leading and organizing others", "weights": {"leadership": 3, "management": 2}},
+            {"text": "Flexible, adapting to situations", "weights": {"adaptable": 2, "creative": 1}}
+        ]
+    },
+    {
+        "id": 4,
+        "question": "What kind of events excite you?",
+        "options": [
+            {"text": "Hackathons and tech competitions", "weights": {"technical": 3, "competitive": 2}},
+            {"text": "Cultural festivals and performances", "weights": {"creative": 3, "social": 2}},
+            {"text": "Sports tournaments", "weights": {"sports": 3, "competitive": 2}},
+            {"text": "Debates and literary events", "weights": {"literary": 3, "communication": 2}}
+        ]
+    },
+    {
+        "id": 5,
+        "question": "How much time can you commit weekly?",
+        "options": [
+            {"text": "2-4 hours (Light commitment)", "weights": {"time_light": 3}},
+            {"text": "5-8 hours (Moderate commitment)", "weights": {"time_moderate": 3}},
+            {"text": "9-12 hours (High commitment)", "weights": {"time_high": 3}},
+            {"text": "12+ hours (Very high commitment)", "weights": {"time_very_high": 3}}
+        ]
+    },
+    {
+        "id": 6,
+        "question": "Are you more introverted or extroverted?",
+        "options": [
+            {"text": "Very introverted - prefer working alone", "weights": {"introvert": 3, "technical": 1}},
+            {"text": "Somewhat introverted", "weights": {"introvert": 2}},
+            {"text": "Somewhat extroverted", "weights": {"extrovert": 2, "social": 1}},
+            {"text": "Very extroverted - love social interactions", "weights": {"extrovert": 3, "social": 2}}
+        ]
+    },
+    {
+        "id": 7,
+        "question": "What skills do you want to develop?",
+        "options": [
+            {"text": "Programming and technical skills", "weights": {"technical": 3}},
+            {"text": "Creative and artistic skills", "weights": {"creative": 3}},
+            {"text": "Leadership and management", "weights": {"leadership": 3, "management": 2}},
+            {"text": "Communication and public speaking", "weights": {"communication": 3, "social": 1}}
+        ]
+    },
+    {
+        "id": 8,
+        "question": "How competitive are you?",
+        "options": [
+            {"text": "Very competitive - I love challenges", "weights": {"competitive": 3, "sports": 1}},
+            {"text": "Moderately competitive", "weights": {"competitive": 2}},
+            {"text": "Not very competitive", "weights": {"collaborative": 2}},
+            {"text": "I prefer collaboration over competition", "weights": {"collaborative": 3, "teamwork": 2}}
+        ]
+    },
+    {
+        "id": 9,
+        "question": "What's your approach to learning?",
+        "options": [
+            {"text": "Hands-on experimentation", "weights": {"technical": 2, "practical": 3}},
+            {"text": "Creative exploration", "weights": {"creative": 3, "independent": 1}},
+            {"text": "Structured guidance", "weights": {"analytical": 2, "management": 1}},
+            {"text": "Discussion and debate", "weights": {"communication": 3, "literary": 2}}
+        ]
+    },
+    {
+        "id": 10,
+        "question": "What kind of projects interest you?",
+        "options": [
+            {"text": "Building apps, robots, or tech solutions", "weights": {"technical": 3, "practical": 2}},
+            {"text": "Creating art, music, or performances", "weights": {"creative": 3, "social": 1}},
+            {"text": "Organizing events or campaigns", "weights": {"management": 3, "leadership": 2}},
+            {"text": "Writing, research, or advocacy", "weights": {"literary": 3, "social": 2}}
+        ]
+    }
+]
+
+def compile_scoring_table(questions) -> Dict[Tuple[int, Union[str, int]], Tuple[Tuple[str, int], ...]]:
+    """Map (question id, option text) and (question id, option index) to the option's trait weights."""
+    table = {}
+    for question in questions:
+        for index, option in enumerate(question["options"]):
+            weights = tuple(option["weights"].items())
+            table[(question["id"], option["text"])] = weights
+            table[(question["id"], index)] = weights
+    return table
+
+# Compiled once at import so scoring is a single dict lookup per answer
+SCORING_TABLE = compile_scoring_table(QUIZ_QUESTIONS)
+
+def score_answers(answers) -> Dict[str, int]:
+    """Sum the trait weights of the selected options; unknown questions or options are ignored."""
+    scores = {}
+    lookup = SCORING_TABLE.get
+    for answer in answers:
+        weights = lookup((answer.question_id, answer.answer))
+        if weights:
+            for trait, weight in weights:
+                scores[trait] = scores.get(trait, 0) + weight
+    return scores
+
+def calculate_quiz_result(answers) -> Tuple[str, str, Dict[str, int]]:
+    scores = score_answers(answers)
+    
+    # Determine personality type based on dominant traits
+    personality_type = ""
+    personality_description = ""
+    
+    technical_score = scores.get("technical", 0)
+    creative_score = scores.get("creative", 0)
+    sports_score = scores.get("sports", 0)
+    social_score = scores.get("social", 0)
+    literary_score = scores.get("literary", 0)
+    leadership_score = scores.get("leadership", 0)
+    
+    max_score = max(technical_score, creative_score, sports_score, social_score, literary_score, leadership_score)
+    
+    if technical_score == max_score:
+        personality_type = "Tech Explorer 🚀"
+        personality_description = "You're a problem solver who loves building and creating with technology. Technical clubs will help you thrive!"
+    elif creative_score == max_score:
+        personality_type = "Creative Innovator 🎨"
+        personality_description = "You express yourself through art and creativity. Cultural and creative clubs are perfect for you!"
+    elif sports_score == max_score:
+        personality_type = "Athletic Champion 🏆"
+        personality_description = "You're competitive and love physical challenges. Sports clubs will channel your energy perfectly!"
+    elif social_score == max_score:
+        personality_type = "Social Changemaker 🌟"
+        personality_description = "You're passionate about people and making an impact. Social and community clubs suit you best!"
+    elif literary_score == max_score:
+        personality_type = "Literary Thinker 📚"
+        personality_description = "You love ideas, words, and meaningful discussions. Literary and debate clubs are your domain!"
+    elif leadership_score == max_score:
+        personality_type = "Natural Leader 👑"
+        personality_description = "You excel at organizing and leading others. Management and leadership clubs will polish your skills!"
+    else:
+        personality_type = "Versatile All-Rounder 🌈"
+        personality_description = "You have diverse interests and can thrive in multiple types of clubs. Explore different options!"
+    
+    return personality_type, personality_description, scores
@@ -0,0 +1,110 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Club domain -> (quiz trait it rewards, reason shown to the user)
+DOMAIN_TRAITS = {
+    "technical": ("technical", "strong technical interest"),
+    "cultural": ("creative", "creative mindset"),
+    "sports": ("sports", "athletic inclination"),
+    "management": ("leadership", "leadership qualities"),
+    "literary": ("literary", "literary interests"),
+    "social": ("social", "social consciousness"),
+}
+DOMAIN_THRESHOLD = 5
+DOMAIN_MULTIPLIER = 10
+
+# Personality traits that add a flat bonus to every club
+TRAIT_BONUSES = (
+    ("competitive", 20, "competitive spirit"),
+    ("teamwork", 15, "team player"),
+    ("communication", 15, "strong communication skills"),
+)
+BONUS_THRESHOLD = 4
+
+TRAITS = tuple(sorted({trait for trait, _ in DOMAIN_TRAITS.values()}))
+TRAIT_INDEX = {trait: i for i, trait in enumerate(TRAITS)}
+
+
+def trait_vectors(score_dicts: Sequence[Dict[str, int]]) -> np.ndarray:
+    """Users x traits matrix of domain trait scores, zeroed where they don't pass the threshold."""
+    vectors = np.array([[scores.get(trait, 0) for trait in TRAITS] for scores in score_dicts], dtype=np.float64).reshape(len(score_dicts), len(TRAITS))
+    vectors[vectors <= DOMAIN_THRESHOLD] = 0
+    return vectors
+
+
+def bonus_vector(score_dicts: Sequence[Dict[str, int]]) -> np.ndarray:
+    return np.array(
+        [sum(points for trait, points, _ in TRAIT_BONUSES if scores.get(trait, 0) > BONUS_THRESHOLD) for scores in score_dicts],
+        dtype=np.float64,
+    )
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first, ties broken by catalog position.
+
+    Equivalent to a stable descending sort truncated to k, but O(n): the k-th
+    largest value is found with a partition and only the survivors are sorted.
+    """
+    n = len(scores)
+    if n == 0 or k <= 0:
+        return np.empty(0, dtype=np.intp)
+    k = min(k, n)
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    equal = np.flatnonzero(scores == kth)[: k - len(above)]
+    candidates = np.concatenate([above, equal])
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+class RecommendationEngine:
+    """Scores quiz trait vectors against every club with one matrix product.
+
+    The club x trait matrix holds ``DOMAIN_MULTIPLIER`` in the column of the
+    trait each club's domain rewards, so ``matrix @ user_vector`` reproduces
+    the per-domain rule and the trait bonuses are added on top.
+    """
+
+    def __init__(self, clubs: List[dict]):
+        self.clubs = clubs
+        self.matrix = np.zeros((len(clubs), len(TRAITS)), dtype=np.float64)
+        self.domain_reasons: List[str] = []
+        self.domain_columns = np.full(len(clubs), -1, dtype=np.intp)
+        for i, club in enumerate(clubs):
+            trait, reason = DOMAIN_TRAITS.get(club["domain"].lower(), (None, None))
+            self.domain_reasons.append(reason)
+            if trait is not None:
+                self.domain_columns[i] = TRAIT_INDEX[trait]
+                self.matrix[i, TRAIT_INDEX[trait]] = DOMAIN_MULTIPLIER
+
+    def score(self, trait_matrix: np.ndarray, bonuses: np.ndarray) -> np.ndarray:
+        """Users x clubs match scores for a batch of users."""
+        return trait_matrix @ self.matrix.T + bonuses[:, None]
+
+    def recommend_many(self, score_dicts: Sequence[Dict[str, int]], k: int = 3) -> List[List[dict]]:
+        if not score_dicts:
+            return []
+        vectors = trait_vectors(score_dicts)
+        bonuses = bonus_vector(score_dicts)
+        match_scores = self.score(vectors, bonuses)
+        results = []
+        for row, scores in enumerate(score_dicts):
+            bonus_reasons = [reason for trait, _, reason in TRAIT_BONUSES if scores.get(trait, 0) > BONUS_THRESHOLD]
+            recommendations = []
+            for index in top_k(match_scores[row], k):
+                reasons = list(bonus_reasons)
+                column = self.domain_columns[index]
+                if column >= 0 and vectors[row, column] > 0:
+                    reasons.insert(0, self.domain_reasons[index])
+                club = self.clubs[index]
+                recommendations.append({
+                    "club_id": club["id"],
+                    "club_name": club["name"],
+                    "match_percentage": min(int(match_scores[row, index]), 95) + 5,
+                    "reason": f"You'd be great here because of your {', '.join(reasons[:2]) if reasons else 'diverse skills'}!",
+                })
+            results.append(recommendations)
+        return results
+
+    def recommend(self, scores: Dict[str, int], k: int = 3) -> List[dict]:
+        return self.recommend_many([scores], k)[0]
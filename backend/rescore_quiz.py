@@ -0,0 +1,114 @@
+"""Re-score every stored quiz response with the current weights.
+
+Streams ``db.quiz_responses`` through a cursor, recomputes the personality
+type and recommendations chunk by chunk (recommendations for a whole chunk
+come from one matrix product) and writes the results back with unordered
+bulk ``UpdateOne`` operations. ``latest_quiz_results`` is then rebuilt so the
+dashboard shows the new scores.
+
+    python rescore_quiz.py --chunk-size 2000
+    python rescore_quiz.py --dry-run
+"""
+import argparse
+import asyncio
+import logging
+import time
+from collections import namedtuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pymongo import UpdateOne
+
+from latest_quiz_results import backfill_latest_quiz_results
+from quiz import calculate_quiz_result
+from recommender import RecommendationEngine
+
+logger = logging.getLogger(__name__)
+
+StoredAnswer = namedtuple("StoredAnswer", ["question_id", "answer"])
+
+
+def _rescore_chunk(docs: List[dict], engine: RecommendationEngine) -> List[UpdateOne]:
+    results = [
+        calculate_quiz_result([StoredAnswer(a.get("question_id"), a.get("answer")) for a in doc.get("answers", [])])
+        for doc in docs
+    ]
+    recommendations = engine.recommend_many([scores for _, _, scores in results])
+    return [
+        UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {
+                "personality_type": personality_type,
+                "personality_description": personality_description,
+                "recommendations": recs,
+            }},
+        )
+        for doc, (personality_type, personality_description, _), recs in zip(docs, results, recommendations)
+    ]
+
+
+async def rescore_quiz_responses(
+    db,
+    engine: RecommendationEngine,
+    chunk_size: int = 1000,
+    dry_run: bool = False,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    stats = {"processed": 0, "modified": 0, "seconds": 0.0, "rows_per_second": 0.0, "dry_run": dry_run}
+    start = time.perf_counter()
+
+    async def flush(docs):
+        operations = _rescore_chunk(docs, engine)
+        if not dry_run:
+            result = await db.quiz_responses.bulk_write(operations, ordered=False)
+            stats["modified"] += result.modified_count
+        stats["processed"] += len(docs)
+        stats["seconds"] = round(time.perf_counter() - start, 3)
+        stats["rows_per_second"] = round(stats["processed"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+        if progress:
+            progress(dict(stats))
+
+    chunk = []
+    cursor = db.quiz_responses.find({}, {"_id": 1, "answers": 1}).batch_size(chunk_size)
+    async for doc in cursor:
+        chunk.append(doc)
+        if len(chunk) >= chunk_size:
+            await flush(chunk)
+            chunk = []
+    if chunk:
+        await flush(chunk)
+    return stats
+
+
+async def main():
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="score everything but write nothing")
+    args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    load_dotenv(Path(__file__).parent / '.env')
+    # Imported after load_dotenv so STORAGE_BACKEND from .env applies
+    from storage import create_client, database_name
+
+    client = create_client()
+    db = client[database_name()]
+    try:
+        clubs = await db.clubs.find({}, {"_id": 0}).to_list(None)
+        engine = RecommendationEngine(clubs)
+        stats = await rescore_quiz_responses(
+            db, engine, chunk_size=args.chunk_size, dry_run=args.dry_run,
+            progress=lambda s: print(f"{s['processed']} rescored ({s['rows_per_second']} rows/s)"),
+        )
+        if not args.dry_run:
+            stats["latest_results"] = await backfill_latest_quiz_results(db, batch_size=args.chunk_size)
+        print(f"Done: {stats}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
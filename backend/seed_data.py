@@ -1,17 +1,30 @@
+"""Seed the clubs collection, or generate a production-sized synthetic dataset.
+
+    python seed_data.py                      # the 15 real clubs below
+    python seed_data.py --synthetic --drop --clubs 5000 --users 100000 \
+        --bookmarks 2000000 --quiz-responses 1000000 --questions 20000 --replies 40
+
+Synthetic data is deterministic for a given --seed and is written with
+unordered insert_many batches, several in flight at once. Indexes are built
+after the load and the club counters are reconciled at the end. Every
+synthetic user's password is SYNTHETIC_PASSWORD.
+"""
+import argparse
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient # type: ignore
-import os
+import copy
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from dotenv import load_dotenv # type: ignore
 from pathlib import Path
 import uuid
 
+from timestamps import to_bson_precision
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
-
 CLUBS_DATA = [
     {
         "id": str(uuid.uuid4()),
@@ -210,17 +223,351 @@ CLUBS_DATA = [
     }
 ]
 
-async def seed_clubs():
-    print("Seeding clubs data...")
-    
+async def seed_clubs(db):
     # Clear existing clubs
     await db.clubs.delete_many({})
     
-    # Insert new clubs
-    await db.clubs.insert_many(CLUBS_DATA)
-    
-    print(f"Successfully seeded {len(CLUBS_DATA)} clubs!")
-    client.close()
+    # Insert new clubs (copies, since insert_many adds _id to what it is given)
+    await db.clubs.insert_many(copy.deepcopy(CLUBS_DATA))
+
+SYNTHETIC_PASSWORD = "synthetic-pass"
+SYNTHETIC_COLLECTIONS = ("clubs", "users", "bookmarks", "quiz_responses", "latest_quiz_results", "questions", "replies")
+SYNTHETIC_EPOCH = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+TIME_COMMITMENTS = sorted({club["time_commitment"] for club in CLUBS_DATA}) + ["1-2 hours/week", "15-20 hours/week"]
+RECRUITMENT_STATUSES = ["Open"] * 6 + ["Upcoming"] * 2 + ["Closed"]
+CHAPTER_NAMES = ["North Campus", "South Campus", "East Wing", "West Wing", "Hostel Block", "Evening", "Alumni", "Junior", "Open", "Advanced"]
+FILLER_WORDS = (
+    "workshop weekly meetup beginners mentorship competition project showcase seminar outreach "
+    "portfolio practice team fest collaboration networking guest talk field trip certification"
+).split()
+
+class SyntheticDataset:
+    """Lazily generates synthetic documents in batches; the same seed always yields the same data."""
+
+    def __init__(self, seed: int, clubs: int, users: int, bookmarks: int, quiz_responses: int,
+                 questions: int, replies: int, days: int = 365):
+        self.seed = seed
+        self.counts = {"clubs": clubs, "users": users, "bookmarks": bookmarks, "quiz_responses": quiz_responses, "questions": questions}
+        self.mean_replies = replies
+        self.span = timedelta(days=days)
+        self.club_ids = []
+        self.club_docs = []
+        self.user_ids = []
+
+    def _rng(self, name: str) -> random.Random:
+        # One stream per collection so changing one volume leaves the others untouched
+        return random.Random(f"{self.seed}:{name}")
+
+    @staticmethod
+    def _uuid(rng: random.Random) -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def _timestamp(self, rng: random.Random, position: float) -> datetime:
+        # Roughly increasing with position, jittered, across the configured span
+        offset = self.span * min(max(position + rng.uniform(-0.01, 0.01), 0.0), 1.0)
+        return to_bson_precision(SYNTHETIC_EPOCH + offset)
+
+    def _split(self, total: int, parts: int, rng: random.Random, cap: int):
+        # Heavy-tailed split of ``total`` across ``parts`` (a few very active users),
+        # with nobody above ``cap``; the overflow goes to everyone else
+        weights = [rng.paretovariate(1.5) for _ in range(parts)]
+        scale = total / sum(weights)
+        counts = [min(int(w * scale), cap) for w in weights]
+        order = sorted(range(parts), key=lambda i: -weights[i])
+        while sum(counts) < total:
+            remaining = total - sum(counts)
+            for i in order:
+                if counts[i] < cap:
+                    counts[i] += 1
+                    remaining -= 1
+                    if not remaining:
+                        break
+        return counts
+
+    def password_hash(self, password: str) -> str:
+        from password_hashing import pwd_context
+
+        # A salt derived from the seed keeps the users collection reproducible
+        rng = self._rng("password")
+        alphabet = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+        salt = "".join(rng.choice(alphabet) for _ in range(21)) + "."
+        return pwd_context.handler("bcrypt").using(salt=salt).hash(password)
+
+    def clubs(self, batch_size: int):
+        rng = self._rng("clubs")
+        batch = []
+        for i in range(self.counts["clubs"]):
+            template = CLUBS_DATA[i % len(CLUBS_DATA)]
+            chapter = CHAPTER_NAMES[(i // len(CLUBS_DATA)) % len(CHAPTER_NAMES)]
+            extra = " ".join(rng.sample(FILLER_WORDS, 4))
+            club = {
+                "id": self._uuid(rng),
+                "name": f"{template['name']} ({chapter} {i // (len(CLUBS_DATA) * len(CHAPTER_NAMES)) + 1})",
+                "description": f"{template['description']} Highlights: {extra}.",
+                "domain": template["domain"],
+                "skills": rng.sample(template["skills"], rng.randint(2, len(template["skills"]))),
+                "time_commitment": rng.choice(TIME_COMMITMENTS),
+                "recruitment_status": rng.choice(RECRUITMENT_STATUSES),
+                "contact": f"club{i}@college.edu",
+                "image_url": template["image_url"],
+                "tags": rng.sample(template["tags"], rng.randint(1, len(template["tags"]))) + rng.sample(FILLER_WORDS, 1),
+                "member_count": int(rng.lognormvariate(4, 0.8)),
+                "bookmark_count": 0,
+                "interest_count": 0,
+            }
+            self.club_ids.append(club["id"])
+            self.club_docs.append({"id": club["id"], "name": club["name"], "domain": club["domain"]})
+            batch.append(club)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def users(self, batch_size: int, password_hash: str):
+        rng = self._rng("users")
+        total = self.counts["users"]
+        batch = []
+        for i in range(total):
+            user = {
+                "id": self._uuid(rng),
+                "name": f"Synthetic User {i}",
+                "email": f"user{i}@synthetic.example.com",
+                "role": "senior" if rng.random() < 0.3 else "fresher",
+                "verified": rng.random() < 0.2,
+                "created_at": self._timestamp(rng, i / total),
+                "password": password_hash,
+            }
+            self.user_ids.append((user["id"], user["name"], user["role"], user["verified"]))
+            batch.append(user)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def bookmarks(self, batch_size: int):
+        rng = self._rng("bookmarks")
+        clubs = len(self.club_ids)
+        if not clubs or not self.user_ids:
+            return
+        # Popular clubs collect most bookmarks
+        cum_weights = []
+        running = 0.0
+        for rank in range(clubs):
+            running += 1 / (rank + 1) ** 0.8
+            cum_weights.append(running)
+        per_user = self._split(min(self.counts["bookmarks"], clubs * len(self.user_ids)), len(self.user_ids), rng, cap=clubs)
+        batch = []
+        for (user_id, *_), count in zip(self.user_ids, per_user):
+            chosen = set()
+            while len(chosen) < count:
+                chosen.update(rng.choices(range(clubs), cum_weights=cum_weights, k=count - len(chosen)))
+                if len(chosen) < count and count > clubs // 2:
+                    chosen.update(rng.sample(range(clubs), count - len(chosen)))
+            for index in sorted(chosen):
+                batch.append({
+                    "id": self._uuid(rng),
+                    "user_id": user_id,
+                    "club_id": self.club_ids[index],
+                    "created_at": self._timestamp(rng, rng.random()),
+                })
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def quiz_responses(self, batch_size: int):
+        from quiz import QUIZ_QUESTIONS, calculate_quiz_result
+        from recommender import RecommendationEngine
+
+        rng = self._rng("quiz_responses")
+        if not self.user_ids:
+            return
+        engine = RecommendationEngine(self.club_docs)
+        total = self.counts["quiz_responses"]
+        for start in range(0, total, batch_size):
+            rows = []
+            for i in range(start, min(start + batch_size, total)):
+                answers = [{"question_id": q["id"], "answer": rng.choice(q["options"])["text"]} for q in QUIZ_QUESTIONS]
+                personality_type, description, scores = calculate_quiz_result([SimpleNamespace(**a) for a in answers])
+                rows.append((answers, personality_type, description, scores, rng.choice(self.user_ids)[0], self._timestamp(rng, i / total)))
+            recommendations = engine.recommend_many([row[3] for row in rows], k=3) if self.club_docs else [[] for _ in rows]
+            yield [
+                {
+                    "id": self._uuid(rng),
+                    "user_id": user_id,
+                    "answers": answers,
+                    "personality_type": personality_type,
+                    "personality_description": description,
+                    "recommendations": recs,
+                    "created_at": created_at,
+                }
+                for (answers, personality_type, description, _, user_id, created_at), recs in zip(rows, recommendations)
+            ]
+
+    def questions_and_replies(self, batch_size: int):
+        """Yields ("questions" | "replies", batch); reply threads follow their question."""
+        rng = self._rng("questions")
+        if not self.user_ids:
+            return
+        total = self.counts["questions"]
+        questions, replies = [], []
+        for i in range(total):
+            author_id, author_name, author_role, _ = rng.choice(self.user_ids)
+            created_at = self._timestamp(rng, i / total)
+            question_id = self._uuid(rng)
+            # Long-tailed thread length around the requested mean
+            reply_count = min(int(rng.expovariate(1 / self.mean_replies)), self.mean_replies * 50) if self.mean_replies else 0
+            questions.append({
+                "id": question_id,
+                "title": f"Question {i} about {' '.join(rng.sample(FILLER_WORDS, 3))}",
+                "description": " ".join(rng.choices(FILLER_WORDS, k=rng.randint(10, 80))),
+                "user_id": author_id,
+                "user_name": author_name,
+                "user_role": author_role,
+                "is_anonymous": rng.random() < 0.2,
+                "reply_count": reply_count,
+                "created_at": created_at,
+            })
+            for n in range(reply_count):
+                replier_id, replier_name, replier_role, replier_verified = rng.choice(self.user_ids)
+                replies.append({
+                    "id": self._uuid(rng),
+                    "question_id": question_id,
+                    "content": " ".join(rng.choices(FILLER_WORDS, k=rng.randint(5, 40))),
+                    "user_id": replier_id,
+                    "user_name": replier_name,
+                    "user_role": replier_role,
+                    "user_verified": replier_verified,
+                    "created_at": created_at + timedelta(minutes=n + 1),
+                })
+                if len(replies) == batch_size:
+                    yield "replies", replies
+                    replies = []
+            if len(questions) == batch_size:
+                yield "questions", questions
+                questions = []
+        if questions:
+            yield "questions", questions
+        if replies:
+            yield "replies", replies
+
+class BatchWriter:
+    """Runs up to ``concurrency`` unordered insert_many calls at once and tallies throughput."""
+
+    def __init__(self, db, concurrency: int):
+        self.db = db
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.tasks = set()
+        self.inserted = {}
+        self.elapsed = {}
+
+    async def _insert(self, collection: str, batch):
+        try:
+            await self.db[collection].insert_many(batch, ordered=False)
+            self.inserted[collection] = self.inserted.get(collection, 0) + len(batch)
+        finally:
+            self.semaphore.release()
+
+    async def submit(self, collection: str, batch):
+        await self.semaphore.acquire()
+        task = asyncio.create_task(self._insert(collection, batch))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def drain(self):
+        await asyncio.gather(*list(self.tasks))
+
+    async def write_all(self, collection: str, batches):
+        start = time.perf_counter()
+        for batch in batches:
+            await self.submit(collection, batch)
+        await self.drain()
+        self.elapsed[collection] = time.perf_counter() - start
+        self.report(collection)
+
+    def report(self, collection: str):
+        count, seconds = self.inserted.get(collection, 0), self.elapsed.get(collection, 0.0)
+        rate = count / seconds if seconds else 0.0
+        print(f"{collection:<15} {count:>10} docs in {seconds:8.2f}s  {rate:>10.0f} docs/s")
+
+async def seed_synthetic(db, dataset: SyntheticDataset, batch_size: int = 5000, concurrency: int = 4):
+    from counters import reconcile_club_counters
+    from indexes import ensure_indexes
+    from latest_quiz_results import backfill_latest_quiz_results
+
+    writer = BatchWriter(db, concurrency)
+    started = time.perf_counter()
+    await writer.write_all("clubs", dataset.clubs(batch_size))
+    await writer.write_all("users", dataset.users(batch_size, dataset.password_hash(SYNTHETIC_PASSWORD)))
+    await writer.write_all("bookmarks", dataset.bookmarks(batch_size))
+    await writer.write_all("quiz_responses", dataset.quiz_responses(batch_size))
+
+    # Questions and replies are interleaved by the generator, so time them together
+    start = time.perf_counter()
+    for collection, batch in dataset.questions_and_replies(batch_size):
+        await writer.submit(collection, batch)
+    await writer.drain()
+    writer.elapsed["questions"] = writer.elapsed["replies"] = time.perf_counter() - start
+    writer.report("questions")
+    writer.report("replies")
+
+    # Building indexes once after the load is much faster than maintaining them per insert
+    start = time.perf_counter()
+    await ensure_indexes(db)
+    print(f"{'indexes':<15} built in {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    await reconcile_club_counters(db)
+    print(f"{'club counters':<15} reconciled in {time.perf_counter() - start:.2f}s")
+    start = time.perf_counter()
+    latest = await backfill_latest_quiz_results(db, batch_size=batch_size)
+    print(f"{'latest results':<15} {latest['written']:>10} docs in {time.perf_counter() - start:8.2f}s")
+
+    total = sum(writer.inserted.values())
+    elapsed = time.perf_counter() - started
+    print(f"Inserted {total} documents in {elapsed:.2f}s ({total / elapsed:.0f} docs/s overall)")
+    return dict(writer.inserted)
+
+async def main():
+    from storage import create_client, database_name
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--synthetic", action="store_true", help="generate synthetic data instead of the real clubs")
+    parser.add_argument("--drop", action="store_true", help="drop the synthetic collections first")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--clubs", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=100000)
+    parser.add_argument("--bookmarks", type=int, default=1000000, help="total bookmarks")
+    parser.add_argument("--quiz-responses", type=int, default=500000)
+    parser.add_argument("--questions", type=int, default=10000)
+    parser.add_argument("--replies", type=int, default=30, help="mean replies per question (long-tailed)")
+    parser.add_argument("--days", type=int, default=365, help="spread created_at over this many days")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=4, help="insert_many batches in flight")
+    args = parser.parse_args()
+
+    client = create_client()
+    db = client[database_name()]
+    try:
+        if not args.synthetic:
+            print("Seeding clubs data...")
+            await seed_clubs(db)
+            print(f"Successfully seeded {len(CLUBS_DATA)} clubs!")
+            return
+
+        if args.drop:
+            for name in SYNTHETIC_COLLECTIONS:
+                await db[name].drop()
+        elif await db.users.count_documents({}, limit=1):
+            parser.error("the database already has users; pass --drop to replace them")
+        dataset = SyntheticDataset(args.seed, args.clubs, args.users, args.bookmarks, args.quiz_responses,
+                                   args.questions, args.replies, args.days)
+        await seed_synthetic(db, dataset, args.batch_size, args.concurrency)
+    finally:
+        client.close()
 
 if __name__ == "__main__":
-    asyncio.run(seed_clubs())
+    asyncio.run(main())
@@ -1,34 +1,113 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
-from motor.motor_asyncio import AsyncIOMotorClient
+from starlette.responses import PlainTextResponse, StreamingResponse
+from pymongo import DeleteOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Union
 import uuid
+import secrets
 from datetime import datetime, timezone, timedelta
-from passlib.context import CryptContext
 import jwt
 from enum import Enum
+from cache import TTLCache
+from club_catalog import ClubCatalog
+from club_search import ClubSearchIndex
+from counters import BOOKMARK_COUNT, INTEREST_COUNT, CounterBuffer, reconcile_club_counters
+from events import (
+    FEED_TOPIC, ChangeStreamSource, EventBroker, TooManySubscribers, publish_question_created,
+    publish_question_deleted, publish_reply_added, question_topic, sse_stream,
+)
+from pagination import decode_cursor, encode_cursor, timestamp_keyset_filter
+from metrics import MetricsMiddleware, MongoCommandMetrics, registry as metrics_registry
+from profiling import ProfilingMiddleware
+from indexes import ensure_indexes, index_health
+from latest_quiz_results import backfill_latest_quiz_results, latest_result_document, record_latest_result
+from fast_json import FastJSONResponse, RawJSONResponse, dumps as json_dumps, json_array
+from http_cache import PrecomputedJSON, precomputed_response
+from question_search import SearchUnavailable, create_question_search, similar_query, strong_hits
+from quiz import QUIZ_QUESTIONS, calculate_quiz_result
+from recommender import RecommendationEngine
+from rescore_quiz import rescore_quiz_responses
+from password_hashing import PasswordHasher, PasswordHasherOverloaded
+from seed_data import seed_clubs
+from storage import create_client, database_name, is_memory_backend
+from timestamps import api_timestamp, utc_now
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
+# MongoDB connection, or the in-memory stand-in with STORAGE_BACKEND=memory
+client = create_client(event_listeners=[MongoCommandMetrics()])
+db = client[database_name()]
+
+# In-memory club catalog; seed_data.py is the only writer, so clubs are served
+# from memory and reloaded on an interval or via POST /api/admin/catalog/reload
+club_catalog = ClubCatalog(db.clubs, refresh_interval=float(os.environ.get('CLUB_CATALOG_REFRESH_SECONDS', '300')))
+
+# Bookmark/interest counters on clubs are coalesced in memory and flushed in batches;
+# the catalog picks the new totals up on its next refresh
+club_counters = CounterBuffer(db.clubs, flush_interval=float(os.environ.get('COUNTER_FLUSH_SECONDS', '5')))
+
+# Cache-Control for the read-only catalog endpoints; ETags let clients revalidate cheaply
+CATALOG_CACHE_CONTROL = f"public, max-age={int(os.environ.get('CATALOG_CACHE_MAX_AGE', '60'))}"
+QUIZ_CACHE_CONTROL = f"public, max-age={int(os.environ.get('QUIZ_CACHE_MAX_AGE', '3600'))}"
+
+# GET /metrics serves Prometheus text format; disable where it would be public
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'
+
+# Create missing indexes at startup; set to "false" where a DBA manages them
+ENSURE_INDEXES = os.environ.get('MONGO_ENSURE_INDEXES', 'true').lower() == 'true'
+
+# Q&A relevance search: Mongo text indexes, or an in-process index (QUESTION_SEARCH_BACKEND=local)
+question_search = create_question_search(db, memory_storage=is_memory_backend())
+
+# Live Q&A updates over SSE. Events are published in-process by the write
+# endpoints, or from MongoDB change streams with EVENTS_SOURCE=change_stream
+# (needed when several workers serve the API; replica sets only)
+EVENTS_SOURCE = os.environ.get('EVENTS_SOURCE', 'local').lower()
+if EVENTS_SOURCE not in ('local', 'change_stream'):
+    raise ValueError(f"Unknown EVENTS_SOURCE {EVENTS_SOURCE!r}; expected 'local' or 'change_stream'")
+if EVENTS_SOURCE == 'change_stream' and is_memory_backend():
+    raise ValueError("EVENTS_SOURCE=change_stream needs MongoDB, not STORAGE_BACKEND=memory")
+event_broker = EventBroker(
+    max_subscribers=int(os.environ.get('SSE_MAX_CONNECTIONS', '1000')),
+    queue_size=int(os.environ.get('SSE_QUEUE_SIZE', '100')),
+)
+SSE_HEARTBEAT_SECONDS = float(os.environ.get('SSE_HEARTBEAT_SECONDS', '15'))
+PUBLISH_LOCAL_EVENTS = EVENTS_SOURCE == 'local'
+
+# Admin endpoints are disabled unless ADMIN_TOKEN is set
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
 
 # JWT configuration
 SECRET_KEY = os.environ.get('JWT_SECRET_KEY', 'your-secret-key-change-in-production')
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Verified-token cache: token -> user document, so authenticated requests skip
+# both the JWT decode and the users lookup. The TTL bounds how stale a cached
+# user may be after an update that did not call invalidate_cached_user.
+user_cache = TTLCache(
+    max_size=int(os.environ.get('USER_CACHE_MAX_SIZE', '10000')),
+    ttl=float(os.environ.get('USER_CACHE_TTL_SECONDS', '60')),
+)
+
+# Latest quiz result per user id. Submissions refresh this worker's entry;
+# other workers may serve the previous result until the TTL expires.
+quiz_result_cache = TTLCache(
+    max_size=int(os.environ.get('QUIZ_RESULT_CACHE_MAX_SIZE', '10000')),
+    ttl=float(os.environ.get('QUIZ_RESULT_CACHE_TTL_SECONDS', '60')),
+)
+
+# Password hashing runs on a bounded pool so bcrypt never blocks the event loop
+password_hasher = PasswordHasher.from_env()
 security = HTTPBearer()
 
 app = FastAPI()
@@ -69,7 +148,7 @@ class User(BaseModel):
     email: EmailStr
     role: UserRole
     verified: bool = False
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
 
 class UserResponse(BaseModel):
     id: str
@@ -96,6 +175,8 @@ class Club(BaseModel):
     image_url: str
     tags: List[str] = []
     member_count: int = 0
+    bookmark_count: int = 0
+    interest_count: int = 0
 
 class ClubResponse(BaseModel):
     id: str
@@ -109,10 +190,13 @@ class ClubResponse(BaseModel):
     image_url: str
     tags: List[str]
     member_count: int
+    bookmark_count: int = 0
+    interest_count: int = 0
 
 class QuizAnswer(BaseModel):
     question_id: int
-    answer: str
+    # Either the option text or its zero-based index in the question's options
+    answer: Union[int, str]
 
 class QuizSubmission(BaseModel):
     answers: List[QuizAnswer]
@@ -136,17 +220,21 @@ class QuizResponse(BaseModel):
     personality_type: str
     personality_description: str
     recommendations: List[Dict[str, Any]]
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
 
 class BookmarkCreate(BaseModel):
     club_id: str
 
+class BookmarkBulkUpdate(BaseModel):
+    add: List[str] = []
+    remove: List[str] = []
+
 class Bookmark(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     user_id: str
     club_id: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
 
 # Q&A System Models
 class QuestionCreate(BaseModel):
@@ -165,7 +253,7 @@ class Reply(BaseModel):
     user_name: str
     user_role: str
     user_verified: bool
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utc_now)
 
 class Question(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -176,8 +264,30 @@ class Question(BaseModel):
     user_name: str
     user_role: str
     is_anonymous: bool = False
-    replies: List[Reply] = []
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    reply_count: int = 0
+    created_at: datetime = Field(default_factory=utc_now)
+
+class ReplyPage(BaseModel):
+    replies: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+class QuestionSummary(BaseModel):
+    id: str
+    title: str
+    description: str
+    user_id: str
+    user_name: str
+    user_role: str
+    is_anonymous: bool
+    reply_count: int
+    created_at: str
+
+class QuestionSearchHit(QuestionSummary):
+    score: float
+
+class SimilarQuestionsRequest(BaseModel):
+    title: str
+    description: str = ""
 
 class QuestionResponse(BaseModel):
     id: str
@@ -188,15 +298,24 @@ class QuestionResponse(BaseModel):
     user_role: str
     is_anonymous: bool
     replies: List[Dict[str, Any]]
+    # Set when the thread has more replies than the first page; continue with
+    # GET /questions/{id}/replies?cursor=
+    replies_next_cursor: Optional[str] = None
     reply_count: int
     created_at: str
 
 # Helper functions
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+async def hash_password_async(password: str) -> str:
+    try:
+        return await password_hasher.hash(password)
+    except PasswordHasherOverloaded:
+        raise HTTPException(status_code=503, detail="Server is busy, please retry shortly", headers={"Retry-After": "1"})
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return await password_hasher.verify(plain_password, hashed_password)
+    except PasswordHasherOverloaded:
+        raise HTTPException(status_code=503, detail="Server is busy, please retry shortly", headers={"Retry-After": "1"})
 
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
@@ -206,241 +325,41 @@ def create_access_token(data: dict) -> str:
     return encoded_jwt
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    token = credentials.credentials
+    user = user_cache.get(token)
+    if user is not None:
+        return user
+
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        
-        user = await db.users.find_one({"id": user_id}, {"_id": 0})
-        if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
-        return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-# Quiz questions and algorithm
-QUIZ_QUESTIONS = [
-    {
-        "id": 1,
-        "question": "How do you prefer to spend your free time?",
-        "options": [
-            {"text": "Coding or building tech projects", "weights": {"technical": 3, "creative": 1}},
-            {"text": "Creating art, music, or performing", "weights": {"creative": 3, "social": 1}},
-            {"text": "Playing sports or exercising", "weights": {"sports": 3, "teamwork": 2}},
-            {"text": "Reading, writing, or debating", "weights": {"literary": 3, "communication": 2}}
-        ]
-    },
-    {
-        "id": 2,
-        "question": "What motivates you the most?",
-        "options": [
-            {"text": "Solving complex problems", "weights": {"technical": 3, "analytical": 2}},
-            {"text": "Expressing myself creatively", "weights": {"creative": 3, "independent": 1}},
-            {"text": "Competing and winning", "weights": {"competitive": 3, "sports": 2}},
-            {"text": "Making a social impact", "weights": {"social": 3, "leadership": 2}}
-        ]
-    },
-    {
-        "id": 3,
-        "question": "How do you work best?",
-        "options": [
-            {"text": "Independently with clear goals", "weights": {"independent": 3, "technical": 1}},
-            {"text": "In a team with collaborative energy", "weights": {"teamwork": 3, "social": 2}},
-            {"text": "Leading and organizing others", "weights": {"leadership": 3, "management": 2}},
-            {"text": "Flexible, adapting to situations", "weights": {"adaptable": 2, "creative": 1}}
-        ]
-    },
-    {
-        "id": 4,
-        "question": "What kind of events excite you?",
-        "options": [
-            {"text": "Hackathons and tech competitions", "weights": {"technical": 3, "competitive": 2}},
-            {"text": "Cultural festivals and performances", "weights": {"creative": 3, "social": 2}},
-            {"text": "Sports tournaments", "weights": {"sports": 3, "competitive": 2}},
-            {"text": "Debates and literary events", "weights": {"literary": 3, "communication": 2}}
-        ]
-    },
-    {
-        "id": 5,
-        "question": "How much time can you commit weekly?",
-        "options": [
-            {"text": "2-4 hours (Light commitment)", "weights": {"time_light": 3}},
-            {"text": "5-8 hours (Moderate commitment)", "weights": {"time_moderate": 3}},
-            {"text": "9-12 hours (High commitment)", "weights": {"time_high": 3}},
-            {"text": "12+ hours (Very high commitment)", "weights": {"time_very_high": 3}}
-        ]
-    },
-    {
-        "id": 6,
-        "question": "Are you more introverted or extroverted?",
-        "options": [
-            {"text": "Very introverted - prefer working alone", "weights": {"introvert": 3, "technical": 1}},
-            {"text": "Somewhat introverted", "weights": {"introvert": 2}},
-            {"text": "Somewhat extroverted", "weights": {"extrovert": 2, "social": 1}},
-            {"text": "Very extroverted - love social interactions", "weights": {"extrovert": 3, "social": 2}}
-        ]
-    },
-    {
-        "id": 7,
-        "question": "What skills do you want to develop?",
-        "options": [
-            {"text": "Programming and technical skills", "weights": {"technical": 3}},
-            {"text": "Creative and artistic skills", "weights": {"creative": 3}},
-            {"text": "Leadership and management", "weights": {"leadership": 3, "management": 2}},
-            {"text": "Communication and public speaking", "weights": {"communication": 3, "social": 1}}
-        ]
-    },
-    {
-        "id": 8,
-        "question": "How competitive are you?",
-        "options": [
-            {"text": "Very competitive - I love challenges", "weights": {"competitive": 3, "sports": 1}},
-            {"text": "Moderately competitive", "weights": {"competitive": 2}},
-            {"text": "Not very competitive", "weights": {"collaborative": 2}},
-            {"text": "I prefer collaboration over competition", "weights": {"collaborative": 3, "teamwork": 2}}
-        ]
-    },
-    {
-        "id": 9,
-        "question": "What's your approach to learning?",
-        "options": [
-            {"text": "Hands-on experimentation", "weights": {"technical": 2, "practical": 3}},
-            {"text": "Creative exploration", "weights": {"creative": 3, "independent": 1}},
-            {"text": "Structured guidance", "weights": {"analytical": 2, "management": 1}},
-            {"text": "Discussion and debate", "weights": {"communication": 3, "literary": 2}}
-        ]
-    },
-    {
-        "id": 10,
-        "question": "What kind of projects interest you?",
-        "options": [
-            {"text": "Building apps, robots, or tech solutions", "weights": {"technical": 3, "practical": 2}},
-            {"text": "Creating art, music, or performances", "weights": {"creative": 3, "social": 1}},
-            {"text": "Organizing events or campaigns", "weights": {"management": 3, "leadership": 2}},
-            {"text": "Writing, research, or advocacy", "weights": {"literary": 3, "social": 2}}
-        ]
-    }
-]
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
 
-def calculate_quiz_result(answers: List[QuizAnswer]) -> QuizResult:
-    scores = {}
-    
-    for answer in answers:
-        question = next((q for q in QUIZ_QUESTIONS if q["id"] == answer.question_id), None)
-        if question:
-            selected_option = next((opt for opt in question["options"] if opt["text"] == answer.answer), None)
-            if selected_option:
-                for trait, weight in selected_option["weights"].items():
-                    scores[trait] = scores.get(trait, 0) + weight
-    
-    # Determine personality type based on dominant traits
-    personality_type = ""
-    personality_description = ""
-    
-    technical_score = scores.get("technical", 0)
-    creative_score = scores.get("creative", 0)
-    sports_score = scores.get("sports", 0)
-    social_score = scores.get("social", 0)
-    literary_score = scores.get("literary", 0)
-    leadership_score = scores.get("leadership", 0)
-    
-    max_score = max(technical_score, creative_score, sports_score, social_score, literary_score, leadership_score)
-    
-    if technical_score == max_score:
-        personality_type = "Tech Explorer 🚀"
-        personality_description = "You're a problem solver who loves building and creating with technology. Technical clubs will help you thrive!"
-    elif creative_score == max_score:
-        personality_type = "Creative Innovator 🎨"
-        personality_description = "You express yourself through art and creativity. Cultural and creative clubs are perfect for you!"
-    elif sports_score == max_score:
-        personality_type = "Athletic Champion 🏆"
-        personality_description = "You're competitive and love physical challenges. Sports clubs will channel your energy perfectly!"
-    elif social_score == max_score:
-        personality_type = "Social Changemaker 🌟"
-        personality_description = "You're passionate about people and making an impact. Social and community clubs suit you best!"
-    elif literary_score == max_score:
-        personality_type = "Literary Thinker 📚"
-        personality_description = "You love ideas, words, and meaningful discussions. Literary and debate clubs are your domain!"
-    elif leadership_score == max_score:
-        personality_type = "Natural Leader 👑"
-        personality_description = "You excel at organizing and leading others. Management and leadership clubs will polish your skills!"
-    else:
-        personality_type = "Versatile All-Rounder 🌈"
-        personality_description = "You have diverse interests and can thrive in multiple types of clubs. Explore different options!"
-    
-    return personality_type, personality_description, scores
+    user = await db.users.find_one({"id": user_id}, {"_id": 0, "password": 0})
+    if user is None:
+        raise HTTPException(status_code=401, detail="User not found")
+
+    # Never keep a token cached past its own expiry
+    token_ttl = payload.get("exp", 0) - datetime.now(timezone.utc).timestamp()
+    user_cache.set(token, user, ttl=token_ttl, tag=user_id)
+    return user
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+def invalidate_cached_user(user_id: str):
+    """Drop every cached token for a user; call after updating the user document."""
+    user_cache.invalidate_tag(user_id)
 
 async def generate_recommendations(scores: dict, user_id: str) -> List[ClubRecommendation]:
-    clubs = await db.clubs.find({}, {"_id": 0}).to_list(100)
-    
-    club_matches = []
-    
-    for club in clubs:
-        match_score = 0
-        reasons = []
-        
-        # Match based on domain
-        domain_lower = club["domain"].lower()
-        if domain_lower == "technical" and scores.get("technical", 0) > 5:
-            match_score += scores.get("technical", 0) * 10
-            reasons.append("strong technical interest")
-        elif domain_lower == "cultural" and scores.get("creative", 0) > 5:
-            match_score += scores.get("creative", 0) * 10
-            reasons.append("creative mindset")
-        elif domain_lower == "sports" and scores.get("sports", 0) > 5:
-            match_score += scores.get("sports", 0) * 10
-            reasons.append("athletic inclination")
-        elif domain_lower == "management" and scores.get("leadership", 0) > 5:
-            match_score += scores.get("leadership", 0) * 10
-            reasons.append("leadership qualities")
-        elif domain_lower == "literary" and scores.get("literary", 0) > 5:
-            match_score += scores.get("literary", 0) * 10
-            reasons.append("literary interests")
-        elif domain_lower == "social" and scores.get("social", 0) > 5:
-            match_score += scores.get("social", 0) * 10
-            reasons.append("social consciousness")
-        
-        # Match based on personality traits
-        if scores.get("competitive", 0) > 4:
-            match_score += 20
-            reasons.append("competitive spirit")
-        
-        if scores.get("teamwork", 0) > 4:
-            match_score += 15
-            reasons.append("team player")
-        
-        if scores.get("communication", 0) > 4:
-            match_score += 15
-            reasons.append("strong communication skills")
-        
-        # Normalize to percentage
-        match_percentage = min(int(match_score), 95) + 5
-        
-        club_matches.append({
-            "club_id": club["id"],
-            "club_name": club["name"],
-            "match_percentage": match_percentage,
-            "reason": f"You'd be great here because of your {', '.join(reasons[:2]) if reasons else 'diverse skills'}!",
-            "score": match_score
-        })
-    
-    # Sort by match score and get top 3
-    club_matches.sort(key=lambda x: x["score"], reverse=True)
-    top_matches = club_matches[:3]
-    
-    return [
-        ClubRecommendation(
-            club_id=match["club_id"],
-            club_name=match["club_name"],
-            match_percentage=match["match_percentage"],
-            reason=match["reason"]
-        )
-        for match in top_matches
-    ]
+    return [ClubRecommendation(**match) for match in recommendation_engine.recommend(scores, k=3)]
 
 # Authentication endpoints
 @api_router.post("/auth/signup", response_model=Token)
@@ -450,12 +369,11 @@ async def signup(user_data: UserSignup):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     user_dict = user_data.model_dump()
-    hashed_password = hash_password(user_dict.pop("password"))
+    hashed_password = await hash_password_async(user_dict.pop("password"))
     
     user = User(**user_dict)
     user_doc = user.model_dump()
     user_doc["password"] = hashed_password
-    user_doc["created_at"] = user_doc["created_at"].isoformat()
     
     await db.users.insert_one(user_doc)
     
@@ -479,7 +397,7 @@ async def login(user_data: UserLogin):
     if not user:
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
-    if not verify_password(user_data.password, user["password"]):
+    if not await verify_password_async(user_data.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     access_token = create_access_token(data={"sub": user["id"]})
@@ -506,24 +424,86 @@ async def get_me(current_user: dict = Depends(get_current_user)):
         verified=current_user["verified"]
     )
 
+# Pre-serialized catalog bodies, rebuilt whenever the club catalog changes so
+# cache hits and revalidations do no JSON encoding
+EMPTY_CLUB_LIST = PrecomputedJSON([])
+catalog_responses: Dict[str, Any] = {"all": EMPTY_CLUB_LIST, "domain": {}, "club": {}, "version": 0}
+
+def build_catalog_responses(snapshot):
+    clubs = {club["id"]: ClubResponse(**club).model_dump() for club in snapshot.clubs}
+    catalog_responses.update(
+        all=PrecomputedJSON(list(clubs.values())),
+        domain={domain: PrecomputedJSON([clubs[c["id"]] for c in members]) for domain, members in snapshot.by_domain.items()},
+        club={club_id: PrecomputedJSON(club) for club_id, club in clubs.items()},
+        version=snapshot.version,
+    )
+
+club_catalog.add_listener(build_catalog_responses)
+
+# Club x trait matrix for recommendations, rebuilt with each catalog snapshot
+recommendation_engine = RecommendationEngine([])
+
+def build_recommendation_engine(snapshot):
+    global recommendation_engine
+    recommendation_engine = RecommendationEngine(snapshot.clubs)
+
+club_catalog.add_listener(build_recommendation_engine)
+
+# Inverted index for /clubs/search; only clubs whose searchable fields changed are re-indexed
+club_search_index = ClubSearchIndex()
+CLUB_SEARCH_PAGE_MAX = 100
+
+def update_club_search_index(snapshot):
+    club_search_index.update(snapshot.clubs)
+
+club_catalog.add_listener(update_club_search_index)
+
+QUIZ_QUESTIONS_RESPONSE = PrecomputedJSON(
+    {"questions": [{"id": q["id"], "question": q["question"], "options": [opt["text"] for opt in q["options"]]} for q in QUIZ_QUESTIONS]}
+)
+
+def club_list_response(clubs: List[dict]) -> RawJSONResponse:
+    # Stitch the pre-serialized club bodies together; nothing is re-encoded
+    bodies = catalog_responses["club"]
+    return RawJSONResponse(
+        json_array(bodies[club["id"]].body for club in clubs if club["id"] in bodies),
+        headers={"X-Catalog-Version": str(catalog_responses["version"])},
+    )
+
 # Club endpoints
 @api_router.get("/clubs", response_model=List[ClubResponse])
-async def get_clubs(domain: Optional[str] = None):
-    query = {} if not domain else {"domain": domain}
-    clubs = await db.clubs.find(query, {"_id": 0}).to_list(100)
-    return clubs
+async def get_clubs(request: Request, domain: Optional[str] = None):
+    if domain:
+        payload = catalog_responses["domain"].get(domain, EMPTY_CLUB_LIST)
+    else:
+        payload = catalog_responses["all"]
+    return precomputed_response(request, payload, CATALOG_CACHE_CONTROL, {"X-Catalog-Version": str(catalog_responses["version"])})
+
+@api_router.get("/clubs/search")
+async def search_clubs(q: str = "", domain: Optional[str] = None, recruitment_status: Optional[str] = None,
+                       time_commitment: Optional[str] = None, offset: int = 0, limit: int = 20):
+    offset = max(0, offset)
+    limit = max(1, min(limit, CLUB_SEARCH_PAGE_MAX))
+    result = club_search_index.search(
+        q, {"domain": domain, "recruitment_status": recruitment_status, "time_commitment": time_commitment}, offset, limit
+    )
+    # Page metadata is encoded here; the club bodies are the precomputed ones
+    meta = json_dumps({"total": result.total, "offset": offset, "limit": limit, "facets": result.facets})
+    bodies = catalog_responses["club"]
+    clubs = json_array(bodies[club_id].body for club_id in result.club_ids if club_id in bodies)
+    return RawJSONResponse(meta[:-1] + b',"clubs":' + clubs + b"}", headers={"X-Catalog-Version": str(catalog_responses["version"])})
 
 @api_router.get("/clubs/{club_id}", response_model=ClubResponse)
-async def get_club(club_id: str):
-    club = await db.clubs.find_one({"id": club_id}, {"_id": 0})
-    if not club:
+async def get_club(club_id: str, request: Request):
+    payload = catalog_responses["club"].get(club_id)
+    if not payload:
         raise HTTPException(status_code=404, detail="Club not found")
-    return club
+    return precomputed_response(request, payload, CATALOG_CACHE_CONTROL, {"X-Catalog-Version": str(catalog_responses["version"])})
 
 # Quiz endpoints
 @api_router.get("/quiz/questions")
-async def get_quiz_questions():
-    return {"questions": [{"id": q["id"], "question": q["question"], "options": [opt["text"] for opt in q["options"]]} for q in QUIZ_QUESTIONS]}
+async def get_quiz_questions(request: Request):
+    return precomputed_response(request, QUIZ_QUESTIONS_RESPONSE, QUIZ_CACHE_CONTROL)
 
 @api_router.post("/quiz/submit", response_model=QuizResult)
 async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(get_current_user)):
@@ -540,9 +520,14 @@ async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(g
     )
     
     quiz_doc = quiz_response.model_dump()
-    quiz_doc["created_at"] = quiz_doc["created_at"].isoformat()
     
     await db.quiz_responses.insert_one(quiz_doc)
+    if await record_latest_result(db, quiz_doc):
+        quiz_result_cache.set(current_user["id"], latest_result_document(quiz_doc))
+    else:
+        quiz_result_cache.invalidate(current_user["id"])
+    for rec in recommendations:
+        club_counters.incr(rec.club_id, INTEREST_COUNT)
     
     return QuizResult(
         personality_type=personality_type,
@@ -552,54 +537,171 @@ async def submit_quiz(submission: QuizSubmission, current_user: dict = Depends(g
 
 @api_router.get("/quiz/result")
 async def get_quiz_result(current_user: dict = Depends(get_current_user)):
-    result = await db.quiz_responses.find_one(
-        {"user_id": current_user["id"]},
-        {"_id": 0},
-        sort=[("created_at", -1)]
-    )
-    
+    cached = quiz_result_cache.get(current_user["id"])
+    if cached is not None:
+        return cached
+
+    result = await db.latest_quiz_results.find_one({"user_id": current_user["id"]}, {"_id": 0})
     if not result:
         return None
-    
-    return {
-        "personality_type": result["personality_type"],
-        "personality_description": result["personality_description"],
-        "recommendations": result["recommendations"]
-    }
+
+    payload = latest_result_document(result)
+    quiz_result_cache.set(current_user["id"], payload)
+    return payload
 
 # Bookmark endpoints
-@api_router.post("/bookmarks")
-async def create_bookmark(bookmark_data: BookmarkCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.bookmarks.find_one({"user_id": current_user["id"], "club_id": bookmark_data.club_id})
-    if existing:
-        raise HTTPException(status_code=400, detail="Club already bookmarked")
+BOOKMARK_PAGE_MAX = 500
+
+DUPLICATE_KEY = 11000
+BULK_BOOKMARK_MAX = 500
+
+def bookmark_upsert(user_id: str, club_id: str) -> Tuple[dict, dict]:
+    # Filter and update for an atomic create-if-missing upsert, backed by the
+    # unique (user_id, club_id) index
+    bookmark_doc = Bookmark(user_id=user_id, club_id=club_id).model_dump()
+    del bookmark_doc["user_id"], bookmark_doc["club_id"]
+    return {"user_id": user_id, "club_id": club_id}, {"$setOnInsert": bookmark_doc}
+
+@api_router.post("/bookmarks", status_code=201)
+async def create_bookmark(bookmark_data: BookmarkCreate, response: Response, current_user: dict = Depends(get_current_user)):
+    query, update = bookmark_upsert(current_user["id"], bookmark_data.club_id)
+    try:
+        result = await db.bookmarks.update_one(query, update, upsert=True)
+        created = result.upserted_id is not None
+    except DuplicateKeyError:
+        # A concurrent request inserted the same bookmark first
+        created = False
     
-    bookmark = Bookmark(user_id=current_user["id"], club_id=bookmark_data.club_id)
-    bookmark_doc = bookmark.model_dump()
-    bookmark_doc["created_at"] = bookmark_doc["created_at"].isoformat()
+    if not created:
+        response.status_code = 200
+        return {"message": "Club already bookmarked", "created": False}
+    club_counters.incr(bookmark_data.club_id, BOOKMARK_COUNT)
+    return {"message": "Club bookmarked successfully", "created": True}
+
+@api_router.post("/bookmarks/bulk")
+async def bulk_update_bookmarks(update: BookmarkBulkUpdate, current_user: dict = Depends(get_current_user)):
+    add, remove = list(dict.fromkeys(update.add)), list(dict.fromkeys(update.remove))
+    if len(add) + len(remove) > BULK_BOOKMARK_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {BULK_BOOKMARK_MAX} clubs per request")
+    if set(add) & set(remove):
+        raise HTTPException(status_code=400, detail="A club cannot be both added and removed")
+    if not add and not remove:
+        return {"created": 0, "removed": 0}
     
-    await db.bookmarks.insert_one(bookmark_doc)
-    return {"message": "Club bookmarked successfully"}
+    user_id = current_user["id"]
+    created = removed = 0
+    if add:
+        operations = [UpdateOne(*bookmark_upsert(user_id, club_id), upsert=True) for club_id in add]
+        try:
+            result = await db.bookmarks.bulk_write(operations, ordered=False)
+            created, upserted = result.upserted_count, result.upserted_ids
+        except BulkWriteError as e:
+            # Duplicate keys only mean a concurrent request already added that club
+            if any(err["code"] != DUPLICATE_KEY for err in e.details["writeErrors"]):
+                raise
+            created = e.details["nUpserted"]
+            upserted = {u["index"]: u["_id"] for u in e.details["upserted"]}
+        for index in upserted:
+            club_counters.incr(add[index], BOOKMARK_COUNT)
+    if remove:
+        # A bulk delete only reports a total, so read which of these bookmarks
+        # exist first and decrement only those clubs. A concurrent DELETE of
+        # the same bookmark in between can still skew a counter by one;
+        # /admin/counters/reconcile corrects that.
+        existing = [
+            doc["club_id"]
+            async for doc in db.bookmarks.find({"user_id": user_id, "club_id": {"$in": remove}}, {"_id": 0, "club_id": 1})
+        ]
+        if existing:
+            operations = [DeleteOne({"user_id": user_id, "club_id": club_id}) for club_id in existing]
+            result = await db.bookmarks.bulk_write(operations, ordered=False)
+            removed = result.deleted_count
+            for club_id in existing:
+                club_counters.incr(club_id, BOOKMARK_COUNT, -1)
+    return {"created": created, "removed": removed}
 
 @api_router.delete("/bookmarks/{club_id}")
 async def delete_bookmark(club_id: str, current_user: dict = Depends(get_current_user)):
     result = await db.bookmarks.delete_one({"user_id": current_user["id"], "club_id": club_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Bookmark not found")
+    club_counters.incr(club_id, BOOKMARK_COUNT, -1)
     return {"message": "Bookmark removed successfully"}
 
-@api_router.get("/bookmarks", response_model=List[ClubResponse])
-async def get_bookmarks(current_user: dict = Depends(get_current_user)):
-    bookmarks = await db.bookmarks.find({"user_id": current_user["id"]}, {"_id": 0}).to_list(100)
-    club_ids = [b["club_id"] for b in bookmarks]
-    
-    if not club_ids:
-        return []
+@api_router.get("/bookmarks", response_model=List[ClubResponse], response_class=RawJSONResponse)
+async def get_bookmarks(limit: int = 100, cursor: Optional[str] = None, current_user: dict = Depends(get_current_user)):
+    # One indexed query for the page of bookmarks, in the order they were
+    # made; the club documents come from the in-memory catalog. Bookmarks
+    # whose club no longer exists are left out.
+    limit = max(1, min(limit, BOOKMARK_PAGE_MAX))
+    query = {"user_id": current_user["id"]}
+    if cursor:
+        try:
+            created_at, bookmark_id = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query.update(timestamp_keyset_filter("created_at", created_at, bookmark_id, descending=False))
+    bookmarks = await db.bookmarks.find(query, {"_id": 0, "id": 1, "club_id": 1, "created_at": 1}).sort(
+        [("created_at", 1), ("id", 1)]
+    ).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(bookmarks) > limit:
+        bookmarks = bookmarks[:limit]
+        next_cursor = encode_cursor(bookmarks[-1]["created_at"], bookmarks[-1]["id"])
     
-    clubs = await db.clubs.find({"id": {"$in": club_ids}}, {"_id": 0}).to_list(100)
-    return clubs
+    response = club_list_response(club_catalog.get_many(b["club_id"] for b in bookmarks))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return response
 
 # Q&A System Endpoints
+QUESTION_PAGE_MAX = 100
+REPLY_PAGE_MAX = 100
+QUESTION_SUMMARY_LENGTH = 280
+
+def question_reply_count(question: dict) -> int:
+    # Threads not yet migrated by migrate_replies.py keep older replies embedded
+    return len(question.get("replies", [])) + question.get("reply_count", 0)
+
+def question_summary(question: dict) -> dict:
+    """The summary view of a stored question, as GET /questions?view=summary returns it."""
+    return {
+        "id": question["id"],
+        "title": question["title"],
+        "description": question["description"][:QUESTION_SUMMARY_LENGTH],
+        "user_id": question["user_id"],
+        "user_name": question["user_name"],
+        "user_role": question["user_role"],
+        "is_anonymous": question["is_anonymous"],
+        "reply_count": question_reply_count(question),
+        "created_at": api_timestamp(question["created_at"]),
+    }
+
+def api_reply(reply: dict) -> dict:
+    return dict(reply, created_at=api_timestamp(reply["created_at"]))
+
+# Only started with EVENTS_SOURCE=change_stream
+change_stream_source = ChangeStreamSource(db, event_broker, question_summary)
+
+async def fetch_reply_page(question_id: str, cursor: Optional[str], limit: int) -> ReplyPage:
+    """Oldest-first page of replies keyed on (created_at, id)."""
+    limit = max(1, min(limit, REPLY_PAGE_MAX))
+    query = {"question_id": question_id}
+    if cursor:
+        try:
+            created_at, reply_id = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query.update(timestamp_keyset_filter("created_at", created_at, reply_id, descending=False))
+    replies = await db.replies.find(query, {"_id": 0, "question_id": 0}).sort(
+        [("created_at", 1), ("id", 1)]
+    ).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(replies) > limit:
+        replies = replies[:limit]
+        next_cursor = encode_cursor(replies[-1]["created_at"], replies[-1]["id"])
+    return ReplyPage(replies=[api_reply(reply) for reply in replies], next_cursor=next_cursor)
+
 @api_router.post("/questions")
 async def create_question(question_data: QuestionCreate, current_user: dict = Depends(get_current_user)):
     question = Question(
@@ -612,55 +714,164 @@ async def create_question(question_data: QuestionCreate, current_user: dict = De
     )
     
     question_doc = question.model_dump()
-    question_doc["created_at"] = question_doc["created_at"].isoformat()
     
     await db.questions.insert_one(question_doc)
+    question_search.question_added(question_doc)
+    if PUBLISH_LOCAL_EVENTS:
+        publish_question_created(event_broker, question_summary(question_doc))
     return {"message": "Question posted successfully", "question_id": question.id}
 
-@api_router.get("/questions")
-async def get_questions(skip: int = 0, limit: int = 20):
-    questions = await db.questions.find({}, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+def question_list_pipeline(query: dict, skip: int, limit: int, summary: bool) -> List[dict]:
+    """Feed page with reply counts computed in Mongo, so reply bodies never leave the server."""
+    description = {"$substrCP": ["$description", 0, QUESTION_SUMMARY_LENGTH]} if summary else 1
+    return [
+        {"$match": query},
+        {"$sort": {"created_at": -1, "id": -1}},
+        {"$skip": skip},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0, "id": 1, "title": 1, "description": description, "user_id": 1, "user_name": 1,
+            "user_role": 1, "is_anonymous": 1, "created_at": 1,
+            "reply_count": {"$add": [{"$size": {"$ifNull": ["$replies", []]}}, {"$ifNull": ["$reply_count", 0]}]},
+        }},
+    ]
+
+@api_router.get("/questions", response_model=List[Union[QuestionResponse, QuestionSummary]], response_class=FastJSONResponse)
+async def get_questions(skip: int = 0, limit: int = 20, cursor: Optional[str] = None, view: str = "full"):
+    # Newest first, keyed on (created_at, id). A cursor from X-Next-Cursor
+    # continues after the last item seen; skip is kept for older clients.
+    # view=summary truncates descriptions and drops the (always empty) replies.
+    if view not in ("full", "summary"):
+        raise HTTPException(status_code=400, detail="view must be 'full' or 'summary'")
+    limit = max(1, min(limit, QUESTION_PAGE_MAX))
+    query = {}
+    if cursor:
+        try:
+            created_at, question_id = decode_cursor(cursor, 2)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = timestamp_keyset_filter("created_at", created_at, question_id, descending=True)
+        skip = 0
+    summary = view == "summary"
+    questions = await db.questions.aggregate(question_list_pipeline(query, skip, limit + 1, summary)).to_list(limit + 1)
+    headers = {}
+    if len(questions) > limit:
+        questions = questions[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(questions[-1]["created_at"], questions[-1]["id"])
     
-    response = []
+    # The pipeline already projects exactly the response fields, so skip revalidation
     for q in questions:
-        response.append(QuestionResponse(
-            id=q["id"],
-            title=q["title"],
-            description=q["description"],
-            user_id=q["user_id"],
-            user_name=q["user_name"],
-            user_role=q["user_role"],
-            is_anonymous=q["is_anonymous"],
-            replies=q.get("replies", []),
-            reply_count=len(q.get("replies", [])),
-            created_at=q["created_at"]
-        ))
-    
-    return response
+        q["created_at"] = api_timestamp(q["created_at"])
+        if not summary:
+            q["replies"] = []
+    return FastJSONResponse(questions, headers=headers)
+
+def event_stream_response(request: Request, topics: set) -> StreamingResponse:
+    try:
+        subscription = event_broker.subscribe(topics)
+    except TooManySubscribers:
+        raise HTTPException(status_code=503, detail="Too many live connections, please retry shortly", headers={"Retry-After": "10"})
+    return StreamingResponse(
+        sse_stream(subscription, SSE_HEARTBEAT_SECONDS, request.headers.get("last-event-id")),
+        media_type="text/event-stream",
+        # Proxies must neither cache nor buffer the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@api_router.get("/questions/stream")
+async def stream_questions(request: Request):
+    # question_created, reply_added (ids only) and question_deleted for the feed
+    return event_stream_response(request, {FEED_TOPIC})
+
+async def ranked_question_summaries(hits: List[Tuple[float, str]]) -> List[dict]:
+    # Summaries in ranking order; hits deleted since they were ranked are dropped
+    questions = await db.questions.aggregate(
+        question_list_pipeline({"id": {"$in": [question_id for _, question_id in hits]}}, 0, len(hits), summary=True)
+    ).to_list(len(hits))
+    by_id = {q["id"]: q for q in questions}
+    return [
+        dict(by_id[question_id], created_at=api_timestamp(by_id[question_id]["created_at"]), score=round(score, 4))
+        for score, question_id in hits if question_id in by_id
+    ]
 
-@api_router.get("/questions/{question_id}")
-async def get_question(question_id: str):
+async def run_question_search(query: str) -> List[Tuple[float, str]]:
+    try:
+        return await question_search.search(query)
+    except SearchUnavailable:
+        logger.exception("Question search failed")
+        raise HTTPException(status_code=503, detail="Search is temporarily unavailable")
+
+@api_router.get("/questions/search", response_model=List[QuestionSearchHit], response_class=FastJSONResponse)
+async def search_questions(q: str, cursor: Optional[str] = None, limit: int = 20):
+    # Best match first over title, description and replies. Each page
+    # re-runs the search and resumes after the last (score, id) served, so
+    # X-Next-Cursor is best-effort: with the local BM25 backend a new
+    # question changes the idf of its terms, scores shift, and a later page
+    # can skip or repeat a hit. Mongo text scores are per document, so only
+    # edits to the hits themselves move them.
+    limit = max(1, min(limit, QUESTION_PAGE_MAX))
+    hits = await run_question_search(q)
+    start = 0
+    if cursor:
+        try:
+            score, question_id = decode_cursor(cursor, 2)
+            after = (-float(score), str(question_id))
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        start = next((i for i, (s, qid) in enumerate(hits) if (-s, qid) > after), len(hits))
+    page = hits[start:start + limit]
+    headers = {}
+    if start + limit < len(hits):
+        headers["X-Next-Cursor"] = encode_cursor(page[-1][0], page[-1][1])
+    return FastJSONResponse(await ranked_question_summaries(page), headers=headers)
+
+@api_router.post("/questions/similar", response_model=List[QuestionSearchHit], response_class=FastJSONResponse)
+async def find_similar_questions(draft: SimilarQuestionsRequest, limit: int = 5):
+    """Existing threads resembling a draft, for the ask form to offer before posting."""
+    limit = max(1, min(limit, 20))
+    hits = await run_question_search(similar_query(draft.title, draft.description))
+    return FastJSONResponse(await ranked_question_summaries(strong_hits(hits, limit)))
+
+@api_router.get("/questions/{question_id}", response_model=QuestionResponse, response_class=FastJSONResponse)
+async def get_question(question_id: str, reply_limit: int = 100):
     question = await db.questions.find_one({"id": question_id}, {"_id": 0})
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
     
-    return QuestionResponse(
-        id=question["id"],
-        title=question["title"],
-        description=question["description"],
-        user_id=question["user_id"],
-        user_name=question["user_name"],
-        user_role=question["user_role"],
-        is_anonymous=question["is_anonymous"],
-        replies=question.get("replies", []),
-        reply_count=len(question.get("replies", [])),
-        created_at=question["created_at"]
-    )
+    page = await fetch_reply_page(question_id, None, reply_limit)
+    
+    return FastJSONResponse({
+        "id": question["id"],
+        "title": question["title"],
+        "description": question["description"],
+        "user_id": question["user_id"],
+        "user_name": question["user_name"],
+        "user_role": question["user_role"],
+        "is_anonymous": question["is_anonymous"],
+        "replies": [api_reply(reply) for reply in question.get("replies", [])] + page.replies,
+        "replies_next_cursor": page.next_cursor,
+        "reply_count": question_reply_count(question),
+        "created_at": api_timestamp(question["created_at"]),
+    })
+
+@api_router.get("/questions/{question_id}/stream")
+async def stream_question(question_id: str, request: Request):
+    # reply_added with the full reply, and question_deleted, for one thread
+    if not await db.questions.find_one({"id": question_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Question not found")
+    return event_stream_response(request, {question_topic(question_id)})
+
+@api_router.get("/questions/{question_id}/replies", response_model=ReplyPage)
+async def get_replies(question_id: str, cursor: Optional[str] = None, limit: int = 20):
+    if not await db.questions.find_one({"id": question_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Question not found")
+    return await fetch_reply_page(question_id, cursor, limit)
 
 @api_router.post("/questions/{question_id}/replies")
 async def add_reply(question_id: str, reply_data: ReplyCreate, current_user: dict = Depends(get_current_user)):
-    question = await db.questions.find_one({"id": question_id})
-    if not question:
+    # The counter bump doubles as the existence check
+    result = await db.questions.update_one({"id": question_id}, {"$inc": {"reply_count": 1}})
+    if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Question not found")
     
     reply = Reply(
@@ -672,12 +883,12 @@ async def add_reply(question_id: str, reply_data: ReplyCreate, current_user: dic
     )
     
     reply_doc = reply.model_dump()
-    reply_doc["created_at"] = reply_doc["created_at"].isoformat()
+    reply_doc["question_id"] = question_id
     
-    await db.questions.update_one(
-        {"id": question_id},
-        {"$push": {"replies": reply_doc}}
-    )
+    await db.replies.insert_one(reply_doc)
+    question_search.reply_added(question_id, reply_doc["content"])
+    if PUBLISH_LOCAL_EVENTS:
+        publish_reply_added(event_broker, question_id, reply_doc)
     
     return {"message": "Reply added successfully"}
 
@@ -692,29 +903,143 @@ async def delete_question(question_id: str, current_user: dict = Depends(get_cur
         raise HTTPException(status_code=403, detail="Not authorized to delete this question")
     
     await db.questions.delete_one({"id": question_id})
+    await db.replies.delete_many({"question_id": question_id})
+    question_search.question_removed(question_id)
+    if PUBLISH_LOCAL_EVENTS:
+        publish_question_deleted(event_broker, question_id)
     return {"message": "Question deleted successfully"}
 
 # Compare Clubs Endpoint
-@api_router.post("/clubs/compare")
+@api_router.post("/clubs/compare", response_model=List[ClubResponse], response_class=RawJSONResponse)
 async def compare_clubs(club_ids: List[str]):
     if len(club_ids) != 2:
         raise HTTPException(status_code=400, detail="Please provide exactly 2 club IDs")
     
-    clubs = await db.clubs.find({"id": {"$in": club_ids}}, {"_id": 0}).to_list(2)
+    clubs = club_catalog.get_many(club_ids)
     
     if len(clubs) != 2:
         raise HTTPException(status_code=404, detail="One or both clubs not found")
     
-    return clubs
+    return club_list_response(clubs)
+
+# Diagnostics endpoints (admin only: they expose internals and some are costly)
+@api_router.get("/diagnostics/password-hasher", dependencies=[Depends(require_admin)])
+async def get_password_hasher_stats():
+    return password_hasher.stats()
+
+@api_router.get("/diagnostics/user-cache", dependencies=[Depends(require_admin)])
+async def get_user_cache_stats():
+    return user_cache.stats()
+
+@api_router.get("/diagnostics/quiz-result-cache", dependencies=[Depends(require_admin)])
+async def get_quiz_result_cache_stats():
+    return quiz_result_cache.stats()
+
+@api_router.get("/diagnostics/indexes", dependencies=[Depends(require_admin)])
+async def get_index_health():
+    return await index_health(db)
+
+@api_router.get("/diagnostics/counters", dependencies=[Depends(require_admin)])
+async def get_counter_stats():
+    return club_counters.stats()
+
+@api_router.get("/diagnostics/question-search", dependencies=[Depends(require_admin)])
+async def get_question_search_stats():
+    return question_search.stats()
+
+@api_router.get("/diagnostics/events", dependencies=[Depends(require_admin)])
+async def get_event_stats():
+    return {"source": EVENTS_SOURCE, **event_broker.stats()}
+
+@api_router.get("/diagnostics/club-catalog", dependencies=[Depends(require_admin)])
+async def get_club_catalog_stats():
+    return {**club_catalog.stats(), "search_index": club_search_index.stats()}
+
+# Admin endpoints
+@api_router.post("/admin/catalog/reload", dependencies=[Depends(require_admin)])
+async def reload_club_catalog():
+    changed = await club_catalog.reload()
+    return {"changed": changed, **club_catalog.stats()}
+
+@api_router.post("/admin/counters/reconcile", dependencies=[Depends(require_admin)])
+async def reconcile_counters():
+    stats = await club_counters.reconcile(lambda: reconcile_club_counters(db))
+    await club_catalog.reload()
+    return stats
+
+# Only one re-scoring job runs at a time; its progress is polled via GET
+RESCORE_CHUNK_MAX = 10000
+rescore_job: Dict[str, Any] = {"state": "idle"}
+background_tasks = set()
+
+async def run_rescore_job(chunk_size: int, dry_run: bool):
+    try:
+        stats = await rescore_quiz_responses(db, recommendation_engine, chunk_size=chunk_size, dry_run=dry_run, progress=rescore_job.update)
+        if not dry_run:
+            # Carry the new recommendations over to each user's latest result
+            stats["latest_results"] = await backfill_latest_quiz_results(db, batch_size=chunk_size)
+            quiz_result_cache.clear()
+        rescore_job.update(stats, state="finished")
+    except Exception as e:
+        logger.exception("Quiz re-scoring failed")
+        rescore_job.update(state="failed", error=str(e))
+
+@api_router.post("/admin/quiz/rescore", status_code=202, dependencies=[Depends(require_admin)])
+async def start_quiz_rescore(chunk_size: int = 1000, dry_run: bool = False):
+    if not 1 <= chunk_size <= RESCORE_CHUNK_MAX:
+        raise HTTPException(status_code=400, detail=f"chunk_size must be between 1 and {RESCORE_CHUNK_MAX}")
+    if rescore_job["state"] == "running":
+        raise HTTPException(status_code=409, detail="A re-scoring job is already running")
+    rescore_job.clear()
+    rescore_job.update(state="running", started_at=datetime.now(timezone.utc).isoformat(), chunk_size=chunk_size, dry_run=dry_run)
+    task = asyncio.create_task(run_rescore_job(chunk_size, dry_run))
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return rescore_job
+
+@api_router.get("/admin/quiz/rescore", dependencies=[Depends(require_admin)])
+async def get_quiz_rescore_status():
+    return rescore_job
 
 app.include_router(api_router)
 
+def collect_component_metrics():
+    cache_stats = {"user": user_cache.stats(), "quiz_result": quiz_result_cache.stats()}
+    yield "cache_hits_total", "counter", "In-process cache hits.", [({"cache": name}, s["hits"]) for name, s in cache_stats.items()]
+    yield "cache_misses_total", "counter", "In-process cache misses.", [({"cache": name}, s["misses"]) for name, s in cache_stats.items()]
+    yield "cache_hit_ratio", "gauge", "In-process cache hit ratio since start.", [({"cache": name}, s["hit_ratio"]) for name, s in cache_stats.items()]
+    yield "cache_entries", "gauge", "Entries held by in-process caches.", [({"cache": name}, s["size"]) for name, s in cache_stats.items()]
+    hasher_stats = password_hasher.stats()
+    yield "password_hash_pending", "gauge", "Password hashing jobs queued or running.", [({}, hasher_stats["pending"])]
+    yield "password_hash_completed_total", "counter", "Password hashing jobs completed.", [({}, hasher_stats["completed"])]
+    yield "password_hash_rejected_total", "counter", "Password hashing jobs rejected with 503.", [({}, hasher_stats["rejected"])]
+    yield "password_hash_queue_wait_seconds", "gauge", "Recent password hashing queue wait.", [
+        ({"quantile": q}, hasher_stats[f"queue_wait_{label}_ms"] / 1000) for q, label in (("0.5", "p50"), ("0.99", "p99"))
+    ]
+    yield "club_catalog_version", "gauge", "Version of the in-memory club catalog.", [({}, club_catalog.version)]
+    yield "club_catalog_clubs", "gauge", "Clubs in the in-memory catalog.", [({}, len(club_catalog.list()))]
+    yield "club_counter_pending_keys", "gauge", "Clubs with unflushed counter increments.", [({}, club_counters.stats()["pending_keys"])]
+
+metrics_registry.register_collector(collect_component_metrics)
+
+if METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def get_metrics():
+        return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+    app.add_middleware(MetricsMiddleware, fastapi_app=app)
+
+# Slow-request profiling is only installed when PROFILE_REQUESTS or ADMIN_TOKEN is set
+if ProfilingMiddleware.enabled_by_env(ADMIN_TOKEN):
+    app.add_middleware(ProfilingMiddleware, **ProfilingMiddleware.options_from_env(ADMIN_TOKEN))
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Catalog-Version", "X-Next-Cursor"],
 )
 
 logging.basicConfig(
@@ -723,6 +1048,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def bootstrap_indexes():
+    if ENSURE_INDEXES:
+        await ensure_indexes(db)
+
+@app.on_event("startup")
+async def load_club_catalog():
+    if is_memory_backend():
+        # Nothing persists between runs, so start from the seed catalog
+        await seed_clubs(db)
+    await club_catalog.start()
+    club_counters.start()
+
+@app.on_event("startup")
+async def start_question_search():
+    await question_search.start()
+
+@app.on_event("startup")
+async def start_event_source():
+    if EVENTS_SOURCE == 'change_stream':
+        change_stream_source.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
-    client.close()
\ No newline at end of file
+    await club_catalog.stop()
+    await club_counters.stop()
+    await change_stream_source.stop()
+    client.close()
+    password_hasher.shutdown()
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Storage backend selection.
+
+``STORAGE_BACKEND=mongo`` (the default) connects to ``MONGO_URL`` with Motor.
+``STORAGE_BACKEND=memory`` uses the in-process stand-in from memory_store.py,
+so the API, the load harness and the benchmarks run without a MongoDB
+server; data lives only as long as the process.
+"""
+import os
+from typing import Iterable, Optional
+
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'mongo').lower()
+
+
+def is_memory_backend() -> bool:
+    return STORAGE_BACKEND == 'memory'
+
+
+def create_client(event_listeners: Optional[Iterable] = None):
+    if STORAGE_BACKEND == 'memory':
+        from memory_store import InMemoryClient
+        return InMemoryClient()
+    if STORAGE_BACKEND != 'mongo':
+        raise ValueError(f"Unknown STORAGE_BACKEND {STORAGE_BACKEND!r}; expected 'mongo' or 'memory'")
+    from motor.motor_asyncio import AsyncIOMotorClient
+    # tz_aware: stored dates come back as UTC datetimes and render with +00:00
+    return AsyncIOMotorClient(os.environ['MONGO_URL'], tz_aware=True, event_listeners=list(event_listeners or []))
+
+
+def database_name() -> str:
+    if STORAGE_BACKEND == 'memory':
+        return os.environ.get('DB_NAME', 'club_compass')
+    return os.environ['DB_NAME']
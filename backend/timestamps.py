@@ -0,0 +1,44 @@
+"""``created_at`` handling: native datetimes in storage, ISO 8601 strings in the API.
+
+Documents store BSON dates, which sort and range-compare as time, take 8
+bytes and can back TTL indexes. Responses keep the format the API always
+had (``2026-01-01T12:00:00.123000+00:00``); conversion happens only at the
+response boundary, through ``api_timestamp``.
+
+Rows written before migrate_timestamps.py ran still hold ISO strings.
+``api_timestamp`` passes those through unchanged, so they render the same.
+"""
+from datetime import datetime, timezone
+from typing import Any
+
+
+def utc_now() -> datetime:
+    """Now, truncated to the millisecond precision BSON keeps.
+
+    A write that echoes its timestamp then returns the same value later
+    reads will.
+    """
+    return to_bson_precision(datetime.now(timezone.utc))
+
+
+def to_bson_precision(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """A stored value (legacy ISO string or datetime) as an aware UTC datetime. Raises ``ValueError``."""
+    if isinstance(value, datetime):
+        return to_bson_precision(value)
+    if not isinstance(value, str):
+        raise ValueError(f"Not a timestamp: {value!r}")
+    return to_bson_precision(datetime.fromisoformat(value)).astimezone(timezone.utc)
+
+
+def api_timestamp(value: Any) -> Any:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat(timespec="microseconds")
+    return value
@@ -174,6 +174,11 @@ const ClubDetail = () => {
                     Members
                   </div>
                   <div className="font-bold">{club.member_count} students</div>
+                  {club.bookmark_count > 0 && (
+                    <div className="text-xs text-muted-foreground">
+                      {club.bookmark_count} bookmarked this
+                    </div>
+                  )}
                 </div>
               </div>
 
@@ -8,8 +8,9 @@ import { Input } from "../components/ui/input";
 
 const Clubs = () => {
   const navigate = useNavigate();
-  const [clubs, setClubs] = useState([]);
   const [filteredClubs, setFilteredClubs] = useState([]);
+  const [total, setTotal] = useState(0);
+  const [domainCounts, setDomainCounts] = useState({});
   const [loading, setLoading] = useState(true);
   const [searchQuery, setSearchQuery] = useState("");
   const [selectedDomain, setSelectedDomain] = useState("All");
@@ -25,42 +26,34 @@ const Clubs = () => {
   ];
 
   useEffect(() => {
-    fetchClubs();
-  }, []);
+    // Debounce typing so each keystroke does not trigger a request
+    const timer = setTimeout(searchClubs, searchQuery ? 200 : 0);
+    return () => clearTimeout(timer);
+  }, [searchQuery, selectedDomain]);
 
-  useEffect(() => {
-    filterClubs();
-  }, [clubs, searchQuery, selectedDomain]);
-
-  const fetchClubs = async () => {
+  const searchClubs = async () => {
     try {
-      const response = await api.get("/clubs");
-      setClubs(response.data);
-      setFilteredClubs(response.data);
+      const response = await api.get("/clubs/search", {
+        params: {
+          q: searchQuery,
+          domain: selectedDomain !== "All" ? selectedDomain : undefined,
+          limit: 100,
+        },
+      });
+      setFilteredClubs(response.data.clubs);
+      setTotal(response.data.total);
+      setDomainCounts(response.data.facets.domain);
       setLoading(false);
     } catch (error) {
-      console.error("Error fetching clubs:", error);
+      console.error("Error searching clubs:", error);
       setLoading(false);
     }
   };
 
-  const filterClubs = () => {
-    let filtered = clubs;
-
-    if (selectedDomain !== "All") {
-      filtered = filtered.filter((club) => club.domain === selectedDomain);
-    }
-
-    if (searchQuery) {
-      filtered = filtered.filter(
-        (club) =>
-          club.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
-          club.description.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-
-    setFilteredClubs(filtered);
-  };
+  const domainCount = (domain) =>
+    domain === "All"
+      ? Object.values(domainCounts).reduce((sum, count) => sum + count, 0)
+      : domainCounts[domain] || 0;
 
   if (loading) {
     return (
@@ -110,7 +103,7 @@ const Clubs = () => {
             <Search className="absolute left-4 top-1/2 -translate-y-1/2 w-5 h-5 text-muted-foreground" />
             <Input
               type="text"
-              placeholder="Search clubs by name or description..."
+              placeholder="Search clubs by name, skills, tags or description..."
               value={searchQuery}
               onChange={(e) => setSearchQuery(e.target.value)}
               data-testid="club-search-input"
@@ -129,7 +122,7 @@ const Clubs = () => {
                 size="sm"
                 className="rounded-full border-2 px-6"
               >
-                {domain}
+                {domain} ({domainCount(domain)})
               </Button>
             ))}
           </div>
@@ -142,7 +135,7 @@ const Clubs = () => {
           transition={{ delay: 0.2 }}
           className="mb-6 text-center text-sm text-muted-foreground"
         >
-          Showing {filteredClubs.length} club{filteredClubs.length !== 1 ? "s" : ""}
+          Showing {filteredClubs.length} of {total} club{total !== 1 ? "s" : ""}
         </motion.div>
 
         {/* Clubs Grid */}
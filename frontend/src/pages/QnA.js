@@ -6,7 +6,7 @@ import { Label } from "../components/ui/label";
 import { Textarea } from "../components/ui/textarea";
 import { motion } from "framer-motion";
 import { MessageCircle, Send, User, Award, Trash2, MessageSquare } from "lucide-react";
-import api from "../lib/api";
+import api, { API } from "../lib/api";
 import { toast } from "sonner";
 import { Switch } from "../components/ui/switch";
 
@@ -14,6 +14,7 @@ const QnA = () => {
   const { user } = useAuth();
   const [questions, setQuestions] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [searchQuery, setSearchQuery] = useState("");
   const [showNewQuestion, setShowNewQuestion] = useState(false);
   const [selectedQuestion, setSelectedQuestion] = useState(null);
   
@@ -21,18 +22,80 @@ const QnA = () => {
   const [title, setTitle] = useState("");
   const [description, setDescription] = useState("");
   const [isAnonymous, setIsAnonymous] = useState(false);
+  const [similarQuestions, setSimilarQuestions] = useState([]);
   
   // Reply Form
   const [replyContent, setReplyContent] = useState("");
   const [replyingTo, setReplyingTo] = useState(null);
 
   useEffect(() => {
-    fetchQuestions();
-  }, []);
+    // Debounce typing so each keystroke does not trigger a search
+    const timer = setTimeout(fetchQuestions, searchQuery ? 300 : 0);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
+  useEffect(() => {
+    // Live feed updates instead of polling; a reset means events were missed
+    if (searchQuery.trim()) return;
+    const source = new EventSource(`${API}/questions/stream`);
+    source.addEventListener("question_created", (e) => {
+      const question = JSON.parse(e.data);
+      setQuestions((prev) => (prev.some((q) => q.id === question.id) ? prev : [question, ...prev]));
+    });
+    source.addEventListener("reply_added", (e) => {
+      const { question_id } = JSON.parse(e.data);
+      setQuestions((prev) =>
+        prev.map((q) => (q.id === question_id ? { ...q, reply_count: q.reply_count + 1 } : q))
+      );
+    });
+    source.addEventListener("question_deleted", (e) => {
+      const { question_id } = JSON.parse(e.data);
+      setQuestions((prev) => prev.filter((q) => q.id !== question_id));
+    });
+    source.addEventListener("reset", fetchQuestions);
+    return () => source.close();
+  }, [searchQuery]);
+
+  useEffect(() => {
+    // Replies to the open thread arrive as they are posted
+    if (!selectedQuestion) return;
+    const questionId = selectedQuestion.id;
+    const source = new EventSource(`${API}/questions/${questionId}/stream`);
+    source.addEventListener("reply_added", (e) => {
+      const { reply } = JSON.parse(e.data);
+      setSelectedQuestion((prev) => {
+        if (!prev || prev.id !== questionId || prev.replies.some((r) => r.id === reply.id)) return prev;
+        // With older pages still unloaded, the reply arrives with the last page instead
+        if (prev.replies_next_cursor) return { ...prev, reply_count: prev.reply_count + 1 };
+        return { ...prev, replies: [...prev.replies, reply], reply_count: prev.reply_count + 1 };
+      });
+    });
+    source.addEventListener("question_deleted", () => setSelectedQuestion(null));
+    return () => source.close();
+  }, [selectedQuestion?.id]);
+
+  useEffect(() => {
+    // Offer existing threads before someone posts a duplicate
+    if (!showNewQuestion || title.trim().length < 8) {
+      setSimilarQuestions([]);
+      return;
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const response = await api.post("/questions/similar", { title, description });
+        setSimilarQuestions(response.data);
+      } catch (error) {
+        setSimilarQuestions([]);
+      }
+    }, 400);
+    return () => clearTimeout(timer);
+  }, [title, description, showNewQuestion]);
 
   const fetchQuestions = async () => {
     try {
-      const response = await api.get("/questions");
+      const response = searchQuery.trim()
+        ? await api.get("/questions/search", { params: { q: searchQuery } })
+        : await api.get("/questions", { params: { view: "summary" } });
       setQuestions(response.data);
       setLoading(false);
     } catch (error) {
@@ -61,7 +124,8 @@ const QnA = () => {
       setDescription("");
       setIsAnonymous(false);
       setShowNewQuestion(false);
-      fetchQuestions();
+      // The live feed delivers the new question; only search results need a refetch
+      if (searchQuery.trim()) fetchQuestions();
     } catch (error) {
       console.error("Error posting question:", error);
       toast.error("Failed to post question");
@@ -82,13 +146,7 @@ const QnA = () => {
       toast.success("Reply added successfully!");
       setReplyContent("");
       setReplyingTo(null);
-      fetchQuestions();
-      
-      // Update selected question if viewing details
-      if (selectedQuestion?.id === questionId) {
-        const response = await api.get(`/questions/${questionId}`);
-        setSelectedQuestion(response.data);
-      }
+      // The thread and feed streams deliver the reply and the new count
     } catch (error) {
       console.error("Error adding reply:", error);
       toast.error("Failed to add reply");
@@ -103,7 +161,7 @@ const QnA = () => {
     try {
       await api.delete(`/questions/${questionId}`);
       toast.success("Question deleted successfully");
-      fetchQuestions();
+      setQuestions((prev) => prev.filter((q) => q.id !== questionId));
       if (selectedQuestion?.id === questionId) {
         setSelectedQuestion(null);
       }
@@ -113,6 +171,27 @@ const QnA = () => {
     }
   };
 
+  const loadMoreReplies = async () => {
+    const { id: questionId, replies_next_cursor: cursor } = selectedQuestion;
+    try {
+      const response = await api.get(`/questions/${questionId}/replies`, {
+        params: { cursor, limit: 100 },
+      });
+      setSelectedQuestion((prev) => {
+        if (!prev || prev.id !== questionId) return prev;
+        const seen = new Set(prev.replies.map((r) => r.id));
+        return {
+          ...prev,
+          replies: [...prev.replies, ...response.data.replies.filter((r) => !seen.has(r.id))],
+          replies_next_cursor: response.data.next_cursor,
+        };
+      });
+    } catch (error) {
+      console.error("Error loading replies:", error);
+      toast.error("Failed to load more replies");
+    }
+  };
+
   const viewQuestionDetails = async (questionId) => {
     try {
       const response = await api.get(`/questions/${questionId}`);
@@ -158,6 +237,15 @@ const QnA = () => {
             <MessageCircle className="w-5 h-5 mr-2" />
             Ask a Question
           </Button>
+
+          <Input
+            type="text"
+            placeholder="Search questions and answers..."
+            value={searchQuery}
+            onChange={(e) => setSearchQuery(e.target.value)}
+            data-testid="question-search-input"
+            className="mt-6 border-2 rounded-full"
+          />
         </motion.div>
 
         {/* New Question Form */}
@@ -195,6 +283,25 @@ const QnA = () => {
                 />
               </div>
 
+              {similarQuestions.length > 0 && (
+                <div className="bg-muted/30 p-4 rounded-lg border-2 border-border" data-testid="similar-questions">
+                  <p className="text-sm font-bold mb-2">Similar questions already asked</p>
+                  <ul className="space-y-1">
+                    {similarQuestions.map((question) => (
+                      <li key={question.id}>
+                        <button
+                          type="button"
+                          onClick={() => viewQuestionDetails(question.id)}
+                          className="text-sm text-left hover:underline"
+                        >
+                          {question.title} ({question.reply_count} replies)
+                        </button>
+                      </li>
+                    ))}
+                  </ul>
+                </div>
+              )}
+
               <div className="flex items-center gap-3">
                 <Switch
                   id="anonymous"
@@ -268,7 +375,7 @@ const QnA = () => {
             {/* Replies */}
             <div className="border-t-2 border-border pt-6">
               <h3 className="font-syne text-xl font-bold mb-4">
-                Replies ({selectedQuestion.replies.length})
+                Replies ({selectedQuestion.reply_count})
               </h3>
 
               {selectedQuestion.replies.length === 0 ? (
@@ -298,6 +405,16 @@ const QnA = () => {
                       </div>
                     </div>
                   ))}
+                  {selectedQuestion.replies_next_cursor && (
+                    <Button
+                      variant="outline"
+                      onClick={loadMoreReplies}
+                      data-testid="load-more-replies-button"
+                      className="w-full rounded-full border-2 border-border"
+                    >
+                      Load more replies
+                    </Button>
+                  )}
                 </div>
               )}
 
@@ -328,10 +445,10 @@ const QnA = () => {
               <div className="text-center py-12 bg-card rounded-xl border-2 border-border">
                 <MessageSquare className="w-16 h-16 text-muted-foreground mx-auto mb-4" />
                 <h3 className="font-syne text-2xl font-bold mb-2">
-                  No questions yet
+                  {searchQuery ? "No matching questions" : "No questions yet"}
                 </h3>
                 <p className="text-muted-foreground">
-                  Be the first to ask a question!
+                  {searchQuery ? "Try different words, or ask it yourself!" : "Be the first to ask a question!"}
                 </p>
               </div>
             ) : (
@@ -0,0 +1,246 @@
+"""Async load generator for the College Club Compass API.
+
+Runs a weighted mix of realistic scenarios against a local app instance with
+a fixed number of concurrent virtual users and writes a JSON report with
+throughput, p50/p95/p99 latency and error rate per request type, suitable
+for tracking regressions between runs.
+
+Scenarios: signup_login, browse_catalog, quiz_submit, bookmark_churn,
+qna_read, qna_post.
+
+    python load_test.py --base-url http://localhost:8001/api --concurrency 50 --duration 60 --output load_report.json
+    python load_test.py --scenarios browse_catalog=5,quiz_submit=1 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import httpx
+
+DEFAULT_MIX = {
+    "signup_login": 1,
+    "browse_catalog": 6,
+    "quiz_submit": 2,
+    "bookmark_churn": 3,
+    "qna_read": 4,
+    "qna_post": 1,
+}
+
+
+def percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class Recorder:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, name, latency, ok):
+        self.samples[name].append(latency)
+        if not ok:
+            self.errors[name] += 1
+
+    def report(self, elapsed):
+        def summarize(latencies, errors):
+            ordered = sorted(latencies)
+            return {
+                "requests": len(ordered),
+                "errors": errors,
+                "error_rate": round(errors / len(ordered), 4) if ordered else 0.0,
+                "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 2),
+                "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0,
+            }
+
+        all_latencies = [latency for latencies in self.samples.values() for latency in latencies]
+        return {
+            "overall": summarize(all_latencies, sum(self.errors.values())),
+            "requests": {name: summarize(latencies, self.errors[name]) for name, latencies in sorted(self.samples.items())},
+        }
+
+
+class VirtualUser:
+    def __init__(self, client, recorder, rng):
+        self.client = client
+        self.recorder = recorder
+        self.rng = rng
+        self.headers = {}
+        self.etags = {}
+
+    async def request(self, name, method, path, expected=(200,), **kwargs):
+        headers = dict(self.headers)
+        headers.update(kwargs.pop("headers", {}))
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, path, headers=headers, **kwargs)
+            ok = response.status_code in expected
+        except httpx.HTTPError:
+            response, ok = None, False
+        self.recorder.record(name, time.perf_counter() - start, ok)
+        return response
+
+    async def get_cached(self, name, path):
+        # Behaves like a browser cache: revalidate with the last ETag seen
+        headers = {"If-None-Match": self.etags[path]} if path in self.etags else {}
+        response = await self.request(name, "GET", path, expected=(200, 304), headers=headers)
+        if response is not None and response.status_code == 200 and "etag" in response.headers:
+            self.etags[path] = response.headers["etag"]
+        return response
+
+    async def signup(self):
+        email = f"load-{uuid.uuid4().hex[:12]}@example.com"
+        payload = {"name": "Load Tester", "email": email, "password": "loadtest-pass", "role": self.rng.choice(["fresher", "senior"])}
+        response = await self.request("POST /auth/signup", "POST", "/auth/signup", json=payload)
+        if response is not None and response.status_code == 200:
+            self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            self.email = email
+            return True
+        return False
+
+
+class Scenarios:
+    def __init__(self, state):
+        self.state = state
+
+    async def signup_login(self, user):
+        probe = VirtualUser(user.client, user.recorder, user.rng)
+        if await probe.signup():
+            await probe.request("POST /auth/login", "POST", "/auth/login", json={"email": probe.email, "password": "loadtest-pass"})
+            await probe.request("GET /auth/me", "GET", "/auth/me")
+
+    async def browse_catalog(self, user):
+        await user.get_cached("GET /clubs", "/clubs")
+        await user.get_cached("GET /clubs?domain", f"/clubs?domain={user.rng.choice(['Technical', 'Cultural', 'Sports', 'Management', 'Literary', 'Social'])}")
+        if self.state["club_ids"]:
+            await user.get_cached("GET /clubs/{id}", f"/clubs/{user.rng.choice(self.state['club_ids'])}")
+        await user.get_cached("GET /quiz/questions", "/quiz/questions")
+
+    async def quiz_submit(self, user):
+        answers = [{"question_id": q["id"], "answer": user.rng.randrange(len(q["options"]))} for q in self.state["questions"]]
+        await user.request("POST /quiz/submit", "POST", "/quiz/submit", json={"answers": answers})
+        await user.request("GET /quiz/result", "GET", "/quiz/result")
+
+    async def bookmark_churn(self, user):
+        if not self.state["club_ids"]:
+            return
+        club_id = user.rng.choice(self.state["club_ids"])
+        await user.request("POST /bookmarks", "POST", "/bookmarks", expected=(200, 201), json={"club_id": club_id})
+        await user.request("GET /bookmarks", "GET", "/bookmarks")
+        await user.request("DELETE /bookmarks/{id}", "DELETE", f"/bookmarks/{club_id}", expected=(200, 404))
+
+    async def qna_read(self, user):
+        response = await user.request("GET /questions", "GET", "/questions", params={"view": "summary"})
+        questions = response.json() if response is not None and response.status_code == 200 else []
+        if questions:
+            question_id = user.rng.choice(questions)["id"]
+            await user.request("GET /questions/{id}", "GET", f"/questions/{question_id}")
+            await user.request("GET /questions/{id}/replies", "GET", f"/questions/{question_id}/replies")
+
+    async def qna_post(self, user):
+        response = await user.request("POST /questions", "POST", "/questions", json={
+            "title": f"Load test question {uuid.uuid4().hex[:8]}",
+            "description": "Which club is best for someone who likes robotics and debating?",
+            "is_anonymous": user.rng.random() < 0.3,
+        })
+        if response is not None and response.status_code == 200:
+            question_id = response.json()["question_id"]
+            await user.request("POST /questions/{id}/replies", "POST", f"/questions/{question_id}/replies",
+                               json={"content": "Try the robotics club open house!"})
+
+
+def parse_mix(value):
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown scenario: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def run(args):
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        clubs = (await client.get("/clubs")).json()
+        questions = (await client.get("/quiz/questions")).json()["questions"]
+        state = {"club_ids": [club["id"] for club in clubs], "questions": questions}
+        scenarios = Scenarios(state)
+
+        # Each virtual user signs up once and keeps its token for the run
+        users = [VirtualUser(client, Recorder(), random.Random(rng.random())) for _ in range(args.concurrency)]
+        await asyncio.gather(*(user.signup() for user in users))
+        for user in users:
+            user.recorder = recorder
+
+        names, weights = zip(*args.scenarios.items())
+        deadline = time.perf_counter() + args.duration
+        counts = defaultdict(int)
+
+        async def worker(user):
+            while time.perf_counter() < deadline:
+                name = user.rng.choices(names, weights)[0]
+                counts[name] += 1
+                await getattr(scenarios, name)(user)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(user) for user in users))
+        elapsed = time.perf_counter() - start
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "base_url": args.base_url,
+        "concurrency": args.concurrency,
+        "duration_seconds": round(elapsed, 2),
+        "scenario_mix": args.scenarios,
+        "scenario_runs": dict(counts),
+        **recorder.report(elapsed),
+    }
+    return report
+
+
+def print_report(report):
+    print(f"{report['concurrency']} users for {report['duration_seconds']}s against {report['base_url']}")
+    print(f"{'request':<30} {'count':>8} {'rps':>9} {'err%':>7} {'p50':>9} {'p95':>9} {'p99':>9}")
+    rows = list(report["requests"].items()) + [("TOTAL", report["overall"])]
+    for name, stats in rows:
+        print(f"{name:<30} {stats['requests']:>8} {stats['throughput_rps']:>9.1f} {stats['error_rate'] * 100:>6.2f}% "
+              f"{stats['p50_ms']:>8.1f}ms {stats['p95_ms']:>8.1f}ms {stats['p99_ms']:>8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8001/api")
+    parser.add_argument("--concurrency", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to run the mix")
+    parser.add_argument("--scenarios", type=parse_mix, default=dict(DEFAULT_MIX), help="weights, e.g. browse_catalog=5,quiz_submit=1")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.output}")
+    return 0 if report["overall"]["error_rate"] < 0.01 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
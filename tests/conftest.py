@@ -0,0 +1,69 @@
+"""Shared fixtures: the API and its helpers on the in-memory storage backend.
+
+``STORAGE_BACKEND`` is read when storage.py is imported, so it is set here,
+before any backend module loads. No MongoDB server is needed. Counter
+increments stay pending (no background flush) so tests can inspect them,
+and admin endpoints are enabled with a fixed token.
+"""
+import asyncio
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+os.environ["STORAGE_BACKEND"] = "memory"
+os.environ["COUNTER_FLUSH_SECONDS"] = "3600"
+os.environ["ADMIN_TOKEN"] = ADMIN_TOKEN = "test-admin-token"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from memory_store import InMemoryClient  # noqa: E402
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.fixture
+def memory_db():
+    """A fresh, empty in-memory database with the required indexes."""
+    from indexes import ensure_indexes
+
+    db = InMemoryClient()["test"]
+    run(ensure_indexes(db))
+    return db
+
+
+@pytest.fixture(scope="session")
+def api():
+    from fastapi.testclient import TestClient
+
+    import server
+
+    with TestClient(server.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def server_db(api):
+    import server
+
+    return server.db
+
+
+@pytest.fixture
+def admin_headers():
+    return {"X-Admin-Token": ADMIN_TOKEN}
+
+
+@pytest.fixture
+def auth_headers(api):
+    response = api.post("/api/auth/signup", json={
+        "email": f"{uuid.uuid4().hex[:12]}@example.com",
+        "password": "secret123",
+        "name": "Test User",
+        "role": "fresher",
+    })
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,14 @@
+"""Admin endpoints: token checks and parameter validation."""
+import pytest
+
+
+def test_admin_endpoints_need_the_token(api):
+    assert api.get("/api/admin/quiz/rescore").status_code == 403
+    assert api.get("/api/admin/quiz/rescore", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+
+@pytest.mark.parametrize("chunk_size", [0, -5, 10001])
+def test_rescore_rejects_out_of_range_chunk_sizes(api, admin_headers, chunk_size):
+    response = api.post("/api/admin/quiz/rescore", params={"chunk_size": chunk_size}, headers=admin_headers)
+    assert response.status_code == 400
+    assert api.get("/api/admin/quiz/rescore", headers=admin_headers).json()["state"] != "running"
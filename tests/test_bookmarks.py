@@ -0,0 +1,35 @@
+"""Bookmark creation and bulk updates keep the club counters exact."""
+import server
+from counters import BOOKMARK_COUNT
+
+
+def pending_bookmarks(club_id):
+    return server.club_counters._pending.get(club_id, {}).get(BOOKMARK_COUNT, 0)
+
+
+def club_ids(api, count):
+    return [club["id"] for club in api.get("/api/clubs").json()[:count]]
+
+
+def test_create_bookmark_is_201_then_200(api, auth_headers):
+    club_id = club_ids(api, 1)[0]
+    before = pending_bookmarks(club_id)
+
+    first = api.post("/api/bookmarks", json={"club_id": club_id}, headers=auth_headers)
+    second = api.post("/api/bookmarks", json={"club_id": club_id}, headers=auth_headers)
+
+    assert first.status_code == 201 and first.json()["created"] is True
+    assert second.status_code == 200 and second.json()["created"] is False
+    assert pending_bookmarks(club_id) == before + 1
+
+
+def test_bulk_remove_only_counts_bookmarks_it_deleted(api, auth_headers):
+    clubs = club_ids(api, 3)
+    api.post("/api/bookmarks/bulk", json={"add": clubs[:2]}, headers=auth_headers)
+    before = {club_id: pending_bookmarks(club_id) for club_id in clubs}
+
+    # The third club was never bookmarked, as if a concurrent DELETE won
+    result = api.post("/api/bookmarks/bulk", json={"remove": clubs}, headers=auth_headers).json()
+
+    assert result == {"created": 0, "removed": 2}
+    assert [pending_bookmarks(c) - before[c] for c in clubs] == [-1, -1, 0]
@@ -0,0 +1,76 @@
+"""TTLCache expiry and invalidation, and the verified-token cache built on it."""
+import cache
+import server
+from cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    entries = TTLCache(ttl=60)
+    entries.set("token", "user")
+
+    clock.now += 59
+    assert entries.get("token") == "user"
+    clock.now += 1
+    assert entries.get("token") is None
+    assert len(entries) == 0
+
+
+def test_per_entry_ttl_never_exceeds_the_cache_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache.time, "monotonic", clock)
+    entries = TTLCache(ttl=60)
+    entries.set("short", 1, ttl=5)
+    entries.set("long", 2, ttl=3600)
+    entries.set("expired", 3, ttl=-1)
+
+    clock.now += 5
+    assert entries.get("short") is None
+    assert entries.get("expired") is None
+    clock.now += 54
+    assert entries.get("long") == 2
+    clock.now += 1
+    assert entries.get("long") is None
+
+
+def test_invalidate_tag_drops_every_entry_of_that_tag():
+    entries = TTLCache()
+    entries.set("token-1", "a", tag="user-a")
+    entries.set("token-2", "a", tag="user-a")
+    entries.set("token-3", "b", tag="user-b")
+
+    entries.invalidate_tag("user-a")
+
+    assert entries.get("token-1") is None and entries.get("token-2") is None
+    assert entries.get("token-3") == "b"
+    assert entries.stats()["invalidations"] == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    entries = TTLCache(max_size=2)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    entries.get("a")
+    entries.set("c", 3)
+    assert entries.get("b") is None and entries.get("a") == 1
+    assert entries.stats()["evictions"] == 1
+
+
+def test_user_update_is_seen_after_invalidation(api, server_db, auth_headers):
+    me = api.get("/api/auth/me", headers=auth_headers).json()
+    api.portal.call(server_db.users.update_one, {"id": me["id"]}, {"$set": {"verified": True}})
+
+    # Still served from the verified-token cache
+    assert api.get("/api/auth/me", headers=auth_headers).json()["verified"] is False
+
+    server.invalidate_cached_user(me["id"])
+    assert api.get("/api/auth/me", headers=auth_headers).json()["verified"] is True
@@ -0,0 +1,82 @@
+"""Club search: ranking, prefix matching, facets and incremental updates."""
+import pytest
+
+from club_search import ClubSearchIndex, time_commitment_bucket
+
+
+def club(club_id, name, description="", domain="Technical", status="Open", hours="2-4 hours/week", skills=(), tags=()):
+    return {"id": club_id, "name": name, "description": description, "domain": domain, "recruitment_status": status,
+            "time_commitment": hours, "skills": list(skills), "tags": list(tags)}
+
+
+CLUBS = [
+    club("robots", "RoboMinds", "Build robots and compete", skills=["Arduino", "Python"]),
+    club("code", "CodeCraft", "Competitive programming and robots on weekends", skills=["Python"], hours="6-8 hours/week"),
+    club("music", "Harmony", "Choir and band", domain="Cultural", status="Closed", tags=["music"]),
+    club("debate", "Debate Society", "Debate and public speaking", domain="Literary", hours="10-12 hours/week"),
+]
+
+
+@pytest.fixture
+def index():
+    index = ClubSearchIndex()
+    index.update(CLUBS)
+    return index
+
+
+def test_name_hits_outrank_description_hits(index):
+    # "robo" matches RoboMinds by name and CodeCraft only by its description
+    assert index.search("robo").club_ids == ["robots", "code"]
+    # Equal scores fall back to name order
+    assert index.search("robots").club_ids == ["code", "robots"]
+
+
+def test_every_term_must_match_and_the_last_is_a_prefix(index):
+    assert index.search("python rob").club_ids == ["robots", "code"]
+    assert index.search("python choir").club_ids == []
+    assert index.search("harm").club_ids == ["music"]
+    assert index.search("harm", prefix=False).club_ids == []
+
+
+def test_empty_query_lists_every_club_by_name(index):
+    assert index.search("").club_ids == ["code", "debate", "music", "robots"]
+
+
+def test_facet_counts_ignore_their_own_filter(index):
+    result = index.search("", {"domain": "Technical"})
+    assert result.total == 2
+    assert result.facets["domain"] == {"Cultural": 1, "Literary": 1, "Technical": 2}
+    assert result.facets["time_commitment"] == {"light": 1, "moderate": 1}
+    assert result.facets["recruitment_status"] == {"Open": 2}
+
+
+def test_paging_splits_the_ranking(index):
+    first, second = index.search("", offset=0, limit=3), index.search("", offset=3, limit=3)
+    assert first.club_ids + second.club_ids == index.search("").club_ids
+    assert second.total == 4
+
+
+def test_update_reindexes_only_changed_clubs(index):
+    changed = [dict(c, bookmark_count=7) for c in CLUBS[:3]] + [dict(CLUBS[3], name="Oratory")]
+    assert index.update(changed) == {"added": 0, "changed": 1, "removed": 0}
+    assert index.search("oratory").club_ids == ["debate"]
+    assert index.search("society").club_ids == []
+
+    assert index.update(changed[1:]) == {"added": 0, "changed": 0, "removed": 1}
+    assert index.search("arduino").club_ids == []
+    assert len(index) == 3
+
+
+@pytest.mark.parametrize("value, bucket", [("2-4 hours/week", "light"), ("6-8 hours", "moderate"),
+                                           ("10-15 hours/week", "intensive"), ("3 hours", "light"), ("flexible", "unknown")])
+def test_time_commitment_buckets(value, bucket):
+    assert time_commitment_bucket(value) == bucket
+
+
+def test_search_endpoint_returns_clubs_and_facets(api):
+    body = api.get("/api/clubs/search", params={"q": "", "limit": 2}).json()
+    assert body["limit"] == 2 and len(body["clubs"]) == 2
+    assert body["total"] == sum(body["facets"]["domain"].values())
+    domain = next(iter(body["facets"]["domain"]))
+    filtered = api.get("/api/clubs/search", params={"domain": domain}).json()
+    assert {c["domain"] for c in filtered["clubs"]} == {domain}
@@ -0,0 +1,89 @@
+"""CounterBuffer flush retries and the reconcile job."""
+import pytest
+from pymongo.errors import BulkWriteError
+
+from counters import BOOKMARK_COUNT, INTEREST_COUNT, CounterBuffer, reconcile_club_counters
+from tests.conftest import run
+
+
+class FailingCollection:
+    """Rejects the update at each given batch index, applies the rest."""
+
+    def __init__(self, failing_indexes=(), error=None):
+        self.failing_indexes = set(failing_indexes)
+        self.error = error
+        self.applied = []
+
+    async def bulk_write(self, operations, ordered=True):
+        if self.error:
+            raise self.error
+        errors = []
+        for index, op in enumerate(operations):
+            if index in self.failing_indexes:
+                errors.append({"index": index, "code": 2, "errmsg": "rejected"})
+            else:
+                self.applied.append((op._filter["id"], op._doc["$inc"]))
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "writeConcernErrors": [], "nModified": len(self.applied)})
+
+
+def pending(buffer):
+    return {key: dict(deltas) for key, deltas in buffer._pending.items()}
+
+
+def test_partial_failure_requeues_only_the_failed_updates():
+    collection = FailingCollection(failing_indexes={1})
+    buffer = CounterBuffer(collection)
+    for club_id in ("a", "b", "c"):
+        buffer.incr(club_id, BOOKMARK_COUNT, 2)
+
+    with pytest.raises(BulkWriteError):
+        run(buffer.flush())
+
+    assert [key for key, _ in collection.applied] == ["a", "c"]
+    assert pending(buffer) == {"b": {BOOKMARK_COUNT: 2}}
+
+
+def test_other_errors_requeue_everything():
+    buffer = CounterBuffer(FailingCollection(error=ConnectionError("down")))
+    buffer.incr("a", BOOKMARK_COUNT)
+    buffer.incr("b", BOOKMARK_COUNT, -1)
+
+    with pytest.raises(ConnectionError):
+        run(buffer.flush())
+
+    assert pending(buffer) == {"a": {BOOKMARK_COUNT: 1}, "b": {BOOKMARK_COUNT: -1}}
+
+
+def test_reconcile_reports_updated_and_reset_clubs_apart(memory_db):
+    run(memory_db.clubs.insert_many([
+        {"id": club_id, BOOKMARK_COUNT: 5, INTEREST_COUNT: 0} for club_id in ("a", "b", "c")
+    ]))
+    run(memory_db.bookmarks.insert_many([
+        {"id": f"bm-{i}", "user_id": f"user-{i}", "club_id": "a"} for i in range(2)
+    ]))
+
+    stats = run(reconcile_club_counters(memory_db))
+
+    assert stats == {"clubs_updated": 1, "clubs_reset": 2, "bookmarked_clubs": 1, "recommended_clubs": 0}
+    counts = {club["id"]: club[BOOKMARK_COUNT] for club in run(memory_db.clubs.find({}).to_list(None))}
+    assert counts == {"a": 2, "b": 0, "c": 0}
+
+
+def test_reconcile_drops_increments_buffered_during_the_recount():
+    collection = FailingCollection()
+    buffer = CounterBuffer(collection)
+    buffer.incr("a", BOOKMARK_COUNT)
+
+    async def recount():
+        # Flushed before the recount starts, so the recount sees it
+        assert collection.applied == [("a", {BOOKMARK_COUNT: 1})]
+        # A bookmark made mid-recount, which the new totals may already include
+        buffer.incr("b", BOOKMARK_COUNT)
+        return {"clubs_updated": 2}
+
+    stats = run(buffer.reconcile(recount))
+
+    assert stats == {"clubs_updated": 2, "dropped_pending_keys": 1}
+    assert pending(buffer) == {}
+    assert run(buffer.flush()) == 0
@@ -0,0 +1,148 @@
+"""Q&A event fan-out and the change stream source."""
+import asyncio
+
+import pytest
+from pymongo.errors import OperationFailure
+
+import server
+from events import FEED_TOPIC, ChangeStreamSource, EventBroker, TooManySubscribers, question_topic, sse_stream
+
+
+def publish(broker, count, topic=FEED_TOPIC):
+    return [broker.publish("question_created", {"n": i}, [topic]) for i in range(count)]
+
+
+async def read_stream(stream, frames):
+    """The first ``frames`` SSE frames of ``stream``, decoded."""
+    return [(await stream.__anext__()).decode() for _ in range(frames)]
+
+
+def test_events_reach_only_subscribers_of_their_topic():
+    broker = EventBroker()
+
+    async def scenario():
+        feed, thread = broker.subscribe([FEED_TOPIC]), broker.subscribe([question_topic("q")])
+        [event] = publish(broker, 1)
+        return await feed.next(timeout=1), await thread.next(timeout=0.01), event
+
+    received, nothing, event = asyncio.run(scenario())
+    assert received is event and nothing is None
+
+
+def test_overflowing_subscriber_is_dropped():
+    broker = EventBroker(queue_size=2)
+
+    async def scenario():
+        slow = broker.subscribe([FEED_TOPIC])
+        publish(broker, 3)
+        with pytest.raises(ConnectionAbortedError):
+            await slow.next(timeout=1)
+
+    asyncio.run(scenario())
+    assert broker.stats()["subscribers"] == 0
+    assert broker.stats()["dropped_slow_subscribers"] == 1 and broker.stats()["delivered"] == 2
+
+
+def test_last_event_id_replays_missed_events():
+    broker = EventBroker()
+    events = publish(broker, 4)
+    publish(broker, 1, topic=question_topic("q"))
+
+    async def scenario():
+        stream = sse_stream(broker.subscribe([FEED_TOPIC]), heartbeat=60, last_event_id=events[1].id)
+        frames = await read_stream(stream, 3)
+        await stream.aclose()
+        return frames
+
+    retry, *replayed = asyncio.run(scenario())
+    assert retry.startswith("retry:")
+    assert replayed == [events[2].encode().decode(), events[3].encode().decode()]
+    assert broker.stats()["subscribers"] == 0
+
+
+@pytest.mark.parametrize("last_event_id", ["someone-else-3", "garbage"])
+def test_unknown_last_event_id_gets_a_reset(last_event_id):
+    broker = EventBroker()
+    publish(broker, 1)
+
+    async def scenario():
+        stream = sse_stream(broker.subscribe([FEED_TOPIC]), heartbeat=60, last_event_id=last_event_id)
+        frames = await read_stream(stream, 2)
+        await stream.aclose()
+        return frames
+
+    assert asyncio.run(scenario())[1] == "event: reset\ndata: {}\n\n"
+
+
+def test_events_evicted_from_the_replay_buffer_get_a_reset():
+    broker = EventBroker(replay_size=2)
+    events = publish(broker, 4)
+    assert broker.replay_after(events[0].id, {FEED_TOPIC}) is None
+    assert [e.id for e in broker.replay_after(events[1].id, {FEED_TOPIC})] == [events[2].id, events[3].id]
+
+
+def test_subscriber_cap_is_enforced():
+    broker = EventBroker(max_subscribers=1)
+    broker.subscribe([FEED_TOPIC])
+    with pytest.raises(TooManySubscribers):
+        broker.subscribe([FEED_TOPIC])
+    assert broker.stats()["rejected_subscribers"] == 1
+
+
+def test_stream_endpoint_returns_503_at_the_subscriber_cap(api, monkeypatch):
+    monkeypatch.setattr(server, "event_broker", EventBroker(max_subscribers=0))
+    response = api.get("/api/questions/stream")
+    assert response.status_code == 503 and response.headers["Retry-After"] == "10"
+
+
+class FakeStream:
+    def __init__(self, changes):
+        self.changes = changes
+        self.resume_token = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def __aiter__(self):
+        for change in self.changes:
+            yield change
+        await asyncio.Event().wait()
+
+
+class PreMongo6Collection:
+    """A collection whose server does not know fullDocumentBeforeChange."""
+
+    def __init__(self, changes):
+        self.changes = changes
+        self.watch_options = []
+
+    def watch(self, pipeline, **options):
+        self.watch_options.append(options)
+        if "full_document_before_change" in options:
+            raise OperationFailure("BSON field '$changeStream.fullDocumentBeforeChange' is an unknown field.", 40415)
+        return FakeStream(self.changes)
+
+
+def test_change_stream_falls_back_without_pre_images(caplog):
+    questions = PreMongo6Collection([{"operationType": "insert", "fullDocument": {"id": "q-1", "title": "t"}}])
+    db = {"questions": questions, "replies": PreMongo6Collection([])}
+    broker = EventBroker()
+    feed = broker.subscribe([FEED_TOPIC])
+
+    async def scenario():
+        source = ChangeStreamSource(db, broker, summarize=lambda doc: {"id": doc["id"]}, retry_delay=60)
+        source.start()
+        event = await feed.next(timeout=1)
+        await source.stop()
+        return event
+
+    event = asyncio.run(scenario())
+
+    assert (event.type, event.data) == ("question_created", {"id": "q-1"})
+    assert questions.watch_options[0]["full_document_before_change"] == "whenAvailable"
+    assert all("full_document_before_change" not in options for options in questions.watch_options[1:])
+    # One warning per watched collection, not one per retry
+    assert sum("rejected pre-images" in record.getMessage() for record in caplog.records) == 2
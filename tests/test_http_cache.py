@@ -0,0 +1,41 @@
+"""ETag revalidation of the pre-serialized catalog responses."""
+import pytest
+
+from http_cache import PrecomputedJSON, etag_matches
+
+
+@pytest.mark.parametrize("if_none_match, matches", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"other", "abc"', True),
+    ("*", True),
+    ('"other"', False),
+])
+def test_if_none_match_uses_weak_comparison(if_none_match, matches):
+    assert etag_matches(if_none_match, '"abc"') is matches
+
+
+def test_etag_follows_the_body():
+    assert PrecomputedJSON({"a": 1}).etag == PrecomputedJSON({"a": 1}).etag
+    assert PrecomputedJSON({"a": 1}).etag != PrecomputedJSON({"a": 2}).etag
+
+
+def test_if_none_match_returns_304_until_the_catalog_changes(api, server_db, admin_headers):
+    first = api.get("/api/clubs")
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"].startswith("public, max-age=")
+
+    revalidated = api.get("/api/clubs", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+    club = first.json()[0]
+    api.portal.call(server_db.clubs.update_one, {"id": club["id"]}, {"$set": {"description": club["description"] + "!"}})
+    assert api.post("/api/admin/catalog/reload", headers=admin_headers).json()["changed"] is True
+
+    changed = api.get("/api/clubs", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+    single = api.get(f"/api/clubs/{club['id']}")
+    assert single.json()["description"] == club["description"] + "!"
+    assert api.get(f"/api/clubs/{club['id']}", headers={"If-None-Match": single.headers["ETag"]}).status_code == 304
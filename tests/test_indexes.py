@@ -0,0 +1,46 @@
+"""Index bootstrap and the health report behind /api/diagnostics/indexes."""
+from indexes import REQUIRED_INDEXES, ensure_indexes, index_health
+from memory_store import InMemoryClient
+from tests.conftest import run
+
+
+def required_names(collection):
+    return [model.document["name"] for model in REQUIRED_INDEXES[collection]]
+
+
+def test_fresh_database_reports_every_index_missing():
+    health = run(index_health(InMemoryClient()["fresh"]))
+    assert health["healthy"] is False
+    assert {name: entry["missing"] for name, entry in health["collections"].items()} == {
+        name: required_names(name) for name in REQUIRED_INDEXES
+    }
+
+
+def test_bootstrap_creates_the_expected_indexes_once():
+    db = InMemoryClient()["fresh"]
+    report = run(ensure_indexes(db))
+    assert {name: entry["created"] for name, entry in report.items()} == {name: required_names(name) for name in REQUIRED_INDEXES}
+
+    health = run(index_health(db))
+    assert health["healthy"] is True
+    for name, entry in health["collections"].items():
+        assert entry["missing"] == [] and set(required_names(name)) <= set(entry["present"])
+
+    assert all(entry == {"created": [], "failed": []} for entry in run(ensure_indexes(db)).values())
+
+
+def test_unique_index_over_duplicates_is_reported_not_fatal():
+    db = InMemoryClient()["fresh"]
+    run(db.users.insert_many([{"id": "u", "email": "a@example.com"}, {"id": "u", "email": "b@example.com"}]))
+
+    report = run(ensure_indexes(db))
+
+    assert report["users"] == {"created": ["email_unique"], "failed": ["id_unique"]}
+    assert report["clubs"]["created"] == required_names("clubs")
+    health = run(index_health(db))
+    assert health["healthy"] is False and health["collections"]["users"]["missing"] == ["id_unique"]
+
+
+def test_diagnostics_endpoint_reports_healthy_indexes(api, admin_headers):
+    assert api.get("/api/diagnostics/indexes").status_code == 403
+    assert api.get("/api/diagnostics/indexes", headers=admin_headers).json()["healthy"] is True
@@ -0,0 +1,58 @@
+"""Conditional upserts into ``latest_quiz_results``: an older result never
+replaces a newer one, whether written by a submission or the backfill."""
+from datetime import datetime, timedelta, timezone
+
+from latest_quiz_results import backfill_latest_quiz_results, record_latest_result
+from tests.conftest import run
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def response(response_id, created_at, user_id="user-1"):
+    return {
+        "id": response_id,
+        "user_id": user_id,
+        "created_at": created_at,
+        "personality_type": f"type of {response_id}",
+        "personality_description": "d",
+        "recommendations": [],
+    }
+
+
+def latest(db, user_id="user-1"):
+    return run(db.latest_quiz_results.find_one({"user_id": user_id}))
+
+
+def test_newer_result_replaces_older(memory_db):
+    assert run(record_latest_result(memory_db, response("first", NOW)))
+    assert run(record_latest_result(memory_db, response("second", NOW + timedelta(minutes=1))))
+    assert latest(memory_db)["response_id"] == "second"
+    assert run(memory_db.latest_quiz_results.count_documents({})) == 1
+
+
+def test_older_result_is_refused(memory_db):
+    run(record_latest_result(memory_db, response("newer", NOW)))
+    assert not run(record_latest_result(memory_db, response("older", NOW - timedelta(minutes=1))))
+    assert latest(memory_db)["response_id"] == "newer"
+
+
+def test_legacy_string_result_counts_as_older(memory_db):
+    run(record_latest_result(memory_db, response("legacy", "2026-03-02T00:00:00.000000+00:00")))
+    assert run(record_latest_result(memory_db, response("native", NOW)))
+    assert latest(memory_db)["response_id"] == "native"
+
+
+def test_backfill_keeps_newest_per_user_and_reruns_cleanly(memory_db):
+    run(memory_db.quiz_responses.insert_many([
+        response("a-old", NOW, "a"), response("a-new", NOW + timedelta(hours=1), "a"), response("b-only", NOW, "b"),
+    ]))
+    # A submission that landed after the history was read must survive
+    run(record_latest_result(memory_db, response("a-live", NOW + timedelta(hours=2), "a")))
+
+    stats = run(backfill_latest_quiz_results(memory_db, batch_size=1))
+    assert stats["users"] == 2 and stats["kept_newer"] == 1
+    assert latest(memory_db, "a")["response_id"] == "a-live"
+    assert latest(memory_db, "b")["response_id"] == "b-only"
+
+    run(backfill_latest_quiz_results(memory_db))
+    assert run(memory_db.latest_quiz_results.count_documents({})) == 2
@@ -0,0 +1,27 @@
+"""The in-memory backend answers like MongoDB where the app depends on it."""
+from memory_store import InMemoryClient
+from tests.conftest import run
+
+THREAD = {"id": "q", "title": "t", "replies": [{"content": "a", "user": "u1"}, {"user": "u2"}, {"content": "c"}]}
+
+
+def find_one(projection):
+    collection = InMemoryClient()["test"].questions
+    run(collection.insert_one(dict(THREAD)))
+    return run(collection.find_one({}, projection))
+
+
+def test_dotted_projection_keeps_array_subdocuments():
+    assert find_one({"_id": 0, "id": 1, "replies.content": 1}) == {
+        "id": "q", "replies": [{"content": "a"}, {}, {"content": "c"}],
+    }
+
+
+def test_dotted_projections_of_one_array_are_merged():
+    assert find_one({"_id": 0, "replies.content": 1, "replies.user": 1}) == {
+        "replies": [{"content": "a", "user": "u1"}, {"user": "u2"}, {"content": "c"}],
+    }
+
+
+def test_dotted_projection_of_a_missing_field_is_omitted():
+    assert find_one({"_id": 0, "id": 1, "meta.views": 1}) == {"id": "q"}
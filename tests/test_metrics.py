@@ -0,0 +1,55 @@
+"""Prometheus text exposition and the per-route request metrics."""
+import re
+
+from metrics import MetricsRegistry
+
+
+def sample(text, name, **labels):
+    """The value of one exposition line, or None if it is absent."""
+    label_text = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    pattern = re.escape(f"{name}{{{label_text}}}" if labels else name) + r" (\S+)$"
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else None
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.observe(value, route="/x")
+
+    text = registry.render()
+
+    assert "# TYPE latency_seconds histogram" in text
+    assert sample(text, "latency_seconds_bucket", route="/x", le="0.1") == 2
+    assert sample(text, "latency_seconds_bucket", route="/x", le="1.0") == 3
+    assert sample(text, "latency_seconds_bucket", route="/x", le="+Inf") == 4
+    assert sample(text, "latency_seconds_count", route="/x") == 4
+    assert sample(text, "latency_seconds_sum", route="/x") == 3.65
+
+
+def test_label_values_are_escaped_and_collectors_rendered():
+    registry = MetricsRegistry()
+    registry.counter("events_total", "Events.", ("name",)).inc(2, name='say "hi"\n')
+    registry.register_collector(lambda: [("pool_size", "gauge", "Pool size.", [({}, 4)])])
+
+    text = registry.render()
+
+    assert 'events_total{name="say \\"hi\\"\\n"} 2' in text
+    assert "# TYPE pool_size gauge\npool_size 4" in text
+
+
+def test_requests_are_labelled_by_route_template(api):
+    club_id = api.get("/api/clubs").json()[0]["id"]
+    labels = {"method": "GET", "route": "/api/clubs/{club_id}", "status": "200"}
+    before = sample(api.get("/metrics").text, "http_requests_total", **labels) or 0
+
+    api.get(f"/api/clubs/{club_id}")
+    api.get("/api/no-such-route")
+
+    text = api.get("/metrics").text
+    assert sample(text, "http_requests_total", **labels) == before + 1
+    assert club_id not in text
+    assert sample(text, "http_requests_total", method="GET", route="unmatched", status="404") >= 1
+    assert 'route="/metrics"' not in text
+    assert sample(text, "http_request_duration_seconds_count", method="GET", route="/api/clubs/{club_id}") >= 1
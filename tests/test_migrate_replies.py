@@ -0,0 +1,42 @@
+"""migrate_replies.py moves embedded replies out exactly once."""
+from migrate_replies import migrate_replies
+from tests.conftest import run
+
+
+def embedded_question(question_id, replies, reply_count=0):
+    return {
+        "id": question_id, "title": "t", "description": "d", "user_id": "u", "user_name": "U",
+        "user_role": "fresher", "is_anonymous": False, "reply_count": reply_count,
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "replies": [
+            {"id": f"{question_id}-r{i}", "content": f"reply {i}", "user_id": "u", "user_name": "U",
+             "user_role": "senior", "user_verified": True, "created_at": f"2025-01-01T00:0{i}:00+00:00"}
+            for i in range(replies)
+        ],
+    }
+
+
+def test_migration_is_idempotent(memory_db):
+    run(memory_db.questions.insert_many([embedded_question("q1", 3), embedded_question("q2", 2, reply_count=1)]))
+
+    first = run(migrate_replies(memory_db))
+    second = run(migrate_replies(memory_db))
+
+    assert (first["questions"], first["replies"]) == (2, 5)
+    assert (second["questions"], second["replies"]) == (0, 0)
+    assert run(memory_db.replies.count_documents({})) == 5
+    questions = {q["id"]: q for q in run(memory_db.questions.find({}, {"_id": 0}).to_list(None))}
+    assert "replies" not in questions["q1"] and "replies" not in questions["q2"]
+    assert (questions["q1"]["reply_count"], questions["q2"]["reply_count"]) == (3, 3)
+
+
+def test_interrupted_migration_does_not_duplicate_replies(memory_db):
+    question = embedded_question("q1", 3)
+    run(memory_db.questions.insert_one(question))
+    # A previous run copied one reply and stopped before updating the question
+    run(memory_db.replies.insert_one(dict(question["replies"][0], question_id="q1")))
+
+    run(migrate_replies(memory_db))
+
+    assert run(memory_db.replies.count_documents({"question_id": "q1"})) == 3
+    assert run(memory_db.questions.find_one({"id": "q1"}))["reply_count"] == 3
@@ -0,0 +1,99 @@
+"""Keyset pagination, including pages that cross from ISO-string to native
+``created_at`` values while migrate_timestamps.py is running."""
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from migrate_timestamps import migrate_collection
+from pagination import decode_cursor, encode_cursor
+
+LEGACY_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def walk(api, path, page_size=2, **params):
+    """Every item of a paginated listing, following the cursor to the end."""
+    items, cursor = [], None
+    while True:
+        response = api.get(path, params=dict(params, limit=page_size, **({"cursor": cursor} if cursor else {})))
+        assert response.status_code == 200, response.text
+        body = response.json()
+        if isinstance(body, dict):
+            items += body["replies"]
+            cursor = body["next_cursor"]
+        else:
+            items += body
+            cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items
+
+
+@pytest.fixture
+def mixed_thread(api, server_db, auth_headers):
+    """A question with legacy string-timestamped replies followed by new ones."""
+    question_id = api.post("/api/questions", json={"title": "Mixed thread", "description": "d"},
+                           headers=auth_headers).json()["question_id"]
+    legacy = [
+        {"id": f"legacy-{uuid.uuid4()}", "question_id": question_id, "content": f"legacy {i}",
+         "user_id": "u", "user_name": "U", "user_role": "senior", "user_verified": True,
+         "created_at": (LEGACY_EPOCH + timedelta(minutes=i)).isoformat()}
+        for i in range(5)
+    ]
+    api.portal.call(server_db.replies.insert_many, legacy)
+    for i in range(3):
+        api.post(f"/api/questions/{question_id}/replies", json={"content": f"new {i}"}, headers=auth_headers)
+    return question_id
+
+
+def test_reply_pages_cross_the_string_date_boundary(api, server_db, mixed_thread):
+    path = f"/api/questions/{mixed_thread}/replies"
+
+    def contents():
+        replies = [r["content"] for r in walk(api, path)]
+        # New replies may share a millisecond, and ties are ordered by id
+        return replies[:5] + sorted(replies[5:])
+
+    expected = [f"legacy {i}" for i in range(5)] + [f"new {i}" for i in range(3)]
+    assert contents() == expected
+
+    # Part way through the migration: newest strings converted first
+    api.portal.call(lambda: migrate_collection(server_db.replies, batch_size=2))
+    assert contents() == expected
+    assert api.portal.call(server_db.replies.count_documents, {"created_at": {"$type": "string"}}) == 0
+
+
+def test_question_feed_crosses_the_string_date_boundary(api, server_db, auth_headers):
+    marker = uuid.uuid4().hex[:8]
+    legacy = [
+        {"id": f"legacy-{marker}-{i}", "title": f"{marker} legacy {i}", "description": "d", "user_id": "u",
+         "user_name": "U", "user_role": "fresher", "is_anonymous": False, "reply_count": 0,
+         "created_at": (LEGACY_EPOCH + timedelta(hours=i)).isoformat()}
+        for i in range(3)
+    ]
+    api.portal.call(server_db.questions.insert_many, legacy)
+    for i in range(2):
+        api.post("/api/questions", json={"title": f"{marker} new {i}", "description": "d"}, headers=auth_headers)
+
+    titles = [q["title"] for q in walk(api, "/api/questions", view="summary") if q["title"].startswith(marker)]
+    # Both new questions may share a millisecond, and ties are ordered by id
+    assert sorted(titles[:2]) == [f"{marker} new 0", f"{marker} new 1"]
+    assert titles[2:] == [f"{marker} legacy 2", f"{marker} legacy 1", f"{marker} legacy 0"]
+
+
+def test_dates_round_trip_through_cursors():
+    moment = datetime(2026, 1, 2, 3, 4, 5, 6000, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor(moment, "id-1"), 2) == (moment, "id-1")
+
+
+@pytest.mark.parametrize("values", [[{"$ne": None}, "x"], [["a"], "x"], [True, "x"], ["a"]])
+def test_malformed_cursors_are_rejected(values):
+    cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2)
+
+
+def test_injected_cursor_is_a_bad_request(api, mixed_thread):
+    cursor = base64.urlsafe_b64encode(json.dumps([{"$ne": None}, "x"]).encode()).decode().rstrip("=")
+    assert api.get(f"/api/questions/{mixed_thread}/replies", params={"cursor": cursor}).status_code == 400
@@ -0,0 +1,58 @@
+"""The bounded password hashing pool and how the API sheds its overload."""
+import asyncio
+import threading
+import uuid
+
+import pytest
+
+import server
+from password_hashing import PasswordHasher, PasswordHasherOverloaded
+
+
+def test_hash_and_verify_round_trip():
+    hasher = PasswordHasher(max_workers=1)
+    try:
+        hashed = asyncio.run(hasher.hash("secret123"))
+        assert asyncio.run(hasher.verify("secret123", hashed))
+        assert not asyncio.run(hasher.verify("wrong", hashed))
+        assert hasher.stats()["completed"] == 3
+    finally:
+        hasher.shutdown()
+
+
+def test_work_beyond_workers_plus_queue_is_rejected():
+    hasher = PasswordHasher(max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        # One job running and one queued fill the pool
+        busy = [asyncio.ensure_future(hasher._run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(PasswordHasherOverloaded):
+            await hasher._run(release.wait)
+        release.set()
+        await asyncio.gather(*busy)
+
+    try:
+        asyncio.run(scenario())
+        assert hasher.stats()["rejected"] == 1 and hasher.stats()["completed"] == 2
+    finally:
+        release.set()
+        hasher.shutdown()
+
+
+class OverloadedHasher:
+    async def hash(self, password):
+        raise PasswordHasherOverloaded("full")
+
+    async def verify(self, plain_password, hashed_password):
+        raise PasswordHasherOverloaded("full")
+
+
+def test_overloaded_hasher_returns_503(api, monkeypatch):
+    monkeypatch.setattr(server, "password_hasher", OverloadedHasher())
+    response = api.post("/api/auth/signup", json={
+        "email": f"{uuid.uuid4().hex[:12]}@example.com", "password": "secret123", "name": "Busy", "role": "fresher",
+    })
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,60 @@
+"""Slow-request profiling: what gets captured and where it is written."""
+import json
+import pstats
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from profiling import ProfilingMiddleware
+
+TOKEN = "profile-token"
+
+
+@pytest.fixture
+def make_client(tmp_path):
+    def make(**options):
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        app.add_middleware(ProfilingMiddleware, output_dir=str(tmp_path), admin_token=TOKEN, **options)
+        return TestClient(app)
+
+    return make
+
+
+def captured(tmp_path):
+    return [json.loads(path.read_text()) for path in sorted(tmp_path.glob("*.json"))]
+
+
+def test_profile_header_forces_a_capture(make_client, tmp_path):
+    client = make_client(threshold_ms=10_000)
+    assert client.get("/items/42", headers={"X-Profile": TOKEN}).json() == {"id": "42"}
+
+    [meta] = captured(tmp_path)
+    assert (meta["method"], meta["route"], meta["path"], meta["forced"]) == ("GET", "/items/{item_id}", "/items/42", True)
+    [profile] = tmp_path.glob("*.prof")
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_wrong_token_or_fast_requests_are_not_captured(make_client, tmp_path):
+    client = make_client(threshold_ms=10_000, always=True)
+    client.get("/items/1", headers={"X-Profile": "wrong"})
+    client.get("/items/2")
+    assert captured(tmp_path) == []
+
+
+def test_always_on_keeps_requests_over_the_threshold(make_client, tmp_path):
+    client = make_client(threshold_ms=0, always=True)
+    client.get("/items/1")
+    [meta] = captured(tmp_path)
+    assert meta["forced"] is False and meta["duration_ms"] >= meta["threshold_ms"] == 0
+
+
+def test_sample_rate_zero_profiles_nothing(make_client, tmp_path):
+    client = make_client(threshold_ms=0, always=True, sample_rate=0.0)
+    client.get("/items/1")
+    assert captured(tmp_path) == []
@@ -0,0 +1,74 @@
+"""Local question search: plural folding, ranking and index maintenance."""
+import uuid
+
+import pytest
+
+from question_search import LocalQuestionSearch, similar_query, strong_hits, tokenize
+from tests.conftest import run
+
+
+@pytest.mark.parametrize("text, tokens", [
+    ("Which clubs are fun?", ["club", "fun"]),
+    ("Societies and activities", ["society", "activity"]),
+    ("class status bus", ["class", "status", "bus"]),
+    ("joining", ["joining"]),
+])
+def test_tokenize_folds_plurals_only(text, tokens):
+    assert tokenize(text) == tokens
+
+
+@pytest.fixture
+def search(memory_db):
+    index = LocalQuestionSearch(memory_db)
+    index.question_added({"id": "q-title", "title": "Robotics club timings", "description": "When do they meet?"})
+    index.question_added({"id": "q-body", "title": "Weekend plans", "description": "Is the robotics club open on weekends?"})
+    index.question_added({"id": "q-other", "title": "Music auditions", "description": "How do auditions work?"})
+    return index
+
+
+def test_title_matches_rank_above_description_matches(search):
+    assert [qid for _, qid in run(search.search("robotics"))] == ["q-title", "q-body"]
+
+
+def test_plural_queries_find_singular_text(search):
+    assert {qid for _, qid in run(search.search("clubs"))} == {"q-title", "q-body"}
+    assert run(search.search("the of and")) == []
+
+
+def test_rare_terms_weigh_more(search):
+    # "weekend" is only in q-body, "robotics" is in two questions
+    assert run(search.search("robotics weekend"))[0][1] == "q-body"
+
+
+def test_replies_and_removals_update_the_index(search):
+    search.reply_added("q-other", "Bring sheet music for the violin")
+    assert [qid for _, qid in run(search.search("violin"))] == ["q-other"]
+
+    search.question_removed("q-other")
+    assert run(search.search("violin")) == [] and len(search) == 2
+    # Replies to a removed question are ignored
+    search.reply_added("q-other", "violin")
+    assert run(search.search("violin")) == []
+
+
+def test_start_indexes_embedded_and_collection_replies(memory_db):
+    run(memory_db.questions.insert_one({"id": "q", "title": "Hostel", "description": "d", "replies": [{"content": "curfew"}]}))
+    run(memory_db.replies.insert_one({"id": "r", "question_id": "q", "content": "laundry"}))
+    index = LocalQuestionSearch(memory_db)
+    run(index.start())
+    assert run(index.search("curfew")) and run(index.search("laundry"))
+
+
+def test_similar_queries_keep_only_strong_hits():
+    assert similar_query("Robotics clubs", "any advice?") == "robotic club robotic club advice"
+    hits = [(10.0, "a"), (4.0, "b"), (2.0, "c")]
+    assert strong_hits(hits, 5) == [(10.0, "a"), (4.0, "b")]
+    assert strong_hits(hits, 1) == [(10.0, "a")]
+
+
+def test_search_endpoint_finds_new_questions(api, auth_headers):
+    marker = f"zq{uuid.uuid4().hex[:8]}"
+    question_id = api.post("/api/questions", json={"title": f"{marker} question", "description": "d"},
+                           headers=auth_headers).json()["question_id"]
+    hits = api.get("/api/questions/search", params={"q": marker}).json()
+    assert [hit["id"] for hit in hits] == [question_id]
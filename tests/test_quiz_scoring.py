@@ -0,0 +1,61 @@
+"""The compiled scoring table scores exactly like the original linear scans."""
+import random
+
+import pytest
+
+from quiz import QUIZ_QUESTIONS, calculate_quiz_result, score_answers
+from server import QuizAnswer
+
+
+def legacy_score_answers(answers):
+    scores = {}
+    for answer in answers:
+        question = next((q for q in QUIZ_QUESTIONS if q["id"] == answer.question_id), None)
+        if question:
+            selected_option = next((opt for opt in question["options"] if opt["text"] == answer.answer), None)
+            if selected_option:
+                for trait, weight in selected_option["weights"].items():
+                    scores[trait] = scores.get(trait, 0) + weight
+    return scores
+
+
+def random_answers(rng, by_index=False):
+    answers = []
+    for question in QUIZ_QUESTIONS:
+        index = rng.randrange(len(question["options"]))
+        answers.append(QuizAnswer(question_id=question["id"], answer=index if by_index else question["options"][index]["text"]))
+    return answers
+
+
+def test_text_answers_score_like_the_linear_scan():
+    rng = random.Random(7)
+    for _ in range(200):
+        answers = random_answers(rng)
+        assert score_answers(answers) == legacy_score_answers(answers)
+
+
+def test_index_answers_score_like_their_option_text():
+    rng = random.Random(7)
+    for _ in range(50):
+        by_index = random_answers(rng, by_index=True)
+        by_text = [
+            QuizAnswer(question_id=a.question_id, answer=QUIZ_QUESTIONS[a.question_id - 1]["options"][a.answer]["text"])
+            for a in by_index
+        ]
+        assert score_answers(by_index) == score_answers(by_text)
+
+
+@pytest.mark.parametrize("answer", [QuizAnswer(question_id=999, answer="x"), QuizAnswer(question_id=1, answer="no such option"),
+                                    QuizAnswer(question_id=1, answer=99)])
+def test_unknown_questions_and_options_are_ignored(answer):
+    assert score_answers([answer]) == {}
+
+
+def test_all_technical_answers_give_the_tech_personality():
+    answers = [
+        QuizAnswer(question_id=q["id"], answer=max(q["options"], key=lambda o: o["weights"].get("technical", 0))["text"])
+        for q in QUIZ_QUESTIONS
+    ]
+    personality_type, _, scores = calculate_quiz_result(answers)
+    assert personality_type.startswith("Tech Explorer")
+    assert scores == legacy_score_answers(answers)
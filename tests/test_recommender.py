@@ -0,0 +1,82 @@
+"""The vectorized recommender returns what the original per-club loop did."""
+import random
+
+import numpy as np
+import pytest
+
+from recommender import RecommendationEngine, top_k
+
+DOMAINS = ["Technical", "Cultural", "Sports", "Management", "Literary", "Social"]
+TRAITS = ["technical", "creative", "sports", "leadership", "literary", "social", "competitive", "teamwork", "communication"]
+
+
+def legacy_recommendations(clubs, scores):
+    club_matches = []
+    for club in clubs:
+        match_score = 0
+        reasons = []
+        domain_lower = club["domain"].lower()
+        if domain_lower == "technical" and scores.get("technical", 0) > 5:
+            match_score += scores.get("technical", 0) * 10
+            reasons.append("strong technical interest")
+        elif domain_lower == "cultural" and scores.get("creative", 0) > 5:
+            match_score += scores.get("creative", 0) * 10
+            reasons.append("creative mindset")
+        elif domain_lower == "sports" and scores.get("sports", 0) > 5:
+            match_score += scores.get("sports", 0) * 10
+            reasons.append("athletic inclination")
+        elif domain_lower == "management" and scores.get("leadership", 0) > 5:
+            match_score += scores.get("leadership", 0) * 10
+            reasons.append("leadership qualities")
+        elif domain_lower == "literary" and scores.get("literary", 0) > 5:
+            match_score += scores.get("literary", 0) * 10
+            reasons.append("literary interests")
+        elif domain_lower == "social" and scores.get("social", 0) > 5:
+            match_score += scores.get("social", 0) * 10
+            reasons.append("social consciousness")
+        if scores.get("competitive", 0) > 4:
+            match_score += 20
+            reasons.append("competitive spirit")
+        if scores.get("teamwork", 0) > 4:
+            match_score += 15
+            reasons.append("team player")
+        if scores.get("communication", 0) > 4:
+            match_score += 15
+            reasons.append("strong communication skills")
+        club_matches.append({
+            "club_id": club["id"],
+            "club_name": club["name"],
+            "match_percentage": min(int(match_score), 95) + 5,
+            "reason": f"You'd be great here because of your {', '.join(reasons[:2]) if reasons else 'diverse skills'}!",
+            "score": match_score,
+        })
+    club_matches.sort(key=lambda x: x["score"], reverse=True)
+    return [{key: match[key] for key in ("club_id", "club_name", "match_percentage", "reason")} for match in club_matches[:3]]
+
+
+@pytest.fixture
+def clubs():
+    rng = random.Random(3)
+    return [{"id": f"club-{i}", "name": f"Club {i}", "domain": rng.choice(DOMAINS)} for i in range(40)]
+
+
+def test_matches_the_legacy_loop_on_fixed_inputs(clubs):
+    rng = random.Random(11)
+    score_dicts = [{trait: rng.randint(0, 12) for trait in TRAITS if rng.random() < 0.7} for _ in range(300)]
+    score_dicts += [{}, {"technical": 5}, {"technical": 6, "competitive": 5}]
+    engine = RecommendationEngine(clubs)
+
+    expected = [legacy_recommendations(clubs, scores) for scores in score_dicts]
+    assert engine.recommend_many(score_dicts) == expected
+    assert engine.recommend(score_dicts[0]) == expected[0]
+
+
+def test_empty_catalog_recommends_nothing():
+    assert RecommendationEngine([]).recommend({"technical": 10}) == []
+
+
+def test_top_k_is_a_stable_descending_sort():
+    scores = np.array([3.0, 7.0, 7.0, 1.0, 7.0, 3.0])
+    assert top_k(scores, 2).tolist() == [1, 2]
+    assert top_k(scores, 4).tolist() == [1, 2, 4, 0]
+    assert top_k(scores, 10).tolist() == [1, 2, 4, 0, 5, 3]